@@ -0,0 +1,134 @@
+"""
+Counts the WebDriver commands issued by a typical test for each page log level.
+
+No browser is needed: a recording driver answers the commands BasePage sends
+and counts them, so the difference between levels is only the logging overhead
+(current URL / title lookups made for log messages).
+
+Usage (from the project root):
+    python -m benchmarks.logging_overhead
+"""
+import logging
+import os
+import time
+from collections import Counter
+from selenium.webdriver.remote.webelement import WebElement
+from pages.base_page import (BasePage, ELEMENT_SNAPSHOT_SCRIPT, FORM_FILL_SCRIPT,
+                             CACHED_ELEMENT_CHECK_SCRIPT)
+from utils.lazy_logging import get_log_level, QUIET
+from utils.locators.login_page_locators import LoginPageLocators
+from utils.urls import Urls
+
+ITERATIONS = 200
+
+
+class RecordingElement(WebElement):
+    """Element answering every command positively."""
+
+    def is_displayed(self):
+        self.parent.commands["is_displayed"] += 1
+        return True
+
+    def click(self):
+        self.parent.commands["click"] += 1
+
+
+class RecordingDriver:
+    """Minimal driver recording the commands sent by BasePage."""
+
+    def __init__(self):
+        self.commands = Counter()
+        self.url = "about:blank"
+
+    def implicitly_wait(self, _):
+        self.commands["implicitly_wait"] += 1
+
+    def set_page_load_timeout(self, _):
+        self.commands["set_page_load_timeout"] += 1
+
+    def get(self, url):
+        self.commands["get"] += 1
+        self.url = url
+
+    def back(self):
+        self.commands["back"] += 1
+
+    @property
+    def current_url(self):
+        self.commands["current_url"] += 1
+        return self.url
+
+    @property
+    def title(self):
+        self.commands["title"] += 1
+        return "Connexion"
+
+    def find_element(self, by, value):
+        self.commands["find_element"] += 1
+        return RecordingElement(self, value)
+
+    def execute(self, command, params=None):
+        self.commands[command] += 1
+        return {"value": None}
+
+    def execute_async_script(self, script, *args):
+        self.commands["execute_async_script"] += 1
+        return {"url": self.url, "ready": True}
+
+    def execute_script(self, script, *args):
+        self.commands["execute_script"] += 1
+        if script == ELEMENT_SNAPSHOT_SCRIPT:
+            return {"text": "Connexion", "aria_label": "", "value": "", "title": "", "name": "", "id": "",
+                    "placeholder": "", "class": "btn", "visible": True, "enabled": True, "selected": False}
+        if script == FORM_FILL_SCRIPT:
+            return {"ready": True, "names": [field[1] for field in args[0]], "elements": []}
+        if script == CACHED_ELEMENT_CHECK_SCRIPT:
+            return [True, self.url]
+        return None
+
+
+def run_test_scenario(driver, level_name):
+    """Login page flow: open, fill the form, submit, read the message, go back."""
+    page = BasePage(driver)
+    page.logger.setLevel(get_log_level(level_name))
+    page.open_url(Urls.LOGIN)
+    page.fill_form({
+        LoginPageLocators.EMAIL_FIELD: "user@gmail.com",
+        LoginPageLocators.PASSWORD_FIELD: "Abc12?!=",
+    })
+    page.click_element(page.find_element(LoginPageLocators.LOGIN_BUTTON))
+    page.get_text(page.find_element(LoginPageLocators.VALIDATION_MESSAGE))
+    page.navigate_back()
+
+
+def main():
+    # Records are formatted (as the in-memory test log handler does) when they are emitted
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    root_logger.setLevel(logging.DEBUG)
+
+    results = {}
+    for level_name in ("INFO", QUIET):
+        driver = RecordingDriver()
+        start_time = time.perf_counter()
+        for _ in range(ITERATIONS):
+            run_test_scenario(driver, level_name)
+        elapsed = time.perf_counter() - start_time
+        commands = sum(driver.commands.values()) / ITERATIONS
+        lookups = (driver.commands["current_url"] + driver.commands["title"]) / ITERATIONS
+        results[level_name] = (commands, lookups, elapsed / ITERATIONS * 1000)
+
+    root_logger.removeHandler(handler)
+    devnull.close()
+
+    baseline = results["INFO"][0]
+    print(f"{'Level':<10}{'Commands/test':>15}{'URL+title lookups':>20}{'Saved/test':>12}{'Python ms/test':>16}")
+    for level_name, (commands, lookups, ms) in results.items():
+        print(f"{level_name:<10}{commands:>15.1f}{lookups:>20.1f}{baseline - commands:>12.1f}{ms:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Reset email latency benchmark helpers: latency of each mail backend, from the
+forgot password form submission to the reset link handed to the test.
+
+The benchmark runs as a pytest test, once per backend:
+    MAIL_BACKEND=imap pytest --mail-benchmark tests/benchmark_tests
+    MAIL_BACKEND=smtp pytest --mail-benchmark tests/benchmark_tests
+"""
+import json
+import os
+import statistics
+from filelock import FileLock
+from utils.config import BENCHMARK_RESULTS_DIR
+from utils.step_timeline import percentile
+
+RESULTS_PATH = os.path.join(BENCHMARK_RESULTS_DIR, "reset_email_latency.json")
+
+
+def load_latencies() -> dict:
+    """Stored latencies: {backend: [seconds, ...]}."""
+    if not os.path.exists(RESULTS_PATH):
+        return {}
+    with open(RESULTS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_latencies(backend: str, samples: list):
+    """Store the samples of one backend, replacing the previous ones (file-locked)."""
+    os.makedirs(BENCHMARK_RESULTS_DIR, exist_ok=True)
+    with FileLock(f"{RESULTS_PATH}.lock"):
+        results = load_latencies()
+        results[backend] = samples
+        with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+def latency_summary(results: dict) -> list:
+    """One line per backend, fastest median first: median, p95 and speedup over the slowest backend."""
+    medians = {backend: statistics.median(samples) for backend, samples in results.items() if samples}
+    if not medians:
+        return []
+    slowest = max(medians.values())
+    return [
+        f"{backend}: median {median:.3f}s, p95 {percentile(results[backend], 95):.3f}s "
+        f"(x{slowest / median if median else float('inf'):.1f}, {len(results[backend])} emails)"
+        for backend, median in sorted(medians.items(), key=lambda item: item[1])
+    ]
@@ -0,0 +1,129 @@
+"""
+Page-load benchmark helpers: Navigation Timing measurement, result storage
+per SUT version and comparison with a baseline version.
+
+The benchmark itself runs as pytest tests (tests/benchmark_tests), so that it
+reuses the browser and account fixtures:
+    pytest --page-load-benchmark tests/benchmark_tests
+"""
+import json
+import math
+import os
+import statistics
+from filelock import FileLock
+from utils.config import (BENCHMARK_RESULTS_DIR, PAGE_LOAD_SIGNIFICANCE, PAGE_LOAD_MIN_REGRESSION,
+                          EXPLICIT_WAIT)
+
+METRICS = ("ttfb", "dom_content_loaded", "load")
+
+# Resolves once the load event has completed (loadEventEnd is 0 until then)
+NAVIGATION_TIMING_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const read = () => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav || nav.loadEventEnd === 0) { setTimeout(read, 20); return; }
+    done({
+        url: document.URL,
+        ttfb: nav.responseStart - nav.startTime,
+        dom_content_loaded: nav.domContentLoadedEventEnd - nav.startTime,
+        load: nav.loadEventEnd - nav.startTime,
+        transfer_size: nav.transferSize
+    });
+};
+read();
+"""
+
+
+def measure_page_load(page, url: str, cold: bool) -> dict:
+    """
+    Open the URL and return its Navigation Timing metrics (milliseconds).
+    Args:
+        page: BasePage bound to the browser
+        url: page to load
+        cold: clear the browser cache first (cookies are kept)
+    """
+    if cold:
+        page.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    page.open_url(url)
+    page.driver.set_script_timeout(EXPLICIT_WAIT)
+    return page.driver.execute_async_script(NAVIGATION_TIMING_SCRIPT)
+
+
+def results_path(version: str) -> str:
+    return os.path.join(BENCHMARK_RESULTS_DIR, f"page_load_v{version}.json")
+
+
+def load_results(version: str) -> dict:
+    """Stored samples of a SUT version: {page: {variant: {metric: [ms, ...]}}}."""
+    path = results_path(version)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(version: str, page_name: str, variant: str, samples: dict):
+    """
+    Store the samples of one page/variant, replacing the previous ones
+    (file-locked, xdist workers share the file).
+    """
+    os.makedirs(BENCHMARK_RESULTS_DIR, exist_ok=True)
+    path = results_path(version)
+    with FileLock(f"{path}.lock"):
+        results = load_results(version)
+        results.setdefault(page_name, {})[variant] = samples
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+def mann_whitney_p_value(baseline: list, current: list) -> float:
+    """
+    One-sided Mann-Whitney U test (normal approximation, tie-corrected ranks):
+    probability of observing samples this much slower if nothing changed.
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    ranks = [0.0] * len(combined)
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+    std = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if std == 0:
+        return 1.0
+    z = (u - mean - 0.5) / std  # continuity correction
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def find_regressions(samples: dict, baseline: dict) -> list:
+    """
+    Compare the samples of one page/variant with the baseline ones.
+    A metric regresses when it is significantly slower (PAGE_LOAD_SIGNIFICANCE)
+    and its median grew by more than PAGE_LOAD_MIN_REGRESSION.
+    Returns:
+        list: human-readable regressions
+    """
+    regressions = []
+    for metric in METRICS:
+        current, previous = samples.get(metric, []), baseline.get(metric, [])
+        if not current or not previous:
+            continue
+        current_median, previous_median = statistics.median(current), statistics.median(previous)
+        if previous_median <= 0 or current_median / previous_median - 1 <= PAGE_LOAD_MIN_REGRESSION:
+            continue
+        p_value = mann_whitney_p_value(previous, current)
+        if p_value < PAGE_LOAD_SIGNIFICANCE:
+            regressions.append(
+                f"{metric}: median {previous_median:.0f} ms -> {current_median:.0f} ms "
+                f"(+{(current_median / previous_median - 1) * 100:.0f}%, p = {p_value:.4f})"
+            )
+    return regressions
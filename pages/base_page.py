@@ -1,33 +1,204 @@
 import logging
 import os
 import time
+from contextlib import contextmanager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        WebDriverException)
 from selenium.webdriver.common.action_chains import ActionChains
-from utils.config import (EXPLICIT_WAIT, PAGE_LOAD_TIMEOUT, IMPLICIT_WAIT)
+from utils.config import (EXPLICIT_WAIT, PAGE_LOAD_TIMEOUT, IMPLICIT_WAIT, STRICT_KEYSTROKES,
+                          NAVIGATION_EVENT_SLICE_MS)
 from selenium.webdriver.support.ui import Select
-from utils.config import  SCREENSHOT_DIR
+from utils.config import  SCREENSHOT_DIR, PAGE_LOG_LEVEL
+from utils.lazy_logging import LazyValue, get_log_level
+from utils.step_timeline import timed_step, instrument_driver
+
+# Collects everything the helpers need to know about an element in a single WebDriver command
+ELEMENT_SNAPSHOT_SCRIPT = """
+const el = arguments[0];
+const style = window.getComputedStyle(el);
+const rect = el.getBoundingClientRect();
+return {
+    text: (el.innerText || '').trim(),
+    aria_label: el.getAttribute('aria-label') || '',
+    // Only form fields have a live value (li, button and option also expose .value)
+    value: ['INPUT', 'TEXTAREA', 'SELECT'].includes(el.tagName) ? String(el.value) : (el.getAttribute('value') || ''),
+    title: el.getAttribute('title') || '',
+    name: el.getAttribute('name') || '',
+    id: el.id || '',
+    placeholder: el.getAttribute('placeholder') || '',
+    class: el.getAttribute('class') || '',
+    visible: style.display !== 'none' && style.visibility !== 'hidden'
+        && parseFloat(style.opacity) > 0 && rect.width > 0 && rect.height > 0,
+    enabled: !el.disabled,
+    selected: !!(el.checked || el.selected)
+};
+"""
+
+# Resolves as soon as the current document has loaded (load event) and matches the expected URL.
+# While the URL does not match, it waits for the next hashchange/popstate event or the end of the slice.
+# If the document is unloaded in the meantime, the command fails and is sent again to the new document.
+NAVIGATION_WAIT_SCRIPT = """
+const expectedUrl = arguments[0];
+const waitForChange = arguments[1];
+const sliceMs = arguments[2];
+const done = arguments[arguments.length - 1];
+let finished = false;
+function report() {
+    if (finished) { return; }
+    finished = true;
+    done({url: document.URL, ready: document.readyState === 'complete'});
+}
+const matches = expectedUrl === null || document.URL === expectedUrl;
+if (!waitForChange && matches && document.readyState === 'complete') { report(); return; }
+window.addEventListener('load', report, {once: true});
+window.addEventListener('hashchange', report, {once: true});
+window.addEventListener('popstate', report, {once: true});
+setTimeout(report, sliceMs);
+"""
+
+# Errors of NAVIGATION_WAIT_SCRIPT meaning that its document was replaced (the wait is sent again)
+NAVIGATION_ERRORS = ("document unloaded", "navigated or closed", "execution context was destroyed")
+
+# Revalidates a cached element in a single WebDriver command.
+# Raises StaleElementReferenceException if the element belongs to a previous document.
+CACHED_ELEMENT_CHECK_SCRIPT = """
+const el = arguments[0];
+const style = window.getComputedStyle(el);
+const rect = el.getBoundingClientRect();
+const visible = el.isConnected && style.display !== 'none' && style.visibility !== 'hidden'
+    && parseFloat(style.opacity) > 0 && rect.width > 0 && rect.height > 0;
+return [visible, document.URL];
+"""
+
+# Resolves every field of a form in one command and, unless strict mode is requested,
+# fills them by setting their value and dispatching the input/change events.
+# Returns ready=false (without filling anything) while a field is missing or hidden.
+FORM_FILL_SCRIPT = """
+const fields = arguments[0];
+const fill = arguments[1];
+function locate(by, value) {
+    switch (by) {
+        case 'xpath':
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'css selector': return document.querySelector(value);
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+    }
+    return null;
+}
+function isVisible(el) {
+    const style = window.getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    return style.display !== 'none' && style.visibility !== 'hidden'
+        && parseFloat(style.opacity) > 0 && rect.width > 0 && rect.height > 0;
+}
+const elements = [];
+const missing = [];
+fields.forEach(function (field, index) {
+    const el = locate(field[0], field[1]);
+    if (!el || !isVisible(el) || el.disabled) { missing.push(index); }
+    elements.push(el);
+});
+if (missing.length) { return {ready: false, missing: missing}; }
+const names = elements.map(function (el) {
+    return el.getAttribute('aria-label') || el.getAttribute('name') || el.id
+        || el.getAttribute('placeholder') || el.getAttribute('class') || '';
+});
+if (fill) {
+    elements.forEach(function (el, index) {
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+        el.focus();
+        setter.call(el, fields[index][2]);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.blur();
+    });
+}
+return {ready: true, elements: elements, names: names};
+"""
+
+# Attributes used to identify an element in logs, by priority
+ELEMENT_NAME_KEYS = ("text", "aria_label", "value", "title", "name", "id", "placeholder", "class")
+
+
 class BasePage:
     """
     Base class for all page objects.
     Provides common methods for page interactions and element handling.
     """
 
+    # Element cache counters, aggregated over all page objects of the process
+    element_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    # Explicit waits that timed out during the current test (reset before each test)
+    timed_out_wait_stats = {"count": 0, "seconds": 0.0}
+
     def __init__(self, driver):
         self.driver = driver
+        instrument_driver(driver)
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.driver.implicitly_wait(IMPLICIT_WAIT)
+        log_level = get_log_level(PAGE_LOG_LEVEL)
+        if self.logger.level != log_level:
+            self.logger.setLevel(log_level)
+        self.implicit_wait = IMPLICIT_WAIT
+        self.driver.implicitly_wait(self.implicit_wait)
         self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
         self.wait = WebDriverWait(self.driver, EXPLICIT_WAIT)
         self.is_subscription_required = True
+        self.last_navigation_time = None
+        self._element_cache = {}
+        self._element_cache_url = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def reset_wait_stats(cls):
+        cls.timed_out_wait_stats = {"count": 0, "seconds": 0.0}
+
+    @contextmanager
+    def implicit_wait_disabled(self):
+        """
+        Switch the implicit wait off for the duration of an explicit wait,
+        so that both waits are never stacked. Costs nothing when no implicit wait is set.
+        """
+        if not self.implicit_wait:
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
+
+    @timed_step("wait")
+    def wait_until(self, condition, timeout: float = None):
+        """
+        Explicit wait with the implicit wait switched off.
+        The time spent in waits that time out is added to timed_out_wait_stats.
+        Args:
+            condition: expected condition (callable receiving the driver)
+            timeout: maximum time to wait (seconds), defaults to EXPLICIT_WAIT
+        """
+        wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
+        start_time = time.perf_counter()
+        try:
+            with self.implicit_wait_disabled():
+                return wait.until(condition)
+        except TimeoutException:
+            BasePage.timed_out_wait_stats["count"] += 1
+            BasePage.timed_out_wait_stats["seconds"] += time.perf_counter() - start_time
+            raise
 
     def set_subscription_required(self, value: bool):
         """
         Define if the subscription selection is required
         """
         self.is_subscription_required = value
-        self.logger.info(f"Subscription required set to = '{self.is_subscription_required}'")
+        self.logger.info("Subscription required set to = '%s'", self.is_subscription_required)
 
     def get_title(self):
         return self.driver.title.strip()
@@ -35,104 +206,196 @@ class BasePage:
     def get_current_url(self):
         return self.driver.current_url.strip()
 
+    @property
+    def lazy_title(self):
+        """Page title, only looked up if the log record using it is emitted."""
+        return LazyValue(self.get_title)
+
+    @property
+    def lazy_url(self):
+        """Current URL, only looked up if the log record using it is emitted."""
+        return LazyValue(self.get_current_url)
+
+    @timed_step("navigation")
     def open_url(self, url):
         """
         Navigate to specified URL and ensure page is fully loaded.
         """
+        self.invalidate_element_cache()
         try:
             self.driver.get(url)
-            self.wait.until(EC.url_to_be(url))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(
-                f"Page loaded successfully = '{url}' "
-                f" having title = '{self.get_title()}'"
-            )
+            self.wait_for_navigation(url)
+            self.logger.info("Page loaded successfully = '%s'  having title = '%s'", url, self.lazy_title)
         except TimeoutException as e:
             self.logger.error(
-                f"Timeout while loading page '{url}' "
-                f"after '{PAGE_LOAD_TIMEOUT}' seconds | {str(e)}"
-                f"Current URL is = '{self.get_current_url()}'"
+                "Timeout while loading page '%s' after '%s' seconds | %sCurrent URL is = '%s'",
+                url, PAGE_LOAD_TIMEOUT, e, self.lazy_url
             )
             raise e
         except Exception as e:
-            self.logger.error(
-                f"Navigation to '{url}' failed | {str(e)}"
-                f"Current URL is = '{self.get_current_url()}'")
+            self.logger.error("Navigation to '%s' failed | %sCurrent URL is = '%s'", url, e, self.lazy_url)
             raise e
 
+    @timed_step("navigation")
+    def wait_for_navigation(self, expected=None, timeout: float = EXPLICIT_WAIT) -> str:
+        """
+        Wait until the browser has loaded a document matching the expectation.
+        Args:
+            expected: exact URL (str), predicate called with the current URL,
+                      or None to accept any fully loaded document
+            timeout: maximum time to wait (seconds)
+        Returns:
+            str: URL of the loaded document
+        Raises:
+            TimeoutException: If no matching document is loaded within timeout
+        """
+        expected_url = expected if isinstance(expected, str) else None
+        predicate = expected if callable(expected) else (lambda url: expected_url is None or url == expected_url)
+
+        start_time = time.perf_counter()
+        deadline = start_time + timeout
+        wait_for_change = False
+        url = None
+        while time.perf_counter() < deadline:
+            slice_ms = int(min(NAVIGATION_EVENT_SLICE_MS, (deadline - time.perf_counter()) * 1000))
+            try:
+                state = self.driver.execute_async_script(
+                    NAVIGATION_WAIT_SCRIPT, expected_url, wait_for_change, max(slice_ms, 0)
+                )
+            except WebDriverException as e:
+                if not any(error in (e.msg or "").lower() for error in NAVIGATION_ERRORS):
+                    raise
+                # Document unloaded while waiting: a navigation is in progress, wait on the new document
+                wait_for_change = False
+                continue
+
+            url = state["url"]
+            if state["ready"] and predicate(url):
+                self.last_navigation_time = time.perf_counter() - start_time
+                self.logger.info("Navigation to '%s' completed in %.3fs", url, self.last_navigation_time)
+                return url
+            wait_for_change = True
+
+        BasePage.timed_out_wait_stats["count"] += 1
+        BasePage.timed_out_wait_stats["seconds"] += time.perf_counter() - start_time
+        raise TimeoutException(
+            f"Navigation not completed within {timeout} seconds "
+            f"(expected = '{expected_url or 'matching URL'}', current URL = '{url}')"
+        )
+
+    @timed_step("navigation")
     def navigate_back(self):
         """
         Navigate to the previous page in browser history and ensure it's fully loaded.
         """
+        self.invalidate_element_cache()
         try:
             self.driver.back()
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Successfully navigated back to = '{self.get_current_url()}'")
+            url = self.wait_for_navigation()
+            self.logger.info("Successfully navigated back to = '%s'", url)
         except TimeoutException as e:
-            self.logger.error(
-                f"Timeout while trying to navigate back | {str(e)}"
-                f"Current URL is = '{self.get_current_url()}'"
-            )
+            self.logger.error("Timeout while trying to navigate back | %sCurrent URL is = '%s'", e, self.lazy_url)
             raise e
         except Exception as e:
-            self.logger.error(
-                f"Navigation back failed | {str(e)}"
-                f"Current URL is = '{self.get_current_url()}'"
-            )
+            self.logger.error("Navigation back failed | %sCurrent URL is = '%s'", e, self.lazy_url)
             raise e
 
+    @timed_step("navigation")
     def navigate_forward(self):
         """
         Navigate to the next page in browser history and ensure it's fully loaded.
         """
+        self.invalidate_element_cache()
         try:
             self.driver.forward()
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Successfully navigated forward to = '{self.get_current_url()}'")
+            url = self.wait_for_navigation()
+            self.logger.info("Successfully navigated forward to = '%s'", url)
         except TimeoutException as e:
-            self.logger.error(
-                f"Timeout while trying to navigate forward | {str(e)}"
-                f"Current URL is = '{self.get_current_url()}'"
-            )
+            self.logger.error("Timeout while trying to navigate forward | %sCurrent URL is = '%s'", e, self.lazy_url)
             raise e
         except Exception as e:
-            self.logger.error(
-                f"Navigation forward failed | {str(e)}"
-                f"Current URL is = '{self.get_current_url()}'"
-            )
+            self.logger.error("Navigation forward failed | %sCurrent URL is = '%s'", e, self.lazy_url)
             raise e
 
-    def is_element_present(self, locator) -> bool:
+    @timed_step("wait")
+    def is_element_present(self, locator, timeout: float = None) -> bool:
         """
         Check if the element specified by the locator is visible on the page.
         Returns True if found, False otherwise without raising exceptions.
+        Args:
+            locator: Tuple
+            timeout: maximum time to wait for the element (seconds), defaults to EXPLICIT_WAIT
         """
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
+            self.wait_until(EC.visibility_of_element_located(locator), timeout)
             return True
         except (TimeoutException, NoSuchElementException):
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error while checking element presence at '{self.get_current_url()}'| {str(e)}")
+            self.logger.error("Unexpected error while checking element presence at '%s'| %s", self.lazy_url, e)
             return False
 
+    def invalidate_element_cache(self):
+        """Forget every cached element (after a navigation or a stale element)."""
+        if self._element_cache:
+            BasePage.element_cache_stats["invalidations"] += 1
+        self._element_cache = {}
+        self._element_cache_url = None
+
+    def _get_cached_element(self, locator):
+        """
+        Return the cached element for the locator if it is still attached, visible
+        and the document URL has not changed, None otherwise.
+        """
+        element = self._element_cache.get(locator)
+        if element is None:
+            return None
+        try:
+            visible, url = self.driver.execute_script(CACHED_ELEMENT_CHECK_SCRIPT, element)
+        except StaleElementReferenceException:
+            self.invalidate_element_cache()
+            return None
+        if url != self._element_cache_url:
+            self.invalidate_element_cache()
+            return None
+        return element if visible else None
+
+    @timed_step("locate")
     def find_element(self, locator) :
         """Find a single web element using provided locator.
+        Elements are cached per page object and revalidated with a single command on reuse.
         """
+        element = self._get_cached_element(locator)
+        if element is not None:
+            self.cache_hits += 1
+            BasePage.element_cache_stats["hits"] += 1
+            return element
+
+        self.cache_misses += 1
+        BasePage.element_cache_stats["misses"] += 1
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
+            element = self.wait_until(EC.visibility_of_element_located(locator))
+            if not self._element_cache:
+                self._element_cache_url = self.driver.current_url
+            self._element_cache[locator] = element
             return element
         except NoSuchElementException as e:
-            self.logger.error(f"Unable to find any element using locator = {locator} at '{self.get_current_url()}'| {str(e)}")
+            self.logger.error("Unable to find any element using locator = %s at '%s'| %s", locator, self.lazy_url, e)
             raise e
         except TimeoutException as e:
-            self.logger.error(f"timeout while waiting for element with locator = {locator} to become visible at '{self.get_current_url()}' | {str(e)}")
+            self.logger.error(
+                "timeout while waiting for element with locator = %s to become visible at '%s' | %s",
+                locator, self.lazy_url, e
+            )
             raise e
         except Exception as e:
             self.logger.error(
-                f"An unexpected error occurred while searching for element with locator = {locator} at '{self.get_current_url()}'| {str(e)}")
+                "An unexpected error occurred while searching for element with locator = %s at '%s'| %s",
+                locator, self.lazy_url, e
+            )
             raise e
 
+    @timed_step("locate")
     def find_elements(self, locator):
         """Find multiple web elements using provided locator.
         Args:
@@ -141,76 +404,104 @@ class BasePage:
             list[WebElement]: List of found elements
         """
         try:
-            elements = self.wait.until(EC.visibility_of_all_elements_located(locator))
+            elements = self.wait_until(EC.visibility_of_all_elements_located(locator))
             return elements
         except NoSuchElementException as e:
-            self.logger.error(
-                f"Unable to find  elements using locator = {locator}  at '{self.get_current_url()}' |  {str(e)}")
+            self.logger.error("Unable to find  elements using locator = %s  at '%s' |  %s", locator, self.lazy_url, e)
             raise e
         except TimeoutException as e:
             self.logger.error(
-                f"Timeout while waiting for elements with locator = {locator} to become visible at '{self.get_current_url()}' | Exception: {str(e)}")
+                "Timeout while waiting for elements with locator = %s to become visible at '%s' | Exception: %s",
+                locator, self.lazy_url, e
+            )
             raise e
         except Exception as e:
             self.logger.error(
-                f"An unexpected error occurred while searching for elements with locator = {locator} on page ='{self.get_current_url()}' | Exception: {str(e)}")
+                "An unexpected error occurred while searching for elements with locator = %s on page ='%s' | Exception: %s",
+                locator, self.lazy_url, e
+            )
             raise e
 
+    def get_element_snapshot(self, element) -> dict:
+        """Get the element metadata (text, attributes, visibility, enabled state)
+        with a single script execution.
+        Waits for the element visibility only if the element is not visible yet.
+        Args:
+            element: WebElement to describe
+        Returns:
+            dict: keys are text, aria_label, value, title, name, id, placeholder, class,
+                  visible, enabled and selected
+        """
+        snapshot = self.driver.execute_script(ELEMENT_SNAPSHOT_SCRIPT, element)
+        if not snapshot["visible"]:
+            self.wait_until(EC.visibility_of(element))
+            snapshot = self.driver.execute_script(ELEMENT_SNAPSHOT_SCRIPT, element)
+        return snapshot
+
+    @staticmethod
+    def get_name_from_snapshot(snapshot) -> str:
+        """Return the most meaningful identifier of an element snapshot."""
+        for key in ELEMENT_NAME_KEYS:
+            if snapshot.get(key):
+                return snapshot[key]
+        return ""
+
     def get_element_name(self, element):
+        return self.get_name_from_snapshot(self.get_element_snapshot(element))
 
-        element = self.wait.until(EC.visibility_of(element))
-        return (
-                element.text or
-                element.get_attribute("aria-label") or
-                element.get_attribute("value") or
-                element.get_attribute("title") or
-                element.get_attribute("name") or
-                element.get_attribute("id") or
-                element.get_attribute("placeholder") or
-                element.get_attribute("class") or
-                ""
-        )
+    def _wait_clickable(self, element, snapshot):
+        """Wait until the element is clickable, unless the snapshot already shows it is."""
+        if snapshot["visible"] and snapshot["enabled"]:
+            return element
+        return self.wait_until(EC.element_to_be_clickable(element))
 
-    def click_element(self, element):
+    @timed_step("action")
+    def click_element(self, element, expect_stale: bool = False):
         """Wait until element is clickable and click it.
         Args:
             element: WebElement to be clicked
+            expect_stale: the caller recovers from a StaleElementReferenceException (not logged as an error)
         """
 
-        element_name = self.get_element_name(element)
+        snapshot = self.get_element_snapshot(element)
+        element_name = self.get_name_from_snapshot(snapshot)
 
         try:
             ActionChains(self.driver).move_to_element(element).perform()
-            element = self.wait.until(EC.element_to_be_clickable(element))
+            element = self._wait_clickable(element, snapshot)
             element.click()
-            self.logger.info(f"Successfully clicked on element identified as '{element_name}'")
+            self.logger.info("Successfully clicked on element identified as '%s'", element_name)
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to click on element identified as '{element_name}' at '{self.get_current_url()}' | {str(e)}"
-            )
+            if not (expect_stale and isinstance(e, StaleElementReferenceException)):
+                self.logger.error(
+                    "Failed to click on element identified as '%s' at '%s' | %s", element_name, self.lazy_url, e
+                )
             raise e
 
+    @timed_step("action")
     def double_click_element(self, element):
         """Wait until element is clickable and double-click it.
         Args:
             element: WebElement to be double-clicked
         """
-        element_name = self.get_element_name(element)
+        snapshot = self.get_element_snapshot(element)
+        element_name = self.get_name_from_snapshot(snapshot)
 
         try:
             ActionChains(self.driver).move_to_element(element).perform()
-            element = self.wait.until(EC.element_to_be_clickable(element))
+            element = self._wait_clickable(element, snapshot)
             ActionChains(self.driver).double_click(element).perform()
-            self.logger.info(f"Successfully Double-clicked on element identified as '{element_name}'")
+            self.logger.info("Successfully Double-clicked on element identified as '%s'", element_name)
 
         except Exception as e:
             self.logger.error(
-                f"Failed to double-click on element identified as'{element_name}' at '{self.get_current_url()}'| {str(e)}"
+                "Failed to double-click on element identified as'%s' at '%s'| %s", element_name, self.lazy_url, e
             )
             raise e
 
 
+    @timed_step("action")
     def select_option_by_text_and_get_index(self, dropdown_element, text):
         """Select option in dropdown menu by visible text and get the option's index.
         Args:
@@ -219,10 +510,11 @@ class BasePage:
         Returns:
             int: Index of the selected option
         """
-        dropdown_name = self.get_element_name(dropdown_element)
+        snapshot = self.get_element_snapshot(dropdown_element)
+        dropdown_name = self.get_name_from_snapshot(snapshot)
 
         try:
-            dropdown_element = self.wait.until(EC.element_to_be_clickable(dropdown_element))
+            dropdown_element = self._wait_clickable(dropdown_element, snapshot)
 
             select = Select(dropdown_element)
             options = select.options
@@ -232,64 +524,112 @@ class BasePage:
                 if option_text == text.strip():
                     select.select_by_visible_text(option_text)
                     self.logger.info(
-                        f"Option with text '{text}' selected in dropdown menu ('{dropdown_name}'), "
-                        f"its index is = {index}")
+                        "Option with text '%s' selected in dropdown menu ('%s'), its index is = %s",
+                        text, dropdown_name, index)
                     return index
 
             raise ValueError(
                 f"Option with text '{text}' not found in dropdown menu (identified as '{dropdown_name}'). "
                 f"Available options are: {[opt.text.strip() for opt in options]}")
         except Exception as e:
-            self.logger.error(f"Failed to select option by text '{text}' in dropdown ('{dropdown_name}'): {e}")
+            self.logger.error("Failed to select option by text '%s' in dropdown ('%s'): %s", text, dropdown_name, e)
             raise
 
+    @timed_step("action")
     def check(self, element):
         """Wait until element is clickable and check it (select for radio buttons or checkboxes).
         Args:
             element: WebElement to be checked (checkbox or radio button)
         """
 
-        element_name = self.get_element_name(element)
+        snapshot = self.get_element_snapshot(element)
+        element_name = self.get_name_from_snapshot(snapshot)
 
         try:
-            element = self.wait.until(EC.element_to_be_clickable(element))
+            element = self._wait_clickable(element, snapshot)
 
             # If the element is not selected, click to select it
-            if not element.is_selected():
+            if not snapshot["selected"]:
                 element.click()
-                self.logger.info(f"Successfully checked the element identified as '{element_name}'")
+                self.logger.info("Successfully checked the element identified as '%s'", element_name)
             else:
-                self.logger.info(f"Element identified as '{element_name}' is already checked")
+                self.logger.info("Element identified as '%s' is already checked", element_name)
 
         except Exception as e:
             self.logger.error(
-                f"Failed to check element identified as '{element_name}' at '{self.get_current_url()}' | {str(e)}"
+                "Failed to check element identified as '%s' at '%s' | %s", element_name, self.lazy_url, e
             )
             raise e
 
+    @timed_step("action")
     def input_text(self, element, text):
         """Enter text into an input field.
         Args:
             element: WebElement representing the input field
             text: String to enter into the field
         """
-        element_name = self.get_element_name(element)
+        snapshot = self.get_element_snapshot(element)
+        element_name = self.get_name_from_snapshot(snapshot)
         try:
-            element = self.wait.until(EC.element_to_be_clickable(element))
+            element = self._wait_clickable(element, snapshot)
             element.click()
             element.clear()
             element.send_keys(text)
             if text == "":
-                self.logger.info(f"Field '{element_name}' left empty")
+                self.logger.info("Field '%s' left empty", element_name)
             elif text.strip() == "":
-                self.logger.info(f"Field '{element_name}' contains only whitespace")
+                self.logger.info("Field '%s' contains only whitespace", element_name)
             else:
-                self.logger.info(f"Entered ='{text}' into field  '{element_name}'")
+                self.logger.info("Entered ='%s' into field  '%s'", text, element_name)
+
+        except Exception as e:
+            self.logger.error("Failed to enter = '%s' into field  '%s'| %s", text, element_name, e)
+            raise e
+
+    @timed_step("action")
+    def fill_form(self, fields: dict, strict: bool = None):
+        """Fill several input fields at once.
+        All fields are located (and waited for) with a single script. In strict mode (default),
+        real keystrokes are then sent to each field (click, clear, send_keys); otherwise the same
+        script also sets their values, so the whole form costs one WebDriver command.
+        Args:
+            fields: {locator: text} in filling order
+            strict: send real keystrokes, defaults to STRICT_KEYSTROKES from config
+        """
+        strict = STRICT_KEYSTROKES if strict is None else strict
+        locators = list(fields)
+        script_args = [[by, value, text] for (by, value), text in fields.items()]
+        last_result = {}
+
+        def form_ready(driver):
+            last_result.update(driver.execute_script(FORM_FILL_SCRIPT, script_args, not strict))
+            return last_result if last_result["ready"] else False
 
+        try:
+            result = self.wait_until(form_ready)
+        except TimeoutException as e:
+            missing = [locators[i] for i in last_result.get("missing", [])]
+            self.logger.error(
+                "Timeout while waiting for form fields = %s to become visible at '%s' | %s",
+                missing, self.lazy_url, e
+            )
+            raise e
+
+        filled = LazyValue(lambda: ", ".join(
+            f"'{name}'='{fields[locator]}'" for name, locator in zip(result["names"], locators)
+        ))
+        try:
+            if strict:
+                for element, locator in zip(result["elements"], locators):
+                    element.click()
+                    element.clear()
+                    element.send_keys(fields[locator])
+            self.logger.info("Form filled (%s) with = %s", "keystrokes" if strict else "script", filled)
         except Exception as e:
-            self.logger.error(f"Failed to enter = '{text}' into field  '{element_name}'| {str(e)}")
+            self.logger.error("Failed to fill form with = %s | %s", filled, e)
             raise e
 
+    @timed_step("action")
     def get_text(self, element):
         """
         Get text content from a WebElement.
@@ -298,18 +638,20 @@ class BasePage:
         Returns:
             str: Text content of element
         """
-        element_name = self.get_element_name(element)
+        snapshot = self.get_element_snapshot(element)
+        element_name = self.get_name_from_snapshot(snapshot)
         try:
-            text = element.text
-            if not text:
-                text = element.get_attribute("value") or ""
-            self.logger.info(f"Retrieved text from element identified as '{element_name}' is = '{text}'")
+            text = snapshot["text"] or snapshot["value"]
+            self.logger.info("Retrieved text from element identified as '%s' is = '%s'", element_name, text)
             return text.strip()
         except Exception as e:
-            self.logger.error(f"Failed to get text from element identified as '{element_name}' at '{self.get_current_url()}'| {str(e)}")
+            self.logger.error(
+                "Failed to get text from element identified as '%s' at '%s'| %s", element_name, self.lazy_url, e
+            )
             return ""
 
 
+    @timed_step("navigation")
     def switch_to_new_window(self):
         """Switch to the most recently opened window."""
         try:
@@ -324,16 +666,17 @@ class BasePage:
             new_window = all_windows[-1]
             if new_window != current_window:
                 self.driver.switch_to.window(new_window)
+                self.invalidate_element_cache()
                 self.logger.info(
-                    f"Switched to new window."
-                    f"New window URL = '{self.get_current_url()}'"
-                    f"New window Title = '{self.get_title()}'"
+                    "Switched to new window.New window URL = '%s'New window Title = '%s'",
+                    self.lazy_url, self.lazy_title
                 )
 
         except Exception as e:
-            self.logger.error(f"Failed to switch to new window | {str(e)}")
+            self.logger.error("Failed to switch to new window | %s", e)
             raise e
 
+    @timed_step("navigation")
     def switch_back_to_main_window(self):
         """Switch back to the main (initial) browser window."""
         try:
@@ -344,14 +687,13 @@ class BasePage:
 
             main_window = all_windows[0]
             self.driver.switch_to.window(main_window)
+            self.invalidate_element_cache()
             self.logger.info(
-                f"Switched back to main window. "
-                f"URL = '{self.get_current_url()}', "
-                f"Title = '{self.get_title()}'"
+                "Switched back to main window. URL = '%s', Title = '%s'", self.lazy_url, self.lazy_title
             )
 
         except Exception as e:
-            self.logger.error(f"Failed to switch back to main window | {str(e)}")
+            self.logger.error("Failed to switch back to main window | %s", e)
             raise e
 
     def take_screenshot(self, name: str):
@@ -365,9 +707,9 @@ class BasePage:
 
             os.makedirs(SCREENSHOT_DIR, exist_ok=True)
             self.driver.save_screenshot(screenshot_path)
-            self.logger.info(f"Screenshot successfully captured at = {screenshot_path}")
+            self.logger.info("Screenshot successfully captured at = %s", screenshot_path)
             return screenshot_path
 
         except Exception as e:
-            self.logger.info(f"Failed to capture screenshot '{name}' | {str(e)}")
+            self.logger.info("Failed to capture screenshot '%s' | %s", name, e)
             return None
\ No newline at end of file
@@ -1,5 +1,4 @@
 from selenium.common import TimeoutException
-from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
 from utils.locators.dashboard_page_locators import DashboardPageLocators
 from utils.urls import Urls
@@ -22,10 +21,9 @@ class DashboardPage(BasePage):
 
     def is_logout_successful(self):
         try:
-            self.wait.until(EC.url_to_be(Urls.LOGIN))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Logout successful. Current URL is = '{self.get_current_url()}'")
+            self.wait_for_navigation(Urls.LOGIN)
+            self.logger.info("Logout successful. Current URL is = '%s'", self.lazy_url)
             return True
         except TimeoutException:
-            self.logger.info(f"Logout failed. Current URL is = '{self.get_current_url()}'")
+            self.logger.info("Logout failed. Current URL is = '%s'", self.lazy_url)
             return False
\ No newline at end of file
@@ -1,4 +1,3 @@
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 from utils.locators.login_page_locators import LoginPageLocators
@@ -40,8 +39,10 @@ class LoginPage(BasePage):
             email: Email to use
             password: Password to use
         """
-        self.enter_email(email)
-        self.enter_password(password)
+        self.fill_form({
+            LoginPageLocators.EMAIL_FIELD: email,
+            LoginPageLocators.PASSWORD_FIELD: password,
+        })
         self.click_login_button()
 
     def click_forgot_password_link(self):
@@ -66,14 +67,12 @@ class LoginPage(BasePage):
               bool: True if redirected to the company registration URL.
           """
         try:
-            self.wait.until(EC.url_to_be(Urls.REGISTER_COMPANY))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"User logged in, current URL is = '{self.get_current_url()}'")
+            self.wait_for_navigation(Urls.REGISTER_COMPANY)
+            self.logger.info("User logged in, current URL is = '%s'", self.lazy_url)
             return True
 
         except TimeoutException:
-            current_url = self.get_current_url()
-            self.logger.info(f"Current URL after login attempt is = '{current_url}'")
+            self.logger.info("Current URL after login attempt is = '%s'", self.lazy_url)
             return False
 
     def is_login_successful(self):
@@ -83,14 +82,12 @@ class LoginPage(BasePage):
         """
         try:
             target_url = Urls.SUBSCRIPTION if self.is_subscription_required else Urls.DASHBOARD
-            self.wait.until(EC.url_to_be(target_url))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"User logged in, current URL is = '{self.get_current_url()}'")
+            self.wait_for_navigation(target_url)
+            self.logger.info("User logged in, current URL is = '%s'", self.lazy_url)
             return True
 
         except TimeoutException:
-            current_url = self.get_current_url()
-            self.logger.info(f"Current URL after login attempt is = '{current_url}'")
+            self.logger.info("Current URL after login attempt is = '%s'", self.lazy_url)
             return False
 
 
@@ -102,12 +99,13 @@ class LoginPage(BasePage):
             bool: True if redirection to 'Forgot Password' page is successful, False otherwise
         """
         try:
-            self.wait.until(EC.url_to_be(Urls.FORGOT_PASSWORD))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Redirected to 'Forgot Password' page = '{Urls.FORGOT_PASSWORD}'")
+            self.wait_for_navigation(Urls.FORGOT_PASSWORD)
+            self.logger.info("Redirected to 'Forgot Password' page = '%s'", Urls.FORGOT_PASSWORD)
             return True
         except TimeoutException:
-            self.logger.error(f"Redirection to 'Forgot Password' page failed = expected '{Urls.FORGOT_PASSWORD}'- Current url is = '{self.get_current_url()}'")
+            self.logger.error(
+                "Redirection to 'Forgot Password' page failed = expected '%s'- Current url is = '%s'",
+                Urls.FORGOT_PASSWORD, self.lazy_url)
             return False
 
     def is_register_page_opened(self):
@@ -116,13 +114,11 @@ class LoginPage(BasePage):
             bool: True if redirection to the register page is successful, False otherwise
         """
         try:
-            self.wait.until(EC.url_to_be(Urls.CREATE_ACCOUNT))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Redirected to the register page = '{Urls.CREATE_ACCOUNT}'")
+            self.wait_for_navigation(Urls.CREATE_ACCOUNT)
+            self.logger.info("Redirected to the register page = '%s'", Urls.CREATE_ACCOUNT)
             return True
         except TimeoutException:
             self.logger.error(
-                f"Redirection to the register page failed. "
-                f"expected ='{Urls.CREATE_ACCOUNT}'"
-                f"- Current url is = '{self.get_current_url()}")
+                "Redirection to the register page failed. expected ='%s'- Current url is = '%s'",
+                Urls.CREATE_ACCOUNT, self.lazy_url)
             return False
\ No newline at end of file
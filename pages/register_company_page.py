@@ -1,4 +1,3 @@
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 from utils.locators.register_company_page_locators import  RegisterCompanyPageLocators
@@ -49,9 +48,11 @@ class RegisterCompanyPage(BasePage):
             email: company email
             siret
         """
-        self.enter_name(name)
-        self.enter_email(email)
-        self.enter_siret(siret)
+        self.fill_form({
+            RegisterCompanyPageLocators.NAME_FIELD: name,
+            RegisterCompanyPageLocators.EMAIL_FIELD: email,
+            RegisterCompanyPageLocators.SIRET_FIELD: siret,
+        })
         self.click_connection_button()
 
     def register_valid_company(self):
@@ -85,14 +86,12 @@ class RegisterCompanyPage(BasePage):
         """
         try:
             target_url = Urls.SUBSCRIPTION if self.is_subscription_required else Urls.DASHBOARD
-            self.wait.until(EC.url_to_be(target_url))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Company registered, current URL is = '{target_url}'")
+            self.wait_for_navigation(target_url)
+            self.logger.info("Company registered, current URL is = '%s'", target_url)
             return True
 
         except TimeoutException:
-            self.logger.info(
-                f"Current URL after company registration attempt is = '{self.get_current_url()}'")
+            self.logger.info("Current URL after company registration attempt is = '%s'", self.lazy_url)
             return False
 
     def is_login_page_opened(self):
@@ -101,15 +100,13 @@ class RegisterCompanyPage(BasePage):
                     bool: True if redirection to the login page is successful, False otherwise
                 """
         try:
-            self.wait.until(EC.url_to_be(Urls.LOGIN))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Redirected to the login page = '{Urls.LOGIN}'")
+            self.wait_for_navigation(Urls.LOGIN)
+            self.logger.info("Redirected to the login page = '%s'", Urls.LOGIN)
             return True
         except TimeoutException:
             self.logger.error(
-                f"Redirection to the login page failed. "
-                f"expected ='{Urls.LOGIN}'- "
-                f"Current url is = '{self.get_current_url()}'")
+                "Redirection to the login page failed. expected ='%s'- Current url is = '%s'",
+                Urls.LOGIN, self.lazy_url)
             return False
 
     
\ No newline at end of file
@@ -1,4 +1,3 @@
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 from utils.locators.register_page_locators import RegisterPageLocators
@@ -65,11 +64,13 @@ class RegisterPage(BasePage):
             password: Password to use
             password_confirmation
         """
-        self.enter_lastname(lastname)
-        self.enter_firstname(firstname)
-        self.enter_email(email)
-        self.enter_password(password)
-        self.enter_password_confirmation(password_confirmation)
+        self.fill_form({
+            RegisterPageLocators.LASTNAME_FIELD: lastname,
+            RegisterPageLocators.FIRSTNAME_FIELD: firstname,
+            RegisterPageLocators.EMAIL_FIELD: email,
+            RegisterPageLocators.PASSWORD_FIELD: password,
+            RegisterPageLocators.PASSWORD_CONFIRMATION_FIELD: password_confirmation,
+        })
         self.click_continue_button()
 
     def register_valid_user(self):
@@ -106,14 +107,11 @@ class RegisterPage(BasePage):
             bool: True if registration was successful, False otherwise.
         """
         try:
-            self.wait.until(EC.url_to_be(Urls.REGISTER_COMPANY))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"User registered, current URL is = '{self.get_current_url()}'")
+            self.wait_for_navigation(Urls.REGISTER_COMPANY)
+            self.logger.info("User registered, current URL is = '%s'", self.lazy_url)
             return True
         except TimeoutException:
-            self.logger.info(
-                f"Current URL after registration attempt is = '{self.get_current_url()}'"
-            )
+            self.logger.info("Current URL after registration attempt is = '%s'", self.lazy_url)
             return False
 
     def is_login_page_opened(self):
@@ -122,13 +120,11 @@ class RegisterPage(BasePage):
             bool: True if redirection to the login page is successful, False otherwise
         """
         try:
-            self.wait.until(EC.url_to_be(Urls.LOGIN))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Redirected to the login page = '{Urls.LOGIN}'")
+            self.wait_for_navigation(Urls.LOGIN)
+            self.logger.info("Redirected to the login page = '%s'", Urls.LOGIN)
             return True
         except TimeoutException:
             self.logger.error(
-                f"Redirection to the login page failed. "
-                f"expected ='{Urls.LOGIN}'- "
-                f"Current url is = '{self.get_current_url()}'")
+                "Redirection to the login page failed. expected ='%s'- Current url is = '%s'",
+                Urls.LOGIN, self.lazy_url)
             return False
\ No newline at end of file
@@ -1,7 +1,6 @@
 from selenium.common import TimeoutException
 from pages.base_page import BasePage
 from utils.locators.reset_password_page_locators import ResetPasswordPageLocators
-from selenium.webdriver.support import expected_conditions as EC
 from utils.urls import Urls
 from utils.users import ResetPasswordData
 
@@ -21,12 +20,11 @@ class ResetPasswordPage(BasePage):
             bool: True if page is opened, False otherwise
         """
         try:
-            self.wait.until(EC.url_contains(Urls.RESET_PASSWORD))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Reset password page opened successfully")
+            self.wait_for_navigation(lambda url: Urls.RESET_PASSWORD in url)
+            self.logger.info("Reset password page opened successfully")
             return True
         except TimeoutException:
-            self.logger.info(f"Reset password page not opened. Current URL is = {self.get_current_url()}")
+            self.logger.info("Reset password page not opened. Current URL is = %s", self.lazy_url)
             return False
 
     def enter_password(self, password):
@@ -59,8 +57,10 @@ class ResetPasswordPage(BasePage):
             password: New password to set
             password_confirmation: Password confirmation
         """
-        self.enter_password(password)
-        self.enter_password_confirmation(password_confirmation)
+        self.fill_form({
+            ResetPasswordPageLocators.PASSWORD_FIELD: password,
+            ResetPasswordPageLocators.PASSWORD_CONFIRMATION_FIELD: password_confirmation,
+        })
         self.click_reset_button()
 
     def get_reset_error_message(self):
@@ -79,11 +79,10 @@ class ResetPasswordPage(BasePage):
             bool: True if redirection is successful, False otherwise
         """
         try:
-            self.wait.until(EC.url_to_be(Urls.LOGIN))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+            self.wait_for_navigation(Urls.LOGIN)
             self.logger.info("Successfully redirected to login page after password reset")
             return True
         except TimeoutException:
-            self.logger.info(f"Redirection to login page failed. Current URL is = {self.get_current_url()}")
+            self.logger.info("Redirection to login page failed. Current URL is = %s", self.lazy_url)
             return False
 
@@ -1,17 +1,71 @@
 from pages.base_page import BasePage
 from utils.locators.subscription_page_locators import SubscriptionPageLocators
 from utils.urls import Urls
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+# Lists every offer of the page (id, name and subscription button) in a single command
+OFFER_INDEX_SCRIPT = """
+const [formsXpath, idSelector, nameSelector, buttonSelector] = arguments;
+const forms = document.evaluate(formsXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const offers = [];
+for (let i = 0; i < forms.snapshotLength; i++) {
+    const form = forms.snapshotItem(i);
+    const id = form.querySelector(idSelector);
+    const name = form.querySelector(nameSelector);
+    offers.push({
+        id: id ? id.value : null,
+        name: name ? name.innerText.trim().toLowerCase() : '',
+        button: form.querySelector(buttonSelector)
+    });
+}
+return offers;
+"""
 
 
 class SubscriptionPage(BasePage):
     """Page object for the subscription page"""
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._offers = None
+
     def open(self):
         """Open the subscription page using the predefined URL"""
         self.open_url(Urls.SUBSCRIPTION)
 
+    def invalidate_element_cache(self):
+        """Forget the cached elements and the offer index."""
+        super().invalidate_element_cache()
+        self._offers = None
+
+    def get_offers(self) -> dict:
+        """
+        Index the offers displayed on the page, once per page load.
+
+        Returns:
+            dict: offer name (lowercase) -> {"id": int | None, "button": WebElement}
+        """
+        if self._offers is None:
+            locator = SubscriptionPageLocators.OFFER_FORMS
+            script_args = (
+                locator[1],
+                SubscriptionPageLocators.OFFER_ID_INPUT,
+                SubscriptionPageLocators.OFFER_NAME,
+                SubscriptionPageLocators.OFFER_BUTTON,
+            )
+            try:
+                offers = self.wait_until(lambda driver: driver.execute_script(OFFER_INDEX_SCRIPT, *script_args))
+            except TimeoutException:
+                offers = []
+            self._offers = {
+                offer["name"]: {
+                    "id": int(offer["id"]) if offer["id"] and offer["id"].isdigit() else None,
+                    "button": offer["button"],
+                }
+                for offer in offers if offer["name"]
+            }
+            self.logger.info("Offers found on the subscription page = %s", list(self._offers))
+        return self._offers
+
     def logout(self):
         """logging out"""
         menu= self.find_element(SubscriptionPageLocators.DROPDOWN_TOGGLE)
@@ -21,12 +75,11 @@ class SubscriptionPage(BasePage):
 
     def is_logout_successful(self):
         try:
-            self.wait.until(EC.url_to_be(Urls.LOGIN))
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            self.logger.info(f"Logout successful. Current URL is = '{self.get_current_url()}'")
+            self.wait_for_navigation(Urls.LOGIN)
+            self.logger.info("Logout successful. Current URL is = '%s'", self.lazy_url)
             return True
         except TimeoutException:
-            self.logger.info(f"Logout failed. Current URL is = '{self.get_current_url()}'")
+            self.logger.info("Logout failed. Current URL is = '%s'", self.lazy_url)
             return False
 
     def is_offer_present(self, offer_name: str) -> tuple[bool, int | None]:
@@ -40,15 +93,12 @@ class SubscriptionPage(BasePage):
             tuple: (True, index) if the offer exists, otherwise (False, None).
         """
         offer_name = offer_name.strip().lower()
-        for i in range(1, 5):
-            if self.is_element_present(SubscriptionPageLocators.offer_name[i]):
-                element = self.find_element(SubscriptionPageLocators.offer_name[i])
-                text = element.text.strip().lower()
-                if text == offer_name:
-                    self.logger.info(f"Offer '{offer_name}' found with index {i}.")
-                    return True, i
-
-        self.logger.info(f"Offer '{offer_name}' not found on the subscription page.")
+        offer = self.get_offers().get(offer_name)
+        if offer:
+            self.logger.info("Offer '%s' found with index %s.", offer_name, offer["id"])
+            return True, offer["id"]
+
+        self.logger.info("Offer '%s' not found on the subscription page.", offer_name)
         return False, None
 
     def select_offer(self, offer_name: str):
@@ -62,14 +112,23 @@ class SubscriptionPage(BasePage):
             ValueError: If the offer is not present on the page.
         """
         exists, index = self.is_offer_present(offer_name)
-        if exists and index:
-            self.logger.info(f"Selecting the offer '{offer_name}' at index {index}.")
-            button = self.find_element(SubscriptionPageLocators.offer_button[index])
-            self.click_element(button)
-        else:
-            self.logger.error(f"Offer '{offer_name}' not found. Cannot perform click.")
+        if not exists:
+            self.logger.error("Offer '%s' not found. Cannot perform click.", offer_name)
             raise ValueError(f"Offer '{offer_name}' not found. Cannot perform click.")
 
+        self.logger.info("Selecting the offer '%s' at index %s.", offer_name, index)
+        offer_key = offer_name.strip().lower()
+        try:
+            self.click_element(self.get_offers()[offer_key]["button"], expect_stale=True)
+        except StaleElementReferenceException:
+            self.logger.info("Offers re-rendered since they were indexed, indexing them again")
+            self.invalidate_element_cache()
+            offer = self.get_offers().get(offer_key)
+            if offer is None:
+                self.logger.error("Offer '%s' not found after the page was re-rendered.", offer_name)
+                raise ValueError(f"Offer '{offer_name}' not found after the page was re-rendered.")
+            self.click_element(offer["button"])
+
 
 
     def is_offer_selection_successful(self, offer_name: str) -> bool:
@@ -83,21 +142,20 @@ class SubscriptionPage(BasePage):
 
         try:
             if offer_name == "essai":
-                self.wait.until(EC.url_to_be(Urls.DASHBOARD))
-                self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-                self.logger.info(f"User redirected to dashboard after selecting 'essai'. "
-                                 f" Current URL is ='{self.get_current_url()}'")
+                self.wait_for_navigation(Urls.DASHBOARD)
+                self.logger.info("User redirected to dashboard after selecting 'essai'. "
+                                 " Current URL is ='%s'", self.lazy_url)
                 return True
             elif offer_name in ["standard", "medium", "premium"]:
-                self.wait.until(EC.url_contains("https://checkout.stripe.com"))
+                self.wait_for_navigation(lambda url: "https://checkout.stripe.com" in url)
                 self.logger.info(
-                    f"User redirected to Stripe checkout after selecting '{offer_name}'. "
-                    f"Current URL is = '{self.get_current_url()}'")
+                    "User redirected to Stripe checkout after selecting '%s'. Current URL is = '%s'",
+                    offer_name, self.lazy_url)
                 return True
             else:
-                self.logger.error(f"Unknown offer name = '{offer_name}'")
+                self.logger.error("Unknown offer name = '%s'", offer_name)
                 return False
         except TimeoutException:
-            self.logger.error(f"Redirection failed for offer '{offer_name}'. "
-                              f"Current URL is = '{self.get_current_url()}'")
+            self.logger.error("Redirection failed for offer '%s'. Current URL is = '%s'",
+                              offer_name, self.lazy_url)
             return False
@@ -1,8 +1,33 @@
 import logging
 import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
+from pages.dashboard_page import DashboardPage
 from pages.register_company_page import RegisterCompanyPage
 from pages.register_page import RegisterPage
+from pages.subscription_page import SubscriptionPage
+from utils.browser_state import capture_browser_state, restore_browser_state
+from utils.config import PROVISIONING_MODE, ACCOUNT_POOL_LEASE_TIMEOUT, BROWSER_STATE_MAX_AGE
+from utils.driver_pool import DriverPool
+from utils.network_index import url_matches
+from utils.provisioning import AccountProvisioner, ProvisioningError
+from utils.urls import Urls
+
+# Account type (utils/account_pool.py) of each account fixture, used to size the account pool
+ACCOUNT_FIXTURES = {
+    "register_user_fixture": "user",
+    "register_user_and_company_fixture": "company",
+    "register_subscribed_user_fixture": "subscribed",
+}
+# Fixtures restoring a browser state snapshot: one account per type is enough
+SHARED_ACCOUNT_FIXTURES = {
+    "user_session_fixture": "user",
+    "company_session_fixture": "company",
+    "subscribed_session_fixture": "subscribed",
+}
+# Page the UI flow of each account type ends on
+ACCOUNT_PAGES = {"user": RegisterCompanyPage, "company": SubscriptionPage, "subscribed": DashboardPage}
+ACCOUNT_URLS = {"user": Urls.REGISTER_COMPANY, "company": Urls.SUBSCRIPTION, "subscribed": Urls.DASHBOARD}
 
 
 class BaseTest:
@@ -27,28 +52,176 @@ class BaseTest:
         yield
 
         self.logger.info(f"Finished test: {test_name}")
+
+    def _open_account_page(self, account_type: str) -> bool:
+        """
+        Open the page the UI flow ends on for this account type.
+        Returns:
+            False if the SUT redirected elsewhere (session rejected)
+        """
+        page = ACCOUNT_PAGES[account_type](self.driver)
+        page.open()
+        return url_matches(page.get_current_url(), ACCOUNT_URLS[account_type])
+
+    def _account_data(self, account_type: str, user_data: dict, company_data: dict):
+        return user_data if account_type == "user" else (user_data, company_data)
+
+    def _lease_account(self, request, account_pool, account_type: str):
+        """
+        Lease a pre-provisioned account and hand its session to the browser.
+        Returns:
+            The fixture data, or None on a pool miss or if the session was rejected.
+        """
+        if account_pool is None:
+            return None
+        account, outcome, waited = account_pool.lease(account_type, ACCOUNT_POOL_LEASE_TIMEOUT)
+        request.node.account_lease = {"type": account_type, "outcome": outcome, "wait": waited}
+        if account is None:
+            self.logger.info(f"No pooled '{account_type}' account left, provisioning one")
+            return None
         try:
-            self.driver.quit()
-        except Exception as e:
-            self.logger.info(
-                f"The browser was already closed or an error occurred | {str(e)}")
+            account["provisioner"].to_browser(self.driver)
+            if self._open_account_page(account_type):
+                self.logger.info(f"Leased pooled '{account_type}' account = '{account['user_data']['email']}'")
+                return self._account_data(account_type, account["user_data"], account["company_data"])
+            self.logger.warning(f"Pooled '{account_type}' account session was rejected, provisioning one")
+        except (TimeoutException, WebDriverException) as e:
+            self.logger.warning(f"Failed to use the pooled '{account_type}' account, provisioning one | {str(e)}")
+        finally:
+            account["provisioner"].close()
+        self.driver.delete_all_cookies()
+        return None
+
+    def _provision_over_http(self, account_type: str):
+        """
+        Create the account over HTTP, then open the page the UI flow would end on
+        with the authenticated session.
+        Returns:
+            The fixture data, or None if HTTP provisioning failed (the caller falls back to the UI).
+        """
+        provisioner = AccountProvisioner()
+        try:
+            user_data = provisioner.register_user()
+            company_data = provisioner.register_company() if account_type != "user" else None
+            if account_type == "subscribed":
+                provisioner.subscribe("essai")
+            provisioner.to_browser(self.driver)
+            if self._open_account_page(account_type):
+                return self._account_data(account_type, user_data, company_data)
+            self.logger.warning("HTTP provisioned session was rejected, falling back to the UI")
+        except (ProvisioningError, TimeoutException, WebDriverException) as e:
+            self.logger.warning(f"HTTP provisioning failed, falling back to the UI | {str(e)}")
+        finally:
+            provisioner.close()
+        self.driver.delete_all_cookies()
+        return None
+
+    def _provision(self, request, account_pool, account_type: str):
+        """Pooled account first, then an account created over HTTP (None: the fixture drives the UI)."""
+        if PROVISIONING_MODE != "http":
+            return None
+        return self._lease_account(request, account_pool, account_type) or self._provision_over_http(account_type)
+
+    def _create_account(self, request, account_pool, account_type: str):
+        """Create an account of the given type: pooled, over HTTP, else through the UI."""
+        provisioned = self._provision(request, account_pool, account_type)
+        if provisioned:
+            return provisioned
+
+        if account_type == "user":
+            # Step 1: User registration
+            register_page = RegisterPage(self.driver)
+            register_page.open()
+            user_data = register_page.register_valid_user()
+            assert register_page.is_registration_successful(), (
+                "Initial user registration failed.\n"
+                "Therefore, test cannot proceed."
+            )
+            return user_data
+
+        user_data, company_data = self._register_user_and_company_over_ui()
+        if account_type == "subscribed":
+            subscription_page = SubscriptionPage(self.driver)
+            subscription_page.select_offer("essai")
+            assert subscription_page.is_offer_selection_successful("essai"), (
+                "Subscription to the 'essai' offer failed.\n"
+                "Therefore, test cannot proceed."
+            )
+        return user_data, company_data
+
+    def _restore_or_create_account(self, request, account_pool, browser_state_store, account_type: str):
+        """
+        Restore the browser state snapshot of the account type, or create an account and snapshot it.
+        A snapshot the SUT rejects (redirection away from the expected page) is invalidated.
+        """
+        expected_url = ACCOUNT_URLS[account_type]
+        snapshot = browser_state_store.get(account_type)
+        if snapshot is not None:
+            try:
+                restore_browser_state(self.driver, snapshot, expected_url)
+                if url_matches(self.driver.current_url, expected_url):
+                    request.node.browser_state = "restored"
+                    self.logger.info(f"Browser state restored = '{account_type}'")
+                    return snapshot.data
+                self.logger.warning(
+                    f"Browser state snapshot rejected = '{account_type}', "
+                    f"redirected to = '{self.driver.current_url}'"
+                )
+            except (TimeoutException, WebDriverException) as e:
+                self.logger.warning(f"Failed to restore the browser state = '{account_type}' | {str(e)}")
+            browser_state_store.invalidate(account_type)
+            request.node.browser_state = "rejected"
+            DriverPool.reset(self.driver)
+
+        data = self._create_account(request, account_pool, account_type)
+        if url_matches(self.driver.current_url, expected_url):
+            browser_state_store.put(
+                account_type, capture_browser_state(self.driver, data, BROWSER_STATE_MAX_AGE)
+            )
+            if not getattr(request.node, "browser_state", None):
+                request.node.browser_state = "captured"
+        return data
 
     @pytest.fixture
-    def register_user_fixture(self):
+    def register_user_fixture(self, request, account_pool):
         """Fixture to create a valid user."""
-        # Step 1: User registration
-        register_page = RegisterPage(self.driver)
-        register_page.open()
-        user_data = register_page.register_valid_user()
-        assert register_page.is_registration_successful(), (
-            "Initial user registration failed.\n"
-            "Therefore, test cannot proceed."
-        )
-        return user_data
+        return self._create_account(request, account_pool, "user")
 
     @pytest.fixture
-    def register_user_and_company_fixture(self):
+    def register_user_and_company_fixture(self, request, account_pool):
         """ fixture to create a valid user and a valid company."""
+        return self._create_account(request, account_pool, "company")
+
+    @pytest.fixture
+    def register_subscribed_user_fixture(self, request, account_pool):
+        """Fixture to create a valid user and company subscribed to the 'essai' offer (ends on the dashboard)."""
+        return self._create_account(request, account_pool, "subscribed")
+
+    @pytest.fixture
+    def user_session_fixture(self, request, account_pool, browser_state_store):
+        """
+        Authenticated session of a user without a company, on the company registration page.
+        The account is shared with other tests: the test must not register its company or log out.
+        """
+        return self._restore_or_create_account(request, account_pool, browser_state_store, "user")
+
+    @pytest.fixture
+    def company_session_fixture(self, request, account_pool, browser_state_store):
+        """
+        Authenticated session of a user with a company, on the subscription page.
+        The account is shared with other tests: the test must not modify it or log out.
+        """
+        return self._restore_or_create_account(request, account_pool, browser_state_store, "company")
+
+    @pytest.fixture
+    def subscribed_session_fixture(self, request, account_pool, browser_state_store):
+        """
+        Authenticated session of a user subscribed to the 'essai' offer, on the dashboard.
+        The account is shared with other tests: the test must not modify it or log out.
+        """
+        return self._restore_or_create_account(request, account_pool, browser_state_store, "subscribed")
+
+    def _register_user_and_company_over_ui(self):
         # Step 1: User registration
         register_page = RegisterPage(self.driver)
         register_page.open()
@@ -69,7 +242,3 @@ class BaseTest:
         )
 
         return user_data, company_data
-
-
-
-
@@ -0,0 +1,70 @@
+import statistics
+import pytest
+from benchmarks.page_load import METRICS, find_regressions, load_results, measure_page_load, save_results
+from pages.base_page import BasePage
+from tests.base_test import BaseTest
+from utils.config import PAGE_LOAD_BASELINE_VERSION, PAGE_LOAD_ITERATIONS, PAGE_LOAD_WARMUP, SUT_VERSION
+from utils.network_index import url_matches
+from utils.urls import Urls
+
+# Benchmarked Urls entries and the account each page needs (None, "user", "company" or "subscribed")
+BENCHMARK_PAGES = {
+    "LOGIN": None,
+    "CREATE_ACCOUNT": None,
+    "FORGOT_PASSWORD": None,
+    "REGISTER_COMPANY": "user",
+    "SUBSCRIPTION": "company",
+    "DASHBOARD": "subscribed",
+}
+# The benchmark only loads the pages: the accounts are shared snapshots
+ACCOUNT_FIXTURES = {
+    "user": "user_session_fixture",
+    "company": "company_session_fixture",
+    "subscribed": "subscribed_session_fixture",
+}
+CACHE_VARIANTS = ("cold", "warm")
+
+
+@pytest.mark.benchmark
+class TestPageLoad(BaseTest):
+
+    @pytest.mark.parametrize("page_name", BENCHMARK_PAGES)
+    def test_page_load(self, request, page_name):
+        """Benchmark the page load times (cold and warm cache) against the baseline version"""
+        account = BENCHMARK_PAGES[page_name]
+        if account:
+            request.getfixturevalue(ACCOUNT_FIXTURES[account])
+        url = getattr(Urls, page_name)
+        page = BasePage(self.driver)
+        baseline = load_results(PAGE_LOAD_BASELINE_VERSION).get(page_name, {}) if PAGE_LOAD_BASELINE_VERSION else {}
+
+        for _ in range(PAGE_LOAD_WARMUP):
+            self._measure(page, url, cold=True)
+
+        regressions = []
+        for variant in CACHE_VARIANTS:
+            samples = {metric: [] for metric in METRICS}
+            for _ in range(PAGE_LOAD_ITERATIONS):
+                timing = self._measure(page, url, cold=variant == "cold")
+                for metric in METRICS:
+                    samples[metric].append(timing[metric])
+            save_results(SUT_VERSION, page_name, variant, samples)
+            self.logger.info(
+                f"{page_name} ({variant} cache): "
+                + ", ".join(f"{metric} = {statistics.median(values):.0f} ms" for metric, values in samples.items())
+            )
+            if variant in baseline:
+                regressions.extend(f"{variant} cache {regression}" for regression in find_regressions(samples, baseline[variant]))
+
+        assert not regressions, (
+            f"PAGE LOAD REGRESSION ON {page_name}\n "
+            f"Baseline = V{PAGE_LOAD_BASELINE_VERSION}, Current = V{SUT_VERSION}\n"
+            + "\n".join(regressions)
+        )
+
+    @staticmethod
+    def _measure(page, url, cold):
+        timing = measure_page_load(page, url, cold)
+        if not url_matches(timing["url"], url):
+            pytest.skip(f"'{url}' redirects to '{timing['url']}' for this account")
+        return timing
@@ -0,0 +1,42 @@
+import time
+import pytest
+from benchmarks.mail_latency import latency_summary, load_latencies, save_latencies
+from pages.forgot_password_page import ForgotPasswordPage
+from pages.register_page import RegisterPage
+from tests.base_test import BaseTest
+from tests.reset_password_tests.reset_password_helper import ResetPasswordHelper
+from utils.config import MAIL_BACKEND, MAIL_BENCHMARK_ITERATIONS
+from utils.users import ResetPasswordData, ValidUserData
+
+
+@pytest.mark.mail_benchmark
+class TestResetEmailLatency(BaseTest):
+
+    def test_reset_email_latency(self):
+        """Measure the reset email latency of the current mail backend and compare it with the stored backends"""
+        email = ResetPasswordData.generate_test_email()
+        register_page = RegisterPage(self.driver)
+        register_page.open()
+        register_page.register(
+            ValidUserData.VALID_FIRSTNAME,
+            ValidUserData.VALID_LASTNAME,
+            email,
+            ValidUserData.VALID_PASSWORD,
+            ValidUserData.VALID_PASSWORD
+        )
+        assert register_page.is_registration_successful(), (
+            "Initial user registration failed.\n"
+            "Therefore, test cannot proceed."
+        )
+
+        forgot_password_page = ForgotPasswordPage(self.driver)
+        samples = []
+        for _ in range(MAIL_BENCHMARK_ITERATIONS):
+            forgot_password_page.open()
+            start = time.perf_counter()
+            reset_link_future = ResetPasswordHelper.request_password_reset(forgot_password_page, email)
+            ResetPasswordHelper.wait_for_reset_link(reset_link_future, email)
+            samples.append(time.perf_counter() - start)
+
+        save_latencies(MAIL_BACKEND, samples)
+        self.logger.info("Reset email latency per backend:\n" + "\n".join(latency_summary(load_latencies())))
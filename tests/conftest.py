@@ -2,17 +2,55 @@
 This module configures the pytest testing environment for Selenium-based automated tests.
 """
 import os
+import re
 import json
 import pytest
 import logging
+import time
+import base64
 import hashlib
+import math
+from collections import deque
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from utils import driver_resolver
+from utils.driver_pool import DriverPool
+from utils.network_index import NetworkIndex
+from utils.network_budgets import check_network_budgets
+from utils.har import build_har, write_har, write_waterfall
+from utils.artifact_writer import ArtifactWriter
+from pages.base_page import BasePage
+from utils.lazy_logging import LazyValue
+from utils.step_timeline import StepTimeline, STEP_CATEGORIES, percentile, render_timeline
+from utils.test_durations import load_durations, save_durations, predict_durations, lpt_makespan
+from utils.web_vitals import install_web_vitals, collect_web_vitals, worst_values, p75, format_vitals
+from utils.mailbox import close_shared_mail_backend
+from utils.account_pool import AccountPool
+from utils.browser_state import BrowserStateStore
+from tests.base_test import ACCOUNT_FIXTURES, SHARED_ACCOUNT_FIXTURES
 from utils.config import (
     BROWSER,
     HEADLESS,
+    DRIVER_POOL_ENABLED,
+    DRIVER_POOL_SIZE,
+    DRIVER_POOL_MAX_TESTS,
+    NETWORK_BUDGETS_ENABLED,
+    NETWORK_BUDGETS_ENFORCED,
+    ARTIFACT_WRITER_THREADS,
+    MEMORY_LOG_CAPACITY,
+    WEB_VITALS_ENABLED,
+    WEB_VITALS_DIR,
+    TEST_DURATIONS_FILE,
+    TEST_DURATIONS_SMOOTHING,
+    FAILED_FIRST,
+    CIRCUIT_BREAKER_THRESHOLD,
+    MAIL_BACKEND,
+    PROVISIONING_MODE,
+    ACCOUNT_POOL_ENABLED,
+    ACCOUNT_POOL_WORKERS,
+    SUT,
+    SUT_VERSION,
     SCREENSHOT_DIR,
     LOGS_DIR,
     NETWORK_LOGS_DIR,
@@ -27,6 +65,36 @@ TIMESTAMP = datetime.now().strftime("%Y_%m_%d_T%H_%M")
 REPORT_FILENAME = f"report_{TIMESTAMP}.html"
 REPORT_PATH = os.path.join(REPORT_DIR, REPORT_FILENAME)
 TEST_RESULTS = {"passed": 0, "failed": 0, "total": 0}
+TIMED_OUT_WAITS = {}  # nodeid -> (count, seconds) of explicit waits that timed out
+NETWORK_BUDGET_VIOLATIONS = {}  # nodeid -> list of network budget violations
+ARTIFACT_CAPTURE_TIMES = {}  # nodeid -> seconds spent capturing artifacts on the test thread
+ARTIFACT_WRITER = ArtifactWriter(max_workers=ARTIFACT_WRITER_THREADS)
+STEP_DURATIONS = {"action": {}, "page": {}, "category": {}}  # key -> list of step durations (seconds)
+WEB_VITALS = {}  # nodeid -> metrics of each page visited by the test
+RECORDED_DURATIONS = {}  # nodeid -> duration recorded by the previous runs (seconds)
+MEASURED_DURATIONS = {}  # nodeid -> duration of the test in this run, all phases (seconds)
+EXECUTED_TESTS = set()  # nodeids whose test body ran (skipped tests are not recorded)
+# Circuit breaker: setup failures raised by the same fixture with a normalized signature (per process)
+SETUP_FAILURES = {}  # signature ("<fixture>: <message>") -> number of failed tests
+OPEN_CIRCUIT_BREAKERS = {}  # signature -> fixture that raised (the tests using it are skipped)
+# Fixtures used by every browser test: their failures never open a circuit breaker
+GENERIC_FIXTURES = {
+    "setup", "setup_webdriver", "driver_pool", "setup_memory_logging", "network_index",
+    "account_pool", "browser_state_store", "request",
+}
+CIRCUIT_BREAKER_SKIPS = {}  # signature -> number of tests skipped (collected from the reports)
+SIGNATURE_PATTERNS = (
+    (re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+"), "<email>"),
+    (re.compile(r"0x[0-9a-fA-F]+"), "<hex>"),
+    (re.compile(r"\d+"), "<n>"),
+    (re.compile(r"\s+"), " "),
+)
+WORKER_STATS = {}  # worker id -> {"tests", "start", "stop"} (epoch seconds)
+DRIVER_RESOLUTION_TIMES = {}  # worker id -> chromedriver resolution time in seconds (collected from the reports)
+ACCOUNT_POOL = None  # Pre-provisioned accounts of this process, sized from the collected tests
+ACCOUNT_LEASES = {}  # account type -> {"hit", "wait", "miss", "wait_time"} (collected from the reports)
+BROWSER_STATE_STORE = BrowserStateStore()
+BROWSER_STATES = {}  # "restored" | "captured" | "rejected" -> number of tests (collected from the reports)
 USING_XDIST = False
 logger = logging.getLogger(__name__)
 
@@ -37,21 +105,46 @@ logger = logging.getLogger(__name__)
 class MemoryLogHandler(logging.Handler):
     """
     Stores test execution logs in memory.
+    Keeps the latest raw records (bounded per test) and only formats them
+    when the test fails. ERROR records are also indexed for the failure message.
     """
 
-    def __init__(self):
+    def __init__(self, capacity: int = MEMORY_LOG_CAPACITY):
         super().__init__()
-        self.log_records = []
+        self.log_records = deque(maxlen=capacity)
+        self.error_records = deque(maxlen=capacity)
+        self.dropped = 0
         self.formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
     def emit(self, record):
-        self.log_records.append(self.formatter.format(record))
+        # Lazy values (current URL, page title) are only valid now, not when the test has failed
+        if isinstance(record.args, tuple) and any(isinstance(arg, LazyValue) for arg in record.args):
+            record.args = tuple(str(arg) if isinstance(arg, LazyValue) else arg for arg in record.args)
+        if len(self.log_records) == self.log_records.maxlen:
+            self.dropped += 1
+        self.log_records.append(record)
+        if record.levelno >= logging.ERROR:
+            self.error_records.append(record)
+
+    def get_records(self):
+        """Raw records, oldest first."""
+        return list(self.log_records)
+
+    def format_records(self, records, dropped: int = 0):
+        lines = [f"... {dropped} earlier log records dropped"] if dropped else []
+        lines.extend(self.formatter.format(record) for record in records)
+        return lines
 
     def get_logs(self):
-        return self.log_records
+        return self.format_records(self.log_records, self.dropped)
+
+    def get_error_messages(self):
+        return [record.getMessage() for record in self.error_records]
 
     def clear(self):
-        self.log_records = []
+        self.log_records.clear()
+        self.error_records.clear()
+        self.dropped = 0
 
 # ------------------------------------------------
 # Directory Setup and Configuration
@@ -71,10 +164,28 @@ def pytest_configure(config):
     else:
         USING_XDIST = False
 
+    # The SUT relays every email to one SMTP address, which only one process can listen on
+    if USING_XDIST and MAIL_BACKEND == "smtp":
+        raise pytest.UsageError(
+            "MAIL_BACKEND=smtp cannot be used with pytest-xdist (-n): the SUT delivers its emails to a single SMTP sink"
+        )
+
     # Output directories creation
-    for directory in [REPORT_DIR, SCREENSHOT_DIR, LOGS_DIR, NETWORK_LOGS_DIR]:
+    for directory in [REPORT_DIR, SCREENSHOT_DIR, LOGS_DIR, NETWORK_LOGS_DIR, WEB_VITALS_DIR]:
         os.makedirs(directory, exist_ok=True)
 
+    config.addinivalue_line(
+        "markers", "fresh_browser: run the test in a dedicated browser instead of a pooled one"
+    )
+    config.addinivalue_line(
+        "markers", "benchmark: page-load benchmark, only run with --page-load-benchmark"
+    )
+    config.addinivalue_line(
+        "markers", "mail_benchmark: reset email latency benchmark, only run with --mail-benchmark"
+    )
+
+    RECORDED_DURATIONS.update(load_durations(TEST_DURATIONS_FILE))
+
     config.option.htmlpath = REPORT_PATH
     logger.info(f"Report will be generated at: {REPORT_PATH}")
 
@@ -91,11 +202,111 @@ def pytest_configure(config):
     root_logger.setLevel(logging.INFO)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--page-load-benchmark", action="store_true", default=False,
+        help="Run the page-load benchmark tests (marked with @pytest.mark.benchmark)"
+    )
+    parser.addoption(
+        "--mail-benchmark", action="store_true", default=False,
+        help="Run the reset email latency benchmark of MAIL_BACKEND (marked with @pytest.mark.mail_benchmark)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips the benchmark tests unless the benchmark mode is enabled.
+    On xdist workers, sorts the tests longest first (durations recorded by the previous runs):
+    the load scheduler then hands out the long tests first and fills the gaps with the short ones.
+    Tests that failed in the last run come first.
+    """
+    if not config.getoption("--page-load-benchmark"):
+        skip_benchmark = pytest.mark.skip(reason="Page-load benchmark (run with --page-load-benchmark)")
+        for item in items:
+            if item.get_closest_marker("benchmark"):
+                item.add_marker(skip_benchmark)
+    if not config.getoption("--mail-benchmark"):
+        skip_mail_benchmark = pytest.mark.skip(reason="Reset email latency benchmark (run with --mail-benchmark)")
+        for item in items:
+            if item.get_closest_marker("mail_benchmark"):
+                item.add_marker(skip_mail_benchmark)
+
+    # Every worker collects the same file, so all of them agree on the order
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        predicted = predict_durations([item.nodeid for item in items], RECORDED_DURATIONS)
+        items.sort(key=lambda item: predicted[item.nodeid], reverse=True)
+
+    cache = getattr(config, "cache", None)
+    last_failed = cache.get("cache/lastfailed", {}) if FAILED_FIRST and cache else {}
+    if last_failed:
+        items.sort(key=lambda item: item.nodeid not in last_failed)  # Stable: keeps the order inside each group
+
+
+def pytest_collection_finish(session):
+    """
+    Starts filling the account pool, then resolves the chromedriver binary once before any browser test runs.
+    With xdist, each worker goes through the shared file-locked cache,
+    so only the first one actually resolves the driver.
+    """
+    if session.config.option.collectonly:
+        return
+    if ACCOUNT_POOL_ENABLED and PROVISIONING_MODE == "http":
+        _start_account_pool(session.items)
+    needs_browser = any(
+        "setup_webdriver" in getattr(item, "fixturenames", ()) and not item.get_closest_marker("skip")
+        for item in session.items
+    )
+    if needs_browser and BROWSER.lower() == "chrome":
+        driver_resolver.resolve_chromedriver()
+
+
+def _start_account_pool(items):
+    """
+    Creates the pool with one account per collected test using an account fixture.
+    With xdist, every worker collects all the tests but only runs its share of them.
+    """
+    global ACCOUNT_POOL
+    needed = {}
+    shared = set()
+    for item in items:
+        if item.get_closest_marker("skip"):
+            continue
+        for fixture_name, account_type in ACCOUNT_FIXTURES.items():
+            if fixture_name in getattr(item, "fixturenames", ()):
+                needed[account_type] = needed.get(account_type, 0) + 1
+        for fixture_name, account_type in SHARED_ACCOUNT_FIXTURES.items():
+            if fixture_name in getattr(item, "fixturenames", ()):
+                shared.add(account_type)
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    targets = {account_type: math.ceil(count / workers) for account_type, count in needed.items()}
+    # The shared session fixtures need a single account per worker, then restore its snapshot
+    for account_type in shared:
+        targets[account_type] = targets.get(account_type, 0) + 1
+    if targets:
+        ACCOUNT_POOL = AccountPool(targets, workers=ACCOUNT_POOL_WORKERS)
+        ACCOUNT_POOL.start()
+
+
+@pytest.fixture(scope="session")
+def account_pool():
+    """
+    Pre-provisioned accounts leased by the account fixtures of BaseTest
+    (None when the pool is disabled or no collected test needs an account).
+    """
+    return ACCOUNT_POOL
+
+
+@pytest.fixture(scope="session")
+def browser_state_store():
+    """
+    Browser state snapshots of the shared session fixtures of BaseTest (one store per xdist worker).
+    """
+    return BROWSER_STATE_STORE
+
 # ------------------------------------------------
 # WebDriver Setup
 # ------------------------------------------------
-@pytest.fixture
-def setup_webdriver():
+def _create_driver():
     """
     Initializes a browser instance with configured options,
     including network traffic logging capabilities.
@@ -124,12 +335,55 @@ def setup_webdriver():
         options.add_argument("--disable-accelerated-2d-canvas")
 
         # Create Chrome driver
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        driver = webdriver.Chrome(service=Service(driver_resolver.resolve_chromedriver()), options=options)
+        if WEB_VITALS_ENABLED:
+            install_web_vitals(driver)
+        return driver
+
+    raise ValueError(f"Unsupported browser: {BROWSER}")
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    Session-wide pool of warm browsers (one pool per xdist worker).
+    """
+    pool = DriverPool(_create_driver, size=DRIVER_POOL_SIZE, max_tests=DRIVER_POOL_MAX_TESTS)
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture
+def setup_webdriver(request, driver_pool):
+    """
+    Provides a browser instance for the test.
+    A pooled browser is leased and reset afterwards, unless pooling is disabled
+    or the test is marked with @pytest.mark.fresh_browser.
+    """
+    fresh_browser = not DRIVER_POOL_ENABLED or request.node.get_closest_marker("fresh_browser")
+
+    if fresh_browser:
+        driver = _create_driver()
+        yield driver
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.info(f"The browser was already closed or an error occurred | {str(e)}")
     else:
-        raise ValueError(f"Unsupported browser: {BROWSER}")
+        driver = driver_pool.acquire()
+        yield driver
+        driver_pool.release(driver)
 
 
-    yield driver
+@pytest.fixture
+def network_index(request):
+    """
+    Network traffic of the current test.
+    Call `network_index.collect(self.driver)` to index the latest requests before querying it.
+    """
+    return request.node.network_index
 
 # ------------------------------------------------
 # Test Logging Functions - Using Memory Handler
@@ -189,82 +443,86 @@ def _get_artifact_path(base_dir, test_name, extension):
 
     return file_path, rel_path
 
+def _write_memory_logs(log_path, handler, log_records, dropped):
+    with open(log_path, 'w', encoding='utf-8') as f:
+        for line in handler.format_records(log_records, dropped):
+            f.write(f"{line}\n")
+
 def _save_memory_logs(log_path):
     """
-     Saves in-memory test execution logs to disk.
+     Saves in-memory test execution logs to disk (written in the background).
      """
     try:
         if hasattr(pytest, 'memory_log_handler'):
-            log_records = pytest.memory_log_handler.get_logs()
-            with open(log_path, 'w', encoding='utf-8') as f:
-                for record in log_records:
-                    f.write(f"{record}\n")
-            logger.info(f"Test logs saved: {log_path}")
+            handler = pytest.memory_log_handler
+            # Records are formatted by the background writer
+            ARTIFACT_WRITER.submit(_write_memory_logs, log_path, handler, handler.get_records(), handler.dropped)
             return True
         return False
     except Exception as e:
         logger.error(f"Failed to save test logs: {e}")
         return False
 
+def _write_screenshot(screenshot_path, screenshot_base64):
+    with open(screenshot_path, 'wb') as f:
+        f.write(base64.b64decode(screenshot_base64))
+
 def _capture_screenshot(item, screenshot_path):
-    """Capture screenshot for failed test."""
+    """Capture screenshot for failed test (decoded and written in the background)."""
     try:
-        item.instance.driver.save_screenshot(screenshot_path)
-        logger.info(f"Screenshot saved: {screenshot_path}")
+        screenshot = item.instance.driver.get_screenshot_as_base64()
+        ARTIFACT_WRITER.submit(_write_screenshot, screenshot_path, screenshot)
         return True
     except Exception as e:
         logger.error(f"Failed to capture screenshot: {e}")
         return False
 
-def capture_network_logs(driver, output_path):
-    """Capture and enrich network requests and responses."""
-    logs = driver.get_log('performance')
-    network_data = {}
-    enriched_logs = []
-    for entry in logs:
+def _write_network_logs(output_path, waterfall_path, har):
+    write_har(har, output_path)
+    if waterfall_path:
+        write_waterfall(har, waterfall_path, title=os.path.basename(output_path))
+
+def capture_network_logs(network_index, output_path, waterfall_path=None):
+    """
+    Build the HAR 1.2 log of the indexed network traffic and schedule
+    writing it (and optionally its waterfall view) in the background.
+    """
+    har = build_har(network_index)
+    ARTIFACT_WRITER.submit(_write_network_logs, output_path, waterfall_path, har)
+
+def _collect_network_index(item):
+    """
+    Index the performance log entries the browser recorded since the last collection.
+    """
+    index = getattr(item, "network_index", None)
+    if index is None:
+        index = item.network_index = NetworkIndex()
+    driver = getattr(getattr(item, "instance", None), "driver", None)
+    if driver is not None:
         try:
-            log_data = json.loads(entry['message'])
-            message = log_data.get('message', {})
-            method = message.get('method', '')
-            params = message.get('params', {})
-            if method == 'Network.requestWillBeSent':
-                request_id = params.get('requestId')
-                request = params.get('request', {})
-                network_data[request_id] = {
-                    "url": request.get('url'),
-                    "method": request.get('method'),
-                    "type": "request",
-                    "request_headers": request.get('headers'),
-                    "postData": request.get('postData', ''),
-                    "timestamp": params.get('timestamp')
-                }
-            elif method == 'Network.responseReceived':
-                request_id = params.get('requestId')
-                response = params.get('response', {})
-                if request_id in network_data:
-                    network_data[request_id]["type"] = "response"
-                    network_data[request_id]["status"] = response.get('status')
-                    network_data[request_id]["response_headers"] = response.get('headers')
-                    network_data[request_id]["mimeType"] = response.get('mimeType')
-
-
-        except json.JSONDecodeError:
-            continue
-        # Format as a list
-    for entry in network_data.values():
-        enriched_logs.append(entry)
+            index.collect(driver)
+        except Exception as e:
+            logger.warning(f"Failed to read the performance log: {e}")
+    return index
 
-        # Write to a JSON file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(enriched_logs, f, indent=2, ensure_ascii=False)
+def _collect_web_vitals(item):
+    """
+    Collect the Core Web Vitals of the pages visited by the test.
+    """
+    driver = getattr(getattr(item, "instance", None), "driver", None)
+    if not WEB_VITALS_ENABLED or driver is None:
+        return
+    try:
+        item.web_vitals = collect_web_vitals(driver, since=getattr(item, "start_time", None))
+    except Exception as e:
+        logger.warning(f"Failed to collect the Web Vitals: {e}")
 
-def _capture_network_logs(item, network_log_path):
+def _capture_network_logs(item, network_log_path, waterfall_path):
     """
-    Capture network logs for failed test.
+    Capture network logs (HAR) and waterfall for failed test.
     """
     try:
-        capture_network_logs(item.instance.driver, network_log_path)
-        logger.info(f"Network logs saved: {network_log_path}")
+        capture_network_logs(_collect_network_index(item), network_log_path, waterfall_path)
         return True
     except Exception as e:
         logger.error(f"Failed to capture network logs: {e}")
@@ -272,13 +530,14 @@ def _capture_network_logs(item, network_log_path):
 
 def capture_test_artifacts(item, report):
     """
-       Collects diagnostic data for failed tests
+       Collects diagnostic data for failed tests.
+       Only the driver reads happen here, files are encoded and written by ARTIFACT_WRITER.
     """
     if not (hasattr(item, 'instance') and hasattr(item.instance, 'driver')):
         logger.warning(f"Test instance or driver not found for {item.nodeid}")
         return
 
-
+    start_time = time.perf_counter()
     test_name = _get_test_name(item)
 
     links_html = "<div class='links-col'>"
@@ -301,14 +560,21 @@ def capture_test_artifacts(item, report):
 
     # Network Logs
     network_path, network_rel_path = _get_artifact_path(
-        NETWORK_LOGS_DIR, test_name, "json"
+        NETWORK_LOGS_DIR, test_name, "har"
+    )
+    waterfall_path, waterfall_rel_path = _get_artifact_path(
+        NETWORK_LOGS_DIR, test_name, "html"
     )
-    network_captured = _capture_network_logs(item, network_path)
+    network_captured = _capture_network_logs(item, network_path, waterfall_path)
     if network_captured:
-        links_html += f'<a href="{network_rel_path}" target="_blank">Network Logs</a><br>'
+        links_html += f'<a href="{network_rel_path}" target="_blank">Network Logs (HAR)</a><br>'
+        links_html += f'<a href="{waterfall_rel_path}" target="_blank">Waterfall</a><br>'
 
+    report.artifact_capture_time = time.perf_counter() - start_time
+    links_html += f"<small>Captured in {report.artifact_capture_time:.2f}s</small>"
     links_html += "</div>"
     report.sections.append(("Test Artifacts", links_html))
+    logger.info(f"Artifacts captured in {report.artifact_capture_time:.3f}s = '{test_name}'")
 
 
 def _extract_failure_message(report):
@@ -327,10 +593,8 @@ Returns:
 
     # Collect ERROR logs from in-memory logging
     if hasattr(pytest, 'memory_log_handler'):
-        for log in pytest.memory_log_handler.get_logs():
-            if 'ERROR' in log:
-                clean_msg = log.split(' - ')[-1].strip()
-                error_messages.append(clean_msg)
+        for message in pytest.memory_log_handler.get_error_messages():
+            error_messages.append(message.strip())
 
     if error_messages:
         return "\n".join(error_messages)
@@ -361,9 +625,96 @@ Returns:
 
     return ""
 
+def _failure_signature(failure_message):
+    """
+    Normalizes a failure message so that the same breakage gives the same signature
+    (generated emails, numbers and whitespace removed).
+    """
+    signature = failure_message.strip()
+    for pattern, replacement in SIGNATURE_PATTERNS:
+        signature = pattern.sub(replacement, signature)
+    return signature[:300]
+
+def _failing_fixture(item, excinfo):
+    """
+    Name of the fixture that raised during the setup of the item: the innermost fixture
+    of the traceback (the fixtures of this project are named after their function).
+    Returns None for generic fixtures and for failures outside of any fixture.
+    """
+    if excinfo is None:
+        return None
+    for entry in reversed(excinfo.traceback):
+        if entry.name in item.fixturenames:
+            return None if entry.name in GENERIC_FIXTURES else entry.name
+    return None
+
+def _record_setup_failure(item, report, failure_message, excinfo):
+    """
+    Counts the setup failures per fixture that raised and normalized failure message.
+    Once CIRCUIT_BREAKER_THRESHOLD tests failed the same way, the tests using that fixture are skipped.
+    """
+    if not CIRCUIT_BREAKER_THRESHOLD:
+        return
+    fixture = _failing_fixture(item, excinfo)
+    if fixture is None:
+        return
+    signature = f"{fixture}: {_failure_signature(failure_message or str(report.longrepr))}"
+    SETUP_FAILURES[signature] = SETUP_FAILURES.get(signature, 0) + 1
+    if SETUP_FAILURES[signature] >= CIRCUIT_BREAKER_THRESHOLD and signature not in OPEN_CIRCUIT_BREAKERS:
+        OPEN_CIRCUIT_BREAKERS[signature] = fixture
+        logger.warning(
+            f"Circuit breaker opened after {SETUP_FAILURES[signature]} setup failures = '{signature}'"
+        )
+
+def _open_circuit_breaker(item):
+    """Signature of an open circuit breaker whose fixture the item uses, or None."""
+    for signature, fixture in OPEN_CIRCUIT_BREAKERS.items():
+        if fixture in item.fixturenames:
+            return signature
+    return None
+
 # ------------------------------------------------
 # Test Reporting Functions
 # ------------------------------------------------
+def pytest_runtest_setup(item):
+    """
+    Skips the tests depending on a broken flow (open circuit breaker),
+    resets the per-test wait statistics, step timeline and network index.
+    """
+    signature = _open_circuit_breaker(item)
+    if signature:
+        item.circuit_breaker_skip = signature
+        pytest.skip(f"Circuit breaker open, same setup failure as {CIRCUIT_BREAKER_THRESHOLD} tests: {signature}")
+
+    BasePage.reset_wait_stats()
+    StepTimeline.reset()
+    item.start_time = time.time()
+    item.network_index = NetworkIndex()
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Indexes the network traffic and collects the Web Vitals of every browser test
+    and, once the test body has passed, checks the network budgets
+    (a violation only fails the test with NETWORK_BUDGETS=enforce).
+    Benchmarks are exempt from the budgets: they load the same pages many times on purpose.
+    """
+    try:
+        result = yield
+    finally:
+        index = _collect_network_index(item)
+        _collect_web_vitals(item)
+
+    is_benchmark = any(item.get_closest_marker(marker) for marker in ("benchmark", "mail_benchmark"))
+    if NETWORK_BUDGETS_ENABLED and hasattr(item.instance, "driver") and not is_benchmark:
+        violations = check_network_budgets(index)
+        item.network_budget_violations = violations
+        for violation in violations:
+            logger.warning(f"Network budget exceeded: {violation}")
+        if violations and NETWORK_BUDGETS_ENFORCED:
+            raise AssertionError("Network budget exceeded:\n" + "\n".join(violations))
+    return result
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -378,12 +729,20 @@ def pytest_runtest_makereport(item, call):
     # Description from the docstring
     report.description = item.function.__doc__ or "No description"
 
-    if report.when == "call":
-        TEST_RESULTS["total"] += 1
-        if report.passed:
-            TEST_RESULTS["passed"] += 1
-        elif report.failed:
-            TEST_RESULTS["failed"] += 1
+    # Time lost in explicit waits that timed out (setup and call phases)
+    if report.when == "call" or (report.when == "setup" and report.outcome != "passed"):
+        report.timed_out_waits = BasePage.timed_out_wait_stats["count"]
+        report.timed_out_wait_time = BasePage.timed_out_wait_stats["seconds"]
+        report.steps = list(StepTimeline.steps)
+
+    if report.when == "call" and getattr(item, "network_budget_violations", None):
+        report.network_budget_violations = item.network_budget_violations
+
+    if report.when == "call" and getattr(item, "web_vitals", None):
+        report.web_vitals = item.web_vitals
+
+    # Counted by pytest_runtest_logreport, on the controller for xdist runs
+    report.worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
 
     # Process results for failed/error tests
     if report.outcome in ['failed', 'error']:
@@ -391,7 +750,99 @@ def pytest_runtest_makereport(item, call):
         report.failure_message = failure_message
         logger.error(f"Test {report.outcome}: {failure_message}")
         capture_test_artifacts(item, report)
+        if report.when == "setup":
+            _record_setup_failure(item, report, failure_message, call.excinfo)
+
+    if report.when == "setup" and report.skipped and getattr(item, "circuit_breaker_skip", None):
+        report.circuit_breaker_skip = item.circuit_breaker_skip
+
+    if report.when == "setup" and getattr(item, "account_lease", None):
+        report.account_lease = item.account_lease
 
+    if report.when == "setup" and getattr(item, "browser_state", None):
+        report.browser_state = item.browser_state
+
+    # Resolved in each xdist worker, the controller never resolves the driver itself
+    if report.when == "setup" and driver_resolver.resolution_time is not None:
+        report.driver_resolution_time = driver_resolver.resolution_time
+
+
+
+def pytest_runtest_logreport(report):
+    """
+    Collects the test results and the per-test statistics
+    (also runs on the xdist controller, which receives the worker reports).
+    """
+    MEASURED_DURATIONS[report.nodeid] = MEASURED_DURATIONS.get(report.nodeid, 0.0) + report.duration
+    if report.when == "call":
+        EXECUTED_TESTS.add(report.nodeid)
+        TEST_RESULTS["total"] += 1
+        if report.passed:
+            TEST_RESULTS["passed"] += 1
+        elif report.failed:
+            TEST_RESULTS["failed"] += 1
+
+    # Wall time of each worker: from its first setup to its last teardown
+    worker_id = getattr(report, "worker_id", "main")
+    worker = WORKER_STATS.setdefault(worker_id, {"tests": 0, "start": report.start, "stop": report.stop})
+    worker["start"] = min(worker["start"], report.start)
+    worker["stop"] = max(worker["stop"], report.stop)
+    if report.when == "teardown":
+        worker["tests"] += 1
+    if getattr(report, "driver_resolution_time", None) is not None:
+        DRIVER_RESOLUTION_TIMES[worker_id] = report.driver_resolution_time
+
+    if getattr(report, "timed_out_waits", 0):
+        TIMED_OUT_WAITS[report.nodeid] = (report.timed_out_waits, report.timed_out_wait_time)
+    for step in getattr(report, "steps", ()):
+        duration = step["end"] - step["start"]
+        STEP_DURATIONS["action"].setdefault(step["action"], []).append(duration)
+        STEP_DURATIONS["page"].setdefault(step["page"], []).append(duration)
+        STEP_DURATIONS["category"].setdefault(step["category"], []).append(duration)
+    if getattr(report, "circuit_breaker_skip", None):
+        CIRCUIT_BREAKER_SKIPS[report.circuit_breaker_skip] = CIRCUIT_BREAKER_SKIPS.get(report.circuit_breaker_skip, 0) + 1
+    if getattr(report, "web_vitals", None):
+        WEB_VITALS[report.nodeid] = report.web_vitals
+    if getattr(report, "account_lease", None):
+        lease = report.account_lease
+        leases = ACCOUNT_LEASES.setdefault(lease["type"], {"hit": 0, "wait": 0, "miss": 0, "wait_time": 0.0})
+        leases[lease["outcome"]] += 1
+        leases["wait_time"] += lease["wait"]
+    if getattr(report, "browser_state", None):
+        BROWSER_STATES[report.browser_state] = BROWSER_STATES.get(report.browser_state, 0) + 1
+    if getattr(report, "network_budget_violations", None):
+        NETWORK_BUDGET_VIOLATIONS[report.nodeid] = report.network_budget_violations
+    if getattr(report, "artifact_capture_time", None) is not None:
+        ARTIFACT_CAPTURE_TIMES[report.nodeid] = (
+            ARTIFACT_CAPTURE_TIMES.get(report.nodeid, 0.0) + report.artifact_capture_time
+        )
+
+
+def pytest_sessionfinish(session):
+    """
+    Waits for the artifacts still being written
+    (runs before pytest-html generates the report)
+    and writes the Web Vitals and test durations of the run.
+    """
+    ARTIFACT_WRITER.close()
+    close_shared_mail_backend()
+    if ACCOUNT_POOL is not None:
+        ACCOUNT_POOL.close()
+
+    # With xdist, the controller writes the files with the data of every worker
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    if WEB_VITALS:
+        _write_web_vitals(os.path.join(WEB_VITALS_DIR, f"web_vitals_{TIMESTAMP}.json"))
+    if EXECUTED_TESTS:
+        try:
+            save_durations(
+                TEST_DURATIONS_FILE,
+                {nodeid: MEASURED_DURATIONS[nodeid] for nodeid in EXECUTED_TESTS},
+                TEST_DURATIONS_SMOOTHING
+            )
+        except Exception as e:
+            logger.error(f"Failed to save the test durations: {e}")
 
 
 # ------------------------------------------------
@@ -433,8 +884,12 @@ def pytest_html_results_table_row(report, cells):
             test_name = test_parts[2]
             cells[2] = f"<td>{test_name}</td>"
 
-    # Add description
-    cells.insert(3, f"<td>{getattr(report, 'description', '')}</td>")
+    # Add description, with the timeline of the page object steps
+    timeline = render_timeline(getattr(report, "steps", None))
+    web_vitals = getattr(report, "web_vitals", None)
+    if web_vitals:
+        timeline += f"<br><small>{format_vitals(worst_values(web_vitals))}</small>"
+    cells.insert(3, f"<td>{getattr(report, 'description', '')}{timeline}</td>")
 
     # Add the failure message
     failure_message = ""
@@ -473,9 +928,32 @@ def pytest_html_results_summary(prefix):
     """
     prefix.append(f"<h3>{REPORT_TITLE}</h3>")
 
-    # Do not display stats in parallel mode (xdist)
-    if USING_XDIST :
-        return
+    if len(DRIVER_RESOLUTION_TIMES) == 1:
+        prefix.append(f"<p>Chromedriver resolution time: {next(iter(DRIVER_RESOLUTION_TIMES.values())):.3f}s</p>")
+    elif DRIVER_RESOLUTION_TIMES:
+        prefix.append(
+            f"<p>Chromedriver resolution time: {max(DRIVER_RESOLUTION_TIMES.values()):.3f}s "
+            f"(slowest of {len(DRIVER_RESOLUTION_TIMES)} workers)</p>"
+        )
+
+    prefix.extend(_timed_out_waits_summary())
+    prefix.extend(_network_budget_summary())
+    prefix.extend(_steps_summary())
+    prefix.extend(_web_vitals_summary())
+    prefix.extend(_account_pool_summary())
+    if BROWSER_STATES:
+        prefix.append(
+            f"<p>Browser state snapshots: {BROWSER_STATES.get('restored', 0)} restored, "
+            f"{BROWSER_STATES.get('captured', 0)} captured, {BROWSER_STATES.get('rejected', 0)} rejected</p>"
+        )
+    if CIRCUIT_BREAKER_SKIPS:
+        rows = "".join(f"<li>{signature}: {count} test(s) skipped</li>" for signature, count in CIRCUIT_BREAKER_SKIPS.items())
+        prefix.append(f"<p>Circuit breakers opened</p><ul>{rows}</ul>")
+    if ARTIFACT_CAPTURE_TIMES:
+        prefix.append(
+            f"<p>Artifact capture: {sum(ARTIFACT_CAPTURE_TIMES.values()):.2f}s on the test thread "
+            f"for {len(ARTIFACT_CAPTURE_TIMES)} test(s)</p>"
+        )
 
     passed = TEST_RESULTS["passed"]
     failed = TEST_RESULTS["failed"]
@@ -489,6 +967,20 @@ def pytest_html_results_summary(prefix):
             f"<h3>Fail Rate: {fail_percent:.2f}%</h3>",
         ])
 
+    if USING_XDIST:
+        prefix.extend(_workers_summary())
+    else:
+        # In-process statistics (not shared by the xdist workers)
+        if ARTIFACT_WRITER.write_time:
+            prefix.append(f"<p>Artifacts written in the background: {ARTIFACT_WRITER.write_time:.2f}s</p>")
+
+        # Each cache hit replaces a locate + visibility check with a single revalidation command
+        cache_stats = BasePage.element_cache_stats
+        prefix.append(
+            f"<p>Element cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['invalidations']} invalidations</p>"
+        )
+
     prefix.extend([
         "<style>",
         "/* Balance the table cell size */",
@@ -502,4 +994,165 @@ def pytest_html_results_summary(prefix):
         "table#results-table th:nth-child(6), table#results-table td:nth-child(6) { width: 4%; }",
         "table#results-table th:nth-child(7), table#results-table td:nth-child(7) { width: 6%; }",
         "</style>"
-    ])
\ No newline at end of file
+    ])
+
+
+def _timed_out_waits_summary(limit: int = 5):
+    """
+    Builds the HTML summary of the wall time lost in waits that timed out.
+    """
+    if not TIMED_OUT_WAITS:
+        return []
+    total = sum(seconds for _, seconds in TIMED_OUT_WAITS.values())
+    slowest = sorted(TIMED_OUT_WAITS.items(), key=lambda entry: entry[1][1], reverse=True)[:limit]
+    rows = "".join(
+        f"<li>{nodeid.split('::')[-1]}: {count} wait(s), {seconds:.1f}s</li>"
+        for nodeid, (count, seconds) in slowest
+    )
+    return [
+        f"<p>Time spent in timed-out waits: {total:.1f}s over {len(TIMED_OUT_WAITS)} test(s)</p>",
+        f"<ul>{rows}</ul>",
+    ]
+
+
+def _network_budget_summary():
+    """
+    Builds the HTML list of the network budget violations, per test.
+    """
+    if not NETWORK_BUDGET_VIOLATIONS:
+        return []
+    rows = "".join(
+        f"<li>{nodeid.split('::')[-1]}<ul>{''.join(f'<li>{violation}</li>' for violation in violations)}</ul></li>"
+        for nodeid, violations in NETWORK_BUDGET_VIOLATIONS.items()
+    )
+    return [
+        f"<p>Network budget violations: {len(NETWORK_BUDGET_VIOLATIONS)} test(s)</p>",
+        f"<ul>{rows}</ul>",
+    ]
+
+
+def _workers_summary():
+    """
+    Builds the HTML table of the xdist workers: tests run, wall time, throughput,
+    and the load imbalance (slowest worker wall time compared to the mean).
+    """
+    if not WORKER_STATS:
+        return []
+    wall_times = {worker_id: stats["stop"] - stats["start"] for worker_id, stats in WORKER_STATS.items()}
+    mean_wall_time = sum(wall_times.values()) / len(wall_times)
+    imbalance = (max(wall_times.values()) / mean_wall_time - 1) * 100 if mean_wall_time > 0 else 0.0
+
+    rows = "".join(
+        f"<tr><td>{worker_id}</td><td>{stats['tests']}</td><td>{wall_times[worker_id]:.1f}s</td>"
+        f"<td>{(stats['tests'] / wall_times[worker_id] * 60) if wall_times[worker_id] > 0 else 0.0:.1f}</td></tr>"
+        for worker_id, stats in sorted(WORKER_STATS.items())
+    )
+    # Makespan of the longest-first dispatch predicted from the durations known before the run
+    predicted = predict_durations(EXECUTED_TESTS, RECORDED_DURATIONS)
+    predicted_makespan = lpt_makespan(predicted.values(), len(WORKER_STATS))
+    unseen = len([nodeid for nodeid in EXECUTED_TESTS if nodeid not in RECORDED_DURATIONS])
+
+    return [
+        f"<p>Workers: {len(WORKER_STATS)} | Load imbalance: {imbalance:.1f}% "
+        f"(slowest worker vs mean wall time)</p>",
+        f"<p>Makespan: predicted {predicted_makespan:.1f}s, actual {max(wall_times.values()):.1f}s "
+        f"({unseen} test(s) without recorded duration)</p>",
+        "<table><tr><th>Worker</th><th>Tests</th><th>Wall time</th><th>Tests/min</th></tr>",
+        rows,
+        "</table>",
+    ]
+
+
+def _steps_summary():
+    """
+    Builds the HTML tables of the page object step durations:
+    time per category, then p50/p95/max per action type and per page class.
+    """
+    if not STEP_DURATIONS["action"]:
+        return []
+    total = sum(sum(durations) for durations in STEP_DURATIONS["category"].values()) or 1
+    shares = ", ".join(
+        f"{category} {sum(STEP_DURATIONS['category'].get(category, [])):.1f}s "
+        f"({sum(STEP_DURATIONS['category'].get(category, [])) / total * 100:.0f}%)"
+        for category in STEP_CATEGORIES
+    )
+    html_parts = [f"<p>Time in page object steps: {shares}</p>"]
+    for key, title in (("action", "Action"), ("page", "Page object")):
+        rows = "".join(
+            f"<tr><td>{name}</td><td>{len(durations)}</td><td>{percentile(durations, 50) * 1000:.0f}</td>"
+            f"<td>{percentile(durations, 95) * 1000:.0f}</td><td>{max(durations) * 1000:.0f}</td></tr>"
+            for name, durations in sorted(
+                STEP_DURATIONS[key].items(), key=lambda entry: sum(entry[1]), reverse=True
+            )
+        )
+        html_parts.append(
+            f"<table><tr><th>{title}</th><th>Steps</th><th>p50 (ms)</th><th>p95 (ms)</th><th>max (ms)</th></tr>"
+            f"{rows}</table>"
+        )
+    return html_parts
+
+
+def _web_vitals_by_url():
+    """p75 of each Web Vital per page URL (query string removed)."""
+    pages_by_url = {}
+    for pages in WEB_VITALS.values():
+        for page in pages:
+            pages_by_url.setdefault(page["url"].split("?", 1)[0], []).append(page)
+    return {
+        url: {metric: p75([page[metric] for page in pages]) for metric in ("lcp", "cls", "inp", "fid", "tbt")}
+        for url, pages in sorted(pages_by_url.items())
+    }
+
+
+def _write_web_vitals(output_path):
+    """
+    Writes the metrics file of the run: every page of every test, and the p75 per URL.
+    """
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "sut": SUT,
+                "sut_version": SUT_VERSION,
+                "timestamp": TIMESTAMP,
+                "p75_by_url": _web_vitals_by_url(),
+                "tests": WEB_VITALS,
+            }, f, indent=2)
+        logger.info(f"Web Vitals saved: {output_path}")
+    except Exception as e:
+        logger.error(f"Failed to save the Web Vitals: {e}")
+
+
+def _web_vitals_summary():
+    """
+    Builds the HTML table of the p75 Core Web Vitals per page.
+    """
+    if not WEB_VITALS:
+        return []
+    rows = "".join(
+        f"<tr><td>{url}</td><td>{format_vitals(vitals)}</td></tr>"
+        for url, vitals in _web_vitals_by_url().items()
+    )
+    return [
+        "<p>Core Web Vitals (p75 per page)</p>",
+        f"<table><tr><th>Page</th><th>Metrics</th></tr>{rows}</table>",
+    ]
+
+
+def _account_pool_summary():
+    """
+    Builds the HTML table of the account leases per account type:
+    hits (account ready), waits (account still being created) and misses (provisioned by the test).
+    """
+    if not ACCOUNT_LEASES:
+        return []
+    rows = "".join(
+        f"<tr><td>{account_type}</td><td>{leases['hit']}</td><td>{leases['wait']}</td>"
+        f"<td>{(leases['wait_time'] / leases['wait']) if leases['wait'] else 0.0:.2f}s</td><td>{leases['miss']}</td></tr>"
+        for account_type, leases in sorted(ACCOUNT_LEASES.items())
+    )
+    return [
+        "<p>Account pool leases</p>",
+        "<table><tr><th>Account</th><th>Hits</th><th>Waits</th><th>Mean wait</th><th>Misses</th></tr>",
+        rows,
+        "</table>",
+    ]
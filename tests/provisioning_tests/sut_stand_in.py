@@ -0,0 +1,136 @@
+"""
+Local stand-in of the SUT registration endpoints, used to test HTTP provisioning without the real SUT.
+"""
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from utils.urls import Urls
+
+SESSION_COOKIE = "rapido_session"
+REGISTER_PATH = Urls.CREATE_ACCOUNT[len(Urls.BASE_URL):]
+COMPANY_PATH = Urls.REGISTER_COMPANY[len(Urls.BASE_URL):]
+SUBSCRIPTION_PATH = Urls.SUBSCRIPTION[len(Urls.BASE_URL):]
+LOGIN_PATH = Urls.LOGIN[len(Urls.BASE_URL):]
+DASHBOARD_PATH = Urls.DASHBOARD[len(Urls.BASE_URL):]
+
+FORM_PAGE = '<html><body><form method="post"><input type="hidden" name="_token" value="{token}"></form></body></html>'
+OFFER_FORM = (
+    '<form method="post" action="{action}"><input type="hidden" name="_token" value="{token}">'
+    '<input type="hidden" name="abonnement_id" value="{offer_id}"><h4> {name} </h4><button>Choisir</button></form>'
+)
+OFFERS = {"1": "Essai", "2": "Standard"}
+
+
+class SutStandIn:
+    """
+    Minimal registration flow with sessions, CSRF tokens and redirects:
+    /register -> /register/company -> /change-forfait -> /dashboard (free offer)
+    """
+
+    def __init__(self):
+        self.sessions = {}  # session id -> {"token": str, "user": str | None}
+        self.users = {}
+        self.companies = {}
+        self.subscriptions = {}  # user email -> offer name
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stand_in.handle(self, "GET")
+
+            def do_POST(self):
+                stand_in.handle(self, "POST")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def handle(self, request, method):
+        session_id, session = self._get_session(request)
+        path = request.path
+
+        if path == REGISTER_PATH:
+            if method == "GET":
+                return self._form(request, session_id, session)
+            fields = self._read_form(request)
+            if fields.get("_token") != session["token"] or fields["email"] in self.users:
+                return self._redirect(request, session_id, REGISTER_PATH)
+            if fields["password"] != fields["password_confirmation"]:
+                return self._redirect(request, session_id, REGISTER_PATH)
+            self.users[fields["email"]] = fields
+            session["user"] = fields["email"]
+            return self._redirect(request, session_id, COMPANY_PATH)
+
+        if path == COMPANY_PATH:
+            if not session["user"]:
+                return self._redirect(request, session_id, LOGIN_PATH)
+            if method == "GET":
+                return self._form(request, session_id, session)
+            fields = self._read_form(request)
+            if fields.get("_token") != session["token"] or fields["email"] in self.companies:
+                return self._redirect(request, session_id, COMPANY_PATH)
+            self.companies[fields["email"]] = {**fields, "user": session["user"]}
+            return self._redirect(request, session_id, SUBSCRIPTION_PATH)
+
+        if path == SUBSCRIPTION_PATH:
+            if not session["user"]:
+                return self._redirect(request, session_id, LOGIN_PATH)
+            if method == "GET":
+                forms = "".join(
+                    OFFER_FORM.format(action=SUBSCRIPTION_PATH, token=session["token"], offer_id=offer_id, name=name)
+                    for offer_id, name in OFFERS.items()
+                )
+                return self._respond(request, session_id, 200, f"<html><body>{forms}</body></html>")
+            fields = self._read_form(request)
+            if fields.get("_token") != session["token"] or OFFERS.get(fields.get("abonnement_id")) != "Essai":
+                return self._redirect(request, session_id, SUBSCRIPTION_PATH)
+            self.subscriptions[session["user"]] = "essai"
+            return self._redirect(request, session_id, DASHBOARD_PATH)
+
+        if path in (DASHBOARD_PATH, LOGIN_PATH):
+            return self._respond(request, session_id, 200, "<html><body></body></html>")
+
+        return self._respond(request, session_id, 404, "Not found")
+
+    def _get_session(self, request):
+        for cookie in request.headers.get("Cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == SESSION_COOKIE and value in self.sessions:
+                return value, self.sessions[value]
+        session_id = secrets.token_hex(8)
+        self.sessions[session_id] = {"token": secrets.token_hex(8), "user": None}
+        return session_id, self.sessions[session_id]
+
+    @staticmethod
+    def _read_form(request):
+        body = request.rfile.read(int(request.headers.get("Content-Length", 0))).decode()
+        return {name: values[0] for name, values in parse_qs(body, keep_blank_values=True).items()}
+
+    def _form(self, request, session_id, session):
+        self._respond(request, session_id, 200, FORM_PAGE.format(token=session["token"]))
+
+    def _redirect(self, request, session_id, path):
+        self._respond(request, session_id, 302, "", location=self.base_url + path)
+
+    @staticmethod
+    def _respond(request, session_id, status, body, location=None):
+        request.send_response(status)
+        request.send_header("Set-Cookie", f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly")
+        if location:
+            request.send_header("Location", location)
+        request.send_header("Content-Type", "text/html; charset=utf-8")
+        request.send_header("Content-Length", str(len(body.encode())))
+        request.end_headers()
+        request.wfile.write(body.encode())
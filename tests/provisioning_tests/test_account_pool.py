@@ -0,0 +1,111 @@
+import pytest
+from tests.provisioning_tests.sut_stand_in import SutStandIn
+from utils.account_pool import AccountPool
+from utils.provisioning import AccountProvisioner, ProvisioningError
+
+
+class TestAccountPool:
+
+    @pytest.fixture
+    def stand_in(self):
+        with SutStandIn() as stand_in:
+            yield stand_in
+
+    def test_subscribe_free_offer(self, stand_in):
+        """Verify that the company of a provisioned user is subscribed to the 'essai' offer over HTTP."""
+        provisioner = AccountProvisioner(base_url=stand_in.base_url)
+        user_data = provisioner.register_user()
+        provisioner.register_company()
+        provisioner.subscribe("essai")
+
+        assert stand_in.subscriptions.get(user_data["email"]) == "essai", (
+            f"User '{user_data['email']}' was not subscribed by the stand-in"
+        )
+
+    def test_subscribe_unknown_offer(self, stand_in):
+        """Verify that subscribing to an offer missing from the page raises a ProvisioningError."""
+        provisioner = AccountProvisioner(base_url=stand_in.base_url)
+        provisioner.register_user()
+        provisioner.register_company()
+        with pytest.raises(ProvisioningError):
+            provisioner.subscribe("premium plus")
+
+    def test_lease_pooled_accounts(self, stand_in):
+        """Verify that each pooled account type is leased once, then the pool misses."""
+        pool = AccountPool({"user": 2, "subscribed": 1}, workers=2, base_url=stand_in.base_url)
+        pool.start()
+        try:
+            leased = [pool.lease("user", timeout=10) for _ in range(2)]
+            subscribed, outcome, _ = pool.lease("subscribed", timeout=10)
+            missed, miss_outcome, _ = pool.lease("user", timeout=10)
+        finally:
+            pool.close()
+
+        emails = {account["user_data"]["email"] for account, _, _ in leased}
+        assert len(emails) == 2 and all(outcome in ("hit", "wait") for _, outcome, _ in leased), (
+            f"Expected 2 distinct pooled users, got = {leased}"
+        )
+        assert outcome in ("hit", "wait") and stand_in.subscriptions.get(subscribed["user_data"]["email"]) == "essai", (
+            f"Expected a subscribed pooled account, got = {subscribed}"
+        )
+        assert missed is None and miss_outcome == "miss", "The pool leased more users than provisioned"
+        assert pool.stats["user"]["misses"] == 1 and pool.stats["user"]["created"] == 2, (
+            f"Unexpected pool statistics = {pool.stats['user']}"
+        )
+
+    def test_lease_without_provisioned_account(self):
+        """Verify that a lease of an account type the pool does not provision misses without waiting."""
+        pool = AccountPool({"user": 0})
+        pool.start()
+        account, outcome, waited = pool.lease("company", timeout=10)
+
+        assert account is None and outcome == "miss" and waited < 1, (
+            f"Expected an immediate miss, got = {(account, outcome, waited)}"
+        )
+
+    def test_account_created_after_close_is_not_queued(self, monkeypatch):
+        """Verify that an account finishing after close() is not queued and its session is closed."""
+        pool = AccountPool({"user": 1})
+
+        class ClosingProvisioner:
+            closed = False
+
+            def __init__(self, **kwargs):
+                ClosingProvisioner.instance = self
+
+            def register_user(self):
+                pool.close()  # The session ends while the account is being created
+                return {"email": "late@example.com"}
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr("utils.account_pool.AccountProvisioner", ClosingProvisioner)
+        pool._pending["user"] += 1
+        pool._create("user")
+
+        assert pool._ready["user"].empty(), "Account created after close() was queued"
+        assert ClosingProvisioner.instance.closed, "Session of the late account was not closed"
+
+    def test_unexpected_error_is_logged_and_counted(self, monkeypatch, caplog):
+        """Verify that an unexpected provisioning error is logged and counted as a failure."""
+        pool = AccountPool({"user": 1})
+
+        class BrokenProvisioner:
+            def __init__(self, **kwargs):
+                pass
+
+            def register_user(self):
+                raise KeyError("csrf-token")
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr("utils.account_pool.AccountProvisioner", BrokenProvisioner)
+        pool._pending["user"] += 1
+        pool._create("user")
+
+        assert pool.stats["user"]["failed"] == 1 and pool._pending["user"] == 0, (
+            f"Unexpected pool statistics = {pool.stats['user']}"
+        )
+        assert "csrf-token" in caplog.text, "Unexpected error was not logged"
@@ -0,0 +1,75 @@
+import time
+from urllib.parse import urlsplit
+from utils.browser_state import (BrowserStateSnapshot, BrowserStateStore, capture_browser_state,
+                                 restore_browser_state)
+from utils.urls import Urls
+
+SUT_DOMAIN = urlsplit(Urls.BASE_URL).hostname
+
+
+class RecordingDriver:
+    def __init__(self, cookies=(), storage=None):
+        self.cookies = list(cookies)
+        self.storage = storage or {"local": [], "session": []}
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        if command == "Network.getAllCookies":
+            return {"cookies": self.cookies}
+        if command == "Page.addScriptToEvaluateOnNewDocument":
+            return {"identifier": "1"}
+        return {}
+
+    def execute_script(self, script):
+        return self.storage
+
+    def get(self, url):
+        self.commands.append(("get", url))
+
+
+class TestBrowserState:
+
+    def test_capture_keeps_sut_cookies_and_storage(self):
+        """Verify that only the SUT cookies are captured and that the snapshot expires with the first cookie."""
+        expires = time.time() + 600
+        driver = RecordingDriver(
+            cookies=[
+                {"name": "session", "value": "a", "domain": SUT_DOMAIN, "path": "/", "expires": -1, "size": 8},
+                {"name": "remember", "value": "b", "domain": f".{SUT_DOMAIN}", "path": "/", "expires": expires},
+                {"name": "tracker", "value": "c", "domain": "other.com", "path": "/", "expires": -1},
+            ],
+            storage={"local": [["token", "t"]], "session": [["tab", "1"]]},
+        )
+        snapshot = capture_browser_state(driver, {"email": "a@b.c"}, max_age=3600)
+
+        assert [cookie["name"] for cookie in snapshot.cookies] == ["session", "remember"], (
+            f"Unexpected cookies captured = {snapshot.cookies}"
+        )
+        assert "expires" not in snapshot.cookies[0] and "size" not in snapshot.cookies[0], (
+            f"Session cookie not cleaned up for Network.setCookies = {snapshot.cookies[0]}"
+        )
+        assert snapshot.expires_at == expires and snapshot.local_storage == [["token", "t"]], (
+            f"Unexpected snapshot expiry or storage = {snapshot.expires_at}, {snapshot.local_storage}"
+        )
+
+    def test_restore_seeds_storage_for_the_navigation_only(self):
+        """Verify that cookies are set, then the storage script only wraps the navigation to the page."""
+        snapshot = BrowserStateSnapshot([{"name": "session", "value": "a"}], [["token", "t"]], [], {}, time.time() + 600)
+        driver = RecordingDriver()
+        restore_browser_state(driver, snapshot, Urls.DASHBOARD)
+
+        commands = [command for command, _ in driver.commands]
+        assert commands == [
+            "Network.setCookies", "Page.addScriptToEvaluateOnNewDocument", "get", "Page.removeScriptToEvaluateOnNewDocument"
+        ], f"Unexpected restore sequence = {commands}"
+        assert '[["token", "t"]]' in driver.commands[1][1]["source"], "localStorage entries missing from the seed script"
+
+    def test_store_drops_expired_snapshots(self):
+        """Verify that an expired snapshot is not restored anymore."""
+        store = BrowserStateStore()
+        store.put("company", BrowserStateSnapshot([], [], [], {}, time.time() + 10))  # Within the expiry margin
+        store.put("subscribed", BrowserStateSnapshot([], [], [], {}, time.time() + 600))
+
+        assert store.get("company") is None, "Expired snapshot was returned"
+        assert store.get("subscribed") is not None, "Valid snapshot was dropped"
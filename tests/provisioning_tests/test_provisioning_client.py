@@ -0,0 +1,89 @@
+import pytest
+from requests.cookies import create_cookie
+from tests.provisioning_tests.sut_stand_in import SutStandIn, SESSION_COOKIE
+from utils import provisioning
+from utils.provisioning import AccountProvisioner, ProvisioningError
+
+
+class TestProvisioningClient:
+
+    @pytest.fixture
+    def stand_in(self):
+        with SutStandIn() as stand_in:
+            yield stand_in
+
+    def test_register_user_and_company(self, stand_in):
+        """Verify that a user and its company are created over HTTP with a CSRF-protected session."""
+        provisioner = AccountProvisioner(base_url=stand_in.base_url)
+        user_data = provisioner.register_user()
+        company_data = provisioner.register_company()
+
+        assert user_data["email"] in stand_in.users, (
+            f"User '{user_data['email']}' was not created by the stand-in"
+        )
+        assert stand_in.companies[company_data["email"]]["user"] == user_data["email"], (
+            "The company was not registered for the provisioned user"
+        )
+
+    def test_register_company_requires_user_session(self, stand_in):
+        """Verify that company registration fails when no user is logged in."""
+        provisioner = AccountProvisioner(base_url=stand_in.base_url)
+        with pytest.raises(ProvisioningError):
+            provisioner.register_company()
+
+    def test_register_already_registered_user(self, stand_in):
+        """Verify that a rejected registration raises a ProvisioningError."""
+        user_data = AccountProvisioner(base_url=stand_in.base_url).register_user()
+        with pytest.raises(ProvisioningError):
+            AccountProvisioner(base_url=stand_in.base_url).register_user(dict(user_data))
+
+    def test_close_keeps_the_shared_connections(self, stand_in):
+        """Verify that closing a provisioner does not close the connections other provisioners are using."""
+        in_use = AccountProvisioner(base_url=stand_in.base_url)
+        closed = AccountProvisioner(base_url=stand_in.base_url)
+        in_use.register_user()
+        closed.register_user()
+
+        closed.close()
+
+        assert provisioning._SHARED_ADAPTER.poolmanager.pools, "Shared connection pools cleared by close()"
+        assert not closed.session.cookies, "Session cookies kept after close()"
+        company_data = in_use.register_company()
+        assert company_data["email"] in stand_in.companies, "The other provisioner failed after the close"
+
+    def test_to_browser_transfers_session_cookie(self, stand_in):
+        """Verify that the authenticated session cookie is handed over to the browser."""
+        provisioner = AccountProvisioner(base_url=stand_in.base_url)
+        provisioner.register_user()
+        commands = []
+
+        class RecordingDriver:
+            def execute_cdp_cmd(self, command, params):
+                commands.append((command, params))
+
+        transferred = provisioner.to_browser(RecordingDriver())
+
+        assert transferred == 1, f"Expected 1 cookie transferred, got {transferred}"
+        command, params = commands[0]
+        assert command == "Network.setCookie" and params["name"] == SESSION_COOKIE, (
+            f"Unexpected command sent to the browser = {commands[0]}"
+        )
+        assert params["httpOnly"] and params["url"] == stand_in.base_url, (
+            f"Cookie attributes not preserved = {params}"
+        )
+
+    def test_to_browser_http_only_attribute_is_case_insensitive(self):
+        """Verify that a cookie set with a lowercase 'httponly' attribute stays HttpOnly in the browser."""
+        provisioner = AccountProvisioner(base_url="http://sut.example")
+        provisioner.session.cookies.set_cookie(create_cookie("session", "a", rest={"httponly": None}))
+        provisioner.session.cookies.set_cookie(create_cookie("theme", "dark", rest={}))
+        commands = []
+
+        class RecordingDriver:
+            def execute_cdp_cmd(self, command, params):
+                commands.append((command, params))
+
+        provisioner.to_browser(RecordingDriver())
+
+        http_only = {params["name"]: params["httpOnly"] for _, params in commands}
+        assert http_only == {"session": True, "theme": False}, f"Unexpected httpOnly flags = {http_only}"
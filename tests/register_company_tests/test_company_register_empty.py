@@ -9,7 +9,7 @@ class TestCompanyRegisterEmptyFields(BaseTest):
 
 
     @pytest.mark.parametrize("name", ['', '         '])
-    def test_company_register_empty_name(self, name,register_user_fixture):
+    def test_company_register_empty_name(self, name, user_session_fixture):
         """Verify that company registration fails for an empty or whitespace-only name"""
         register_company_page = RegisterCompanyPage(self.driver)
         register_company_page.register_company(name, ValidCompanyData.generate_valid_email(), ValidCompanyData.VALID_SIRET)
@@ -26,7 +26,7 @@ class TestCompanyRegisterEmptyFields(BaseTest):
         )
 
     @pytest.mark.parametrize("email", ['', '         '])
-    def test_company_register_empty_email(self, email,register_user_fixture):
+    def test_company_register_empty_email(self, email, user_session_fixture):
         """Verify that company registration fails for an empty or whitespace-only email"""
         register_company_page = RegisterCompanyPage(self.driver)
         register_company_page.register_company(ValidCompanyData.VALID_NAME, email, ValidCompanyData.VALID_SIRET)
@@ -44,7 +44,7 @@ class TestCompanyRegisterEmptyFields(BaseTest):
         )
 
     @pytest.mark.parametrize("siret", ['', '         '])
-    def test_company_register_empty_siret(self, siret,register_user_fixture):
+    def test_company_register_empty_siret(self, siret, user_session_fixture):
         """Verify that company registration fails for an empty or whitespace-only SIRET"""
         register_company_page = RegisterCompanyPage(self.driver)
         register_company_page.register_company(ValidCompanyData.VALID_NAME, ValidCompanyData.generate_valid_email(), siret)
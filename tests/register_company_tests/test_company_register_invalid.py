@@ -10,7 +10,7 @@ class TestCompanyRegisterInvalidFields(BaseTest):
 
 
     @pytest.mark.parametrize("invalid_email", InvalidCompanyData.generate_invalid_email())
-    def test_company_register_invalid_email(self, invalid_email,register_user_fixture):
+    def test_company_register_invalid_email(self, invalid_email, user_session_fixture):
         """Verify that company registration fails when using an invalid email format."""
         register_company_page = RegisterCompanyPage(self.driver)
         register_company_page.register_company(
@@ -5,7 +5,7 @@ from utils.ui_texts.register_company_page_ui import RegisterCOMPANYPageUI
 
 class TestCompanyRegisterPageUI(BaseTest):
 
-    def test_company_register_page_title(self, register_user_fixture):
+    def test_company_register_page_title(self, user_session_fixture):
         """Validate the company register page title"""
         register_company_page = RegisterCompanyPage(self.driver)
         register_company_page.open()
@@ -17,7 +17,7 @@ class TestCompanyRegisterPageUI(BaseTest):
             f"Actual = '{actual_title}'. "
         )
 
-    def test_connection_button_text(self, register_user_fixture):
+    def test_connection_button_text(self, user_session_fixture):
         """Validate the accuracy of the 'Connection' button text"""
         register_company_page = RegisterCompanyPage(self.driver)
         register_company_page.open()
@@ -30,7 +30,7 @@ class TestCompanyRegisterPageUI(BaseTest):
             f"Actual = '{actual_text}'. "
         )
 
-    def test_login_link_text(self, register_user_fixture):
+    def test_login_link_text(self, user_session_fixture):
         """Validate the accuracy of the login link text"""
         register_company_page = RegisterCompanyPage(self.driver)
         register_company_page.open()
@@ -1,11 +1,10 @@
-import email
-import imaplib
 import re
-import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from pages.forgot_password_page import ForgotPasswordPage
 from pages.login_page import LoginPage
 from pages.register_page import RegisterPage
 from pages.reset_password_page import ResetPasswordPage
+from utils.mailbox import shared_mail_backend
 from utils.users import ValidUserData, ResetPasswordData
 from utils.validation_messages.forgot_password_page_messages import ForgotPasswordPageMessages
 import logging
@@ -13,96 +12,97 @@ logger = logging.getLogger(__name__)
 
 class ResetPasswordHelper:
     @staticmethod
-    def check_reset_email_received(driver,target_email,subject_keyword,
-                                   timeout_sec: int = 60,
-                                   interval_sec: int = 5,
-                                  ) -> str:
+    def extract_reset_link(msg) -> str:
         """
-        Wait for a reset password email to be received and extract the reset link.
+        Extract the reset link from a reset password email.
         Args:
-            driver: WebDriver instance
-            target_email: The target email address to check for
-            timeout_sec: Maximum time to wait for the email (seconds)
-            interval_sec: Delay between email checks (seconds)
-            subject_keyword: Keyword to search in email subject
+            msg: email.message.Message received
         Returns:
-            The reset password URL extracted from the email body
+            The reset password URL found in the email body
         Raises:
-            TimeoutError: If no email is received within timeout period
-            ValueError: If email is found but no reset link can be extracted
-            IMAPError: For issues with IMAP server communication
+            ValueError: If no reset link can be extracted
         """
-
-        imap_folder = ResetPasswordData.IMAP_FOLDER
-        imap_server = ResetPasswordData.IMAP_SERVER
         content_types = ("text/plain", "text/html")
-        test_email = ResetPasswordData.IMAP_EMAIL
-        test_password = ResetPasswordData.IMAP_PASSWORD
+        body = ""
+
+        # Parse multipart and singlepart emails
+        if msg.is_multipart():
+            for content_type in content_types:
+                for part in msg.walk():
+                    if part.get_content_type() == content_type:
+                        body = part.get_payload(decode=True).decode()
+                        break
+                if body:
+                    break
+        else:
+            body = msg.get_payload(decode=True).decode()
+
+        url_pattern = r'(https?://[^\s<>"]+reset[^\s<>"]+)'
+        match = re.search(url_pattern, body)
+        if not match:
+            raise ValueError("No reset link found in email body")
+        return match.group(1)
 
-        def extract_reset_link(body: str) -> str:
-            """Extract reset link from email body."""
-            url_pattern = r'(https?://[^\s<>"]+reset[^\s<>"]+)'
-            match = re.search(url_pattern, body)
-            if not match:
-                raise ValueError("No reset link found in email body")
-            return match.group(1)
+    @staticmethod
+    def expect_reset_email(target_email, subject_keyword=ResetPasswordData.SUBJECT_KEYWORD) -> Future:
+        """
+        Register the target email with the shared mail backend (MAIL_BACKEND).
+        Returns:
+            Future resolved with the reset link once the email is received
+        """
+        return shared_mail_backend().expect(target_email, subject_keyword, ResetPasswordHelper.extract_reset_link)
 
+    @staticmethod
+    def request_password_reset(forgot_password_page, email: str) -> Future:
+        """
+        Submit the forgot password form without waiting for the email.
+        Returns:
+            Future of the reset link (see wait_for_reset_link)
+        """
+        reset_link_future = ResetPasswordHelper.expect_reset_email(email)
         try:
-            with imaplib.IMAP4_SSL(imap_server) as mail:
-                mail.login(test_email, test_password)
-                logger.info(f"Connected to IMAP server, waiting for reset email to {target_email}...")
-                start_time = time.time()
-                while (time.time() - start_time) < timeout_sec:
-                    try:
-                        status, _ = mail.select(imap_folder)
-                        if status != "OK":
-                            raise ConnectionError(f"Failed to select {imap_folder}")
-
-                        search_query = f'(UNSEEN SUBJECT "{subject_keyword}" TO "{target_email}")'
-                        status, messages = mail.search(None, search_query)
-
-                        if status == "OK" and messages[0]:
-                            latest_email_id = messages[0].split()[-1]
-                            status, msg_data = mail.fetch(latest_email_id, '(RFC822)')
-
-                            if status != "OK":
-                                continue
-
-                            raw_email = msg_data[0][1]
-                            msg = email.message_from_bytes(raw_email)
-                            body = ""
-
-                            # Parse multipart and singlepart emails
-                            if msg.is_multipart():
-                                for content_type in content_types:
-                                    for part in msg.walk():
-                                        if part.get_content_type() == content_type:
-                                            body = part.get_payload(decode=True).decode()
-                                            break
-                                    if body:
-                                        break
-                            else:
-                                body = msg.get_payload(decode=True).decode()
-
-                            if body:
-                                return extract_reset_link(body)
-
-                    except Exception as e:
-                        logger.warning(f"Temporary error during email check = {str(e)}")
-
-                    time.sleep(interval_sec)
-
-        except imaplib.IMAP4.error as e:
-            error_msg = f"IMAP server error: {str(e)}"
-            logger.error(error_msg)
-            raise ConnectionError(error_msg) from e
-        except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
+            forgot_password_page.request_password_reset(email)
+        except BaseException:
+            shared_mail_backend().discard(reset_link_future)
             raise
+        return reset_link_future
 
-        raise TimeoutError(
-            f"No reset email received for {target_email} within {timeout_sec} seconds"
-        )
+    @staticmethod
+    def wait_for_reset_link(reset_link_future: Future, target_email, timeout_sec: int = 60) -> str:
+        """
+        Wait for the reset email registered with expect_reset_email.
+        Returns:
+            The reset password URL extracted from the email body
+        Raises:
+            TimeoutError: If no email is received within timeout period
+            ValueError: If email is found but no reset link can be extracted
+            ConnectionError: For issues with IMAP server communication
+        """
+        logger.info(f"Waiting for reset email to = '{target_email}'")
+        try:
+            return reset_link_future.result(timeout=timeout_sec)
+        except FutureTimeoutError:
+            shared_mail_backend().discard(reset_link_future)
+            raise TimeoutError(
+                f"No reset email received for {target_email} within {timeout_sec} seconds"
+            ) from None
+
+    @staticmethod
+    def check_reset_email_received(driver, target_email, subject_keyword,
+                                   timeout_sec: int = 60,
+                                   ) -> str:
+        """
+        Wait for a reset password email to be received and extract the reset link.
+        Args:
+            driver: WebDriver instance
+            target_email: The target email address to check for
+            subject_keyword: Keyword to search in email subject
+            timeout_sec: Maximum time to wait for the email (seconds)
+        Returns:
+            The reset password URL extracted from the email body
+        """
+        reset_link_future = ResetPasswordHelper.expect_reset_email(target_email, subject_keyword)
+        return ResetPasswordHelper.wait_for_reset_link(reset_link_future, target_email, timeout_sec)
 
     @staticmethod
     def register_then_request_and_open_password_reset_link(driver, email: str) -> None:
@@ -132,18 +132,24 @@ class ResetPasswordHelper:
             "Therefore, test cannot proceed"
         )
         forgot_password_page = ForgotPasswordPage(driver)
-        forgot_password_page.request_password_reset(email)
-        actual_message = forgot_password_page.get_validation_message()
-        expected_message = ForgotPasswordPageMessages.SUCCESS_MESSAGE
-        assert expected_message in actual_message, (
-            f"Validation error mismatch.\n"
-            f"Expected = '{expected_message}'\n"
-            f"Actual = '{actual_message}' (normally used for: "
-            f"'{ForgotPasswordPageMessages.get_message_type(actual_message)}')"
-        )
-        # Check for reset email
+        # The email is awaited in the background while the confirmation message is checked
+        reset_link_future = ResetPasswordHelper.request_password_reset(forgot_password_page, email)
+        try:
+            actual_message = forgot_password_page.get_validation_message()
+            expected_message = ForgotPasswordPageMessages.SUCCESS_MESSAGE
+            assert expected_message in actual_message, (
+                f"Validation error mismatch.\n"
+                f"Expected = '{expected_message}'\n"
+                f"Actual = '{actual_message}' (normally used for: "
+                f"'{ForgotPasswordPageMessages.get_message_type(actual_message)}')"
+            )
+            # Check for reset email
+            reset_link = ResetPasswordHelper.wait_for_reset_link(reset_link_future, email)
+        finally:
+            if not reset_link_future.done():
+                # A waiter left behind could take a later email sent to the same recipient
+                shared_mail_backend().discard(reset_link_future)
         reset_password_page = ResetPasswordPage(driver)
-        reset_link = ResetPasswordHelper.check_reset_email_received(driver, email, ResetPasswordData.SUBJECT_KEYWORD)
 
         # Proceed with password reset
         reset_password_page.open(reset_link=reset_link)
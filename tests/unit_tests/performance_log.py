@@ -0,0 +1,22 @@
+"""
+Chromedriver performance log entries, as read by NetworkIndex.collect.
+"""
+import json
+
+PAGE_URL = "https://sut.example/login"
+
+
+def entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def finished_request(request_id, url, loader_id, size, document_url=PAGE_URL, method="GET", status=200,
+                     start=1.0, end=1.1, resource_type="Script", response=None):
+    """Entries of one request, from requestWillBeSent to loadingFinished."""
+    return [
+        entry("Network.requestWillBeSent", requestId=request_id, loaderId=loader_id, documentURL=document_url,
+              timestamp=start, wallTime=1700000000 + start, type=resource_type,
+              request={"url": url, "method": method, "headers": {}}),
+        entry("Network.responseReceived", requestId=request_id, response={"status": status, **(response or {})}),
+        entry("Network.loadingFinished", requestId=request_id, timestamp=end, encodedDataLength=size),
+    ]
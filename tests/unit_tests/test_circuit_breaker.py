@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+import pytest
+from tests import conftest
+
+REGISTRATION_FAILURE = "Initial user registration failed.\nTherefore, test cannot proceed."
+AUTOUSE_FIXTURES = ["setup_memory_logging", "setup", "request", "setup_webdriver", "driver_pool"]
+
+
+def register_user_fixture():
+    raise AssertionError(REGISTRATION_FAILURE)
+
+
+def register_user_and_company_fixture():
+    raise AssertionError(REGISTRATION_FAILURE)
+
+
+def _item(fixture):
+    return SimpleNamespace(fixturenames=AUTOUSE_FIXTURES + ["account_pool", fixture])
+
+
+def _fail_setup(fixture_function):
+    """Record the setup failure of a test whose fixture_function raised."""
+    item = _item(fixture_function.__name__)
+    with pytest.raises(AssertionError) as excinfo:
+        fixture_function()
+    conftest._record_setup_failure(item, None, REGISTRATION_FAILURE, excinfo)
+
+
+@pytest.fixture
+def circuit_breakers(monkeypatch):
+    monkeypatch.setattr(conftest, "CIRCUIT_BREAKER_THRESHOLD", 3)
+    monkeypatch.setattr(conftest, "SETUP_FAILURES", {})
+    monkeypatch.setattr(conftest, "OPEN_CIRCUIT_BREAKERS", {})
+
+
+@pytest.mark.usefixtures("circuit_breakers")
+class TestCircuitBreaker:
+
+    def test_breaker_is_keyed_on_the_failing_fixture(self):
+        """Verify that the same message raised by different fixtures does not open a breaker for all browser tests."""
+        for fixture_function in (register_user_fixture, register_user_and_company_fixture) * 2:
+            _fail_setup(fixture_function)
+
+        assert not conftest.OPEN_CIRCUIT_BREAKERS, (
+            f"Breaker opened from mixed fixtures = {conftest.OPEN_CIRCUIT_BREAKERS}"
+        )
+
+        _fail_setup(register_user_fixture)
+
+        assert list(conftest.OPEN_CIRCUIT_BREAKERS.values()) == ["register_user_fixture"], (
+            f"Unexpected breakers = {conftest.OPEN_CIRCUIT_BREAKERS}"
+        )
+        assert conftest._open_circuit_breaker(_item("register_user_fixture")), "Dependent test was not skipped"
+        assert conftest._open_circuit_breaker(_item("register_user_and_company_fixture")) is None, (
+            "Test of another fixture was skipped"
+        )
+        assert conftest._open_circuit_breaker(SimpleNamespace(fixturenames=AUTOUSE_FIXTURES)) is None, (
+            "Browser test without the failing fixture was skipped"
+        )
+
+    def test_generic_fixture_failures_are_ignored(self):
+        """Verify that failures of the fixtures used by every browser test never open a breaker."""
+        def setup_webdriver():
+            raise RuntimeError("session not created")
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError) as excinfo:
+                setup_webdriver()
+            conftest._record_setup_failure(_item("register_user_fixture"), None, "session not created", excinfo)
+
+        assert not conftest.SETUP_FAILURES and not conftest.OPEN_CIRCUIT_BREAKERS, (
+            f"Generic fixture failure recorded = {conftest.SETUP_FAILURES}"
+        )
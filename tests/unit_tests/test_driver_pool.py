@@ -0,0 +1,64 @@
+import pytest
+from utils.driver_pool import DriverPool
+
+
+class DeadDriver:
+    """Driver whose chromedriver process died: its commands fail with connection errors."""
+
+    def __init__(self):
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        raise ConnectionRefusedError("[Errno 111] Connection refused")
+
+    def quit(self):
+        self.quit_called = True
+        raise ConnectionRefusedError("[Errno 111] Connection refused")
+
+
+class WindowlessDriver:
+    """Live driver whose last window was closed by the test."""
+
+    window_handles = []
+
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool():
+    drivers = []
+
+    def factory():
+        drivers.append(WindowlessDriver())
+        return drivers[-1]
+
+    return DriverPool(factory, size=1, max_tests=25)
+
+
+class TestDriverPool:
+
+    @pytest.mark.parametrize("driver_class", [DeadDriver, WindowlessDriver])
+    def test_unusable_driver_is_discarded_on_release(self, pool, driver_class):
+        """Verify that a driver that cannot be reset is quit instead of raising or going back to the pool."""
+        driver = driver_class()
+
+        pool.release(driver)
+
+        assert driver.quit_called and pool.recycled == 1, "Unusable driver was not discarded"
+        assert pool.acquire() is not driver, "Unusable driver was leased again"
+
+    @pytest.mark.parametrize("driver_class", [DeadDriver, WindowlessDriver])
+    def test_unusable_idle_driver_is_replaced_on_acquire(self, pool, driver_class):
+        """Verify that an idle driver that stopped responding is replaced by a new one."""
+        driver = driver_class()
+        pool._idle.append(driver)
+
+        leased = pool.acquire()
+
+        assert leased is not driver and pool.created == 1, "Dead idle driver was leased"
+        assert driver.quit_called, "Dead idle driver was not quit"
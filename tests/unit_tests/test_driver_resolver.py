@@ -0,0 +1,66 @@
+import json
+import time
+import pytest
+from utils import driver_resolver
+
+
+class FakeDriverManager:
+    """ChromeDriverManager stand-in: installs a new driver file per call."""
+
+    installs = []
+
+    def __init__(self, tmp_path):
+        self.tmp_path = tmp_path
+
+    def __call__(self):
+        return self
+
+    def install(self):
+        path = self.tmp_path / f"chromedriver_{len(self.installs)}"
+        path.write_text("")
+        self.installs.append(str(path))
+        return str(path)
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    FakeDriverManager.installs = []
+    monkeypatch.setattr(driver_resolver, "CHROMEDRIVER_PATH", None)
+    monkeypatch.setattr(driver_resolver, "DRIVER_OFFLINE", False)
+    monkeypatch.setattr(driver_resolver, "DRIVER_CACHE_FILE", str(tmp_path / "cache" / "chromedriver.json"))
+    monkeypatch.setattr(driver_resolver, "ChromeDriverManager", FakeDriverManager(tmp_path))
+    monkeypatch.setattr(driver_resolver, "_chrome_major_version", lambda: "124")
+
+    def resolve():
+        monkeypatch.setattr(driver_resolver, "_resolved_path", None)
+        return driver_resolver.resolve_chromedriver()
+
+    return resolve
+
+
+class TestDriverResolverCache:
+
+    def test_cache_reused_for_the_same_chrome_version(self, resolver):
+        """Verify that a second resolution for the same Chrome major version reuses the cached driver"""
+        first = resolver()
+        second = resolver()
+        assert second == first, f"Expected the cached driver = '{first}', got = '{second}'"
+        assert len(FakeDriverManager.installs) == 1, f"Expected one install, got = '{FakeDriverManager.installs}'"
+
+    def test_chrome_upgrade_resolves_a_new_driver(self, resolver, monkeypatch):
+        """Verify that a Chrome major version upgrade does not reuse the driver cached for the old version"""
+        old = resolver()
+        monkeypatch.setattr(driver_resolver, "_chrome_major_version", lambda: "125")
+        new = resolver()
+        assert new != old, f"Driver cached for Chrome 124 reused for Chrome 125 = '{new}'"
+        with open(driver_resolver.DRIVER_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+        assert set(cache) == {"124", "125"}, f"Expected one cache entry per Chrome version, got = '{cache}'"
+
+    def test_cache_of_the_previous_format_is_ignored(self, resolver):
+        """Verify that a cache entry without a Chrome version (previous format) is not reused"""
+        stale = resolver()
+        with open(driver_resolver.DRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"path": stale, "resolved_at": time.time()}, f)
+        path = resolver()
+        assert path != stale, f"Unversioned cache entry reused = '{path}'"
@@ -0,0 +1,47 @@
+from tests.unit_tests.performance_log import PAGE_URL, entry, finished_request
+from utils.har import build_har
+from utils.network_index import NetworkIndex
+
+DASHBOARD_URL = "https://sut.example/dashboard"
+
+
+class TestHar:
+
+    def test_redirect_url_from_http1_location_header(self):
+        """Verify that the redirect URL is read from the 'Location' header whatever its case."""
+        index = NetworkIndex()
+        index.add_entries(
+            finished_request("1", PAGE_URL, "L1", 300, method="POST", status=302, resource_type="Document",
+                             response={"headers": {"Location": DASHBOARD_URL}})
+            + finished_request("2", DASHBOARD_URL, "L2", 300, status=301, response={"headers": {"location": "/"}})
+        )
+
+        redirects = [entry["response"]["redirectURL"] for entry in build_har(index)["log"]["entries"]]
+
+        assert redirects == [DASHBOARD_URL, "/"], f"Unexpected redirect URLs = {redirects}"
+
+    def test_pages_and_timings(self):
+        """Verify that documents become pages with their load events and that timings follow the ResourceTiming."""
+        timing = {"requestTime": 1.0, "dnsStart": 2, "dnsEnd": 5, "connectStart": 5, "connectEnd": 15,
+                  "sslStart": 8, "sslEnd": 15, "sendStart": 15, "sendEnd": 16, "receiveHeadersEnd": 66}
+        index = NetworkIndex()
+        index.add_entries(
+            finished_request("1", PAGE_URL, "L1", 2000, resource_type="Document", start=1.0, end=1.1,
+                             response={"timing": timing})
+            + finished_request("2", "https://sut.example/app.js", "L1", 500, start=1.1, end=1.15)
+            + [entry("Page.loadEventFired", timestamp=1.3)]
+        )
+
+        har = build_har(index)["log"]
+        document, script = har["entries"]
+
+        assert [page["title"] for page in har["pages"]] == [PAGE_URL], f"Unexpected pages = {har['pages']}"
+        assert round(har["pages"][0]["pageTimings"]["onLoad"]) == 300, f"Unexpected load time = {har['pages'][0]}"
+        assert document["pageref"] == script["pageref"] == "page_1", "Subresource not attached to its page"
+        timings = {name: round(value) for name, value in document["timings"].items()}
+        assert timings == {"blocked": 2, "dns": 3, "connect": 10, "ssl": 7, "send": 1, "wait": 50, "receive": 34}, (
+            f"Unexpected timings = {timings}"
+        )
+        assert round(script["time"]) == 50 and script["timings"]["receive"] == script["time"], (
+            f"Request without ResourceTiming not counted as download = {script['timings']}"
+        )
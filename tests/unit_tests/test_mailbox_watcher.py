@@ -0,0 +1,217 @@
+import re
+import socket
+import time
+import pytest
+from utils import mailbox
+from utils.mailbox import MailboxWatcher, _find_text_part, _parse_imap_list
+
+RECIPIENT = "user@example.com"
+TEXT_STRUCTURE = b'("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 20 1)'
+
+
+def _email(recipient, subject="Reset your password", body="Open the link below."):
+    return f"To: {recipient}\r\nSubject: {subject}\r\n\r\n{body}\r\n".encode()
+
+
+class FakeImap:
+    """IMAP connection serving in-memory emails, recording the commands sent by the watcher."""
+
+    def __init__(self, emails=None, capabilities=("IMAP4REV1",), uid_validity=b"1"):
+        self.emails = dict(emails or {})  # UID -> raw email
+        self.seen = set()
+        self.capabilities = capabilities
+        self.uid_validity = uid_validity
+        self.structures = {}  # UID -> BODYSTRUCTURE response (bytes, or tuple for a literal)
+        self.commands = []
+
+    def login(self, user, password):
+        return "OK", [b"Logged in"]
+
+    def select(self, folder):
+        return "OK", [str(len(self.emails)).encode()]
+
+    def response(self, code):
+        return code, [self.uid_validity]
+
+    def create(self, folder):
+        self.commands.append(("CREATE", folder))
+        return "NO", [b"Mailbox exists"]
+
+    def expunge(self):
+        self.commands.append(("EXPUNGE",))
+        return "OK", [None]
+
+    def logout(self):
+        return "BYE", [b""]
+
+    def uid(self, command, *args):
+        self.commands.append((command, *args))
+        if command == "SEARCH":
+            first = int(re.search(r"UID (\d+):\*", args[1]).group(1))
+            uids = [uid for uid in sorted(self.emails) if uid not in self.seen]
+            matched = [uid for uid in uids if uid >= first] or uids[-1:]  # "n:*" matches the latest email
+            return "OK", [" ".join(map(str, matched)).encode()]
+        if command == "FETCH":
+            uids = [int(uid) for uid in args[0].split(",")]
+            if args[1] == "(BODYSTRUCTURE)":
+                return "OK", [self.structures.get(uids[0], b"1 (UID %d BODYSTRUCTURE %s)" % (uids[0], TEXT_STRUCTURE))]
+            data = []
+            for uid in uids:
+                header, body = self.emails[uid].split(b"\r\n\r\n", 1)
+                if args[1].startswith("(BODY.PEEK[HEADER"):
+                    data.append((b"%d (UID %d BODY[HEADER.FIELDS (TO SUBJECT)] {%d}" % (uid, uid, len(header)), header))
+                else:
+                    self.seen.add(uid)
+                    content = body if args[1] == "(BODY[1])" else self.emails[uid]
+                    data.append((b"%d (UID %d %s {%d}" % (uid, uid, args[1][1:-1].encode(), len(content)), content))
+                data.append(b")")
+            return "OK", data
+        return "OK", [None]
+
+
+class IdleConnection:
+    """Client end of a socket pair, read through a buffered file object as imaplib does."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.file = sock.makefile("rb")
+        self.sent = []
+
+    def _new_tag(self):
+        return b"A001"
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def readline(self):
+        return self.file.readline()
+
+
+@pytest.fixture
+def watcher(monkeypatch):
+    fake = FakeImap()
+    monkeypatch.setattr(mailbox.imaplib, "IMAP4_SSL", lambda server: fake)
+    watcher = MailboxWatcher("imap.example.com", "user", "password", processed_folder="Processed")
+    watcher._waiter_added = lambda: None  # Driven by the test instead of the watcher thread
+    watcher.fake = fake
+    return watcher
+
+
+def _searches(fake):
+    return [command[2].split()[1] for command in fake.commands if command[0] == "SEARCH"]
+
+
+class TestBodyStructure:
+
+    def test_nested_multipart_prefers_text_plain(self):
+        """Verify that the text/plain part nested in a multipart/related is found by its section number."""
+        structure = _parse_imap_list(
+            b'(("TEXT" "HTML" ("CHARSET" "iso-8859-1") NIL NIL "QUOTED-PRINTABLE" 100 2)'
+            b'(("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 50 1)'
+            b'("IMAGE" "PNG" ("NAME" "logo.png") "<logo>" NIL "BASE64" 10) "RELATED") "MIXED")'
+        )
+
+        part = _find_text_part(structure)
+
+        assert part == ("2.1", "text/plain", "utf-8", "7BIT"), f"Unexpected text part = {part}"
+
+    def test_nil_charset_and_escaped_strings(self):
+        """Verify that a NIL parameter list defaults to utf-8 and that escaped quotes are unescaped."""
+        assert _find_text_part(_parse_imap_list(b'("TEXT" "HTML" NIL NIL NIL "BASE64" 20 1)')) == (
+            "1", "text/html", "utf-8", "BASE64"
+        ), "NIL charset not defaulted to utf-8"
+        parsed = _parse_imap_list(b'("TEXT" "PLAIN" ("NAME" "a \\"quoted\\" name") NIL NIL "7BIT" 20 1)')
+        assert parsed[2] == ["NAME", 'a "quoted" name'], f"Escaped string not parsed = {parsed[2]}"
+
+    def test_email_without_text_part(self):
+        """Verify that an email without any text part has no text part."""
+        structure = _parse_imap_list(b'(("IMAGE" "PNG" NIL NIL NIL "BASE64" 10) "MIXED")')
+
+        assert _find_text_part(structure) is None, "Image part taken as the text part"
+
+
+class TestMailboxWatcher:
+
+    def test_scans_only_the_emails_above_the_last_uid(self, watcher):
+        """Verify that each scan starts after the last UID scanned and that unclaimed emails are kept."""
+        watcher.fake.emails = {1: _email("other@example.com"), 2: _email(RECIPIENT)}
+        watcher._connect()
+        first = watcher.expect(RECIPIENT, "Reset")
+        watcher._deliver_new_messages()
+
+        watcher.fake.emails[3] = _email(RECIPIENT, body="Second link.")
+        second = watcher.expect(RECIPIENT, "Reset")
+        watcher._deliver_new_messages()
+
+        assert first.result(timeout=0).get_payload() == "Open the link below.\r\n", "First email not dispatched"
+        assert second.result(timeout=0).get_payload() == "Second link.\r\n", "Second email not dispatched"
+        assert _searches(watcher.fake) == ["1:*", "3:*"], f"Unexpected searches = {_searches(watcher.fake)}"
+        header_fetches = [command[1] for command in watcher.fake.commands
+                          if command[0] == "FETCH" and command[2].startswith("(BODY.PEEK")]
+        assert header_fetches == ["1,2", "3"], f"Headers fetched again = {header_fetches}"
+        assert list(watcher._unclaimed) == [1] and watcher._processed == [2, 3], (
+            f"Unexpected unclaimed/processed UIDs = {list(watcher._unclaimed)}, {watcher._processed}"
+        )
+
+    def test_uid_validity_change_resets_the_cursor(self, watcher):
+        """Verify that a new UIDVALIDITY on reconnection makes the watcher scan the folder again."""
+        watcher.fake.emails = {1: _email("other@example.com")}
+        watcher._connect()
+        watcher.expect(RECIPIENT, "Reset")
+        watcher._deliver_new_messages()
+        watcher._processed.append(7)
+
+        watcher._connect()
+        assert watcher._last_uid == 1, "Cursor reset without a UIDVALIDITY change"
+
+        watcher.fake.uid_validity = b"2"
+        watcher._connect()
+        assert watcher._last_uid == 0 and not watcher._unclaimed and not watcher._processed, (
+            "Cursor, unclaimed or processed UIDs of the previous UIDVALIDITY kept"
+        )
+
+    def test_literal_body_structure_falls_back_to_the_whole_email(self, watcher):
+        """Verify that a BODYSTRUCTURE containing a literal makes the watcher fetch the whole email."""
+        watcher.fake.emails = {1: _email(RECIPIENT)}
+        watcher.fake.structures[1] = (b'1 (UID 1 BODYSTRUCTURE ("TEXT" "PLAIN" ("NAME" {5}', b"a(b)c")
+        watcher._connect()
+        future = watcher.expect(RECIPIENT, "Reset")
+        watcher._deliver_new_messages()
+
+        assert future.result(timeout=0)["To"] == RECIPIENT, "Email not dispatched after the fallback"
+        assert ("FETCH", "1", "(RFC822)") in watcher.fake.commands, "Whole email not fetched"
+
+    @pytest.mark.parametrize("capabilities, expected", [
+        (("IMAP4REV1", "MOVE"), [("MOVE", "1,2"), ("MOVE", "3,4"), ("MOVE", "5")]),
+        (("IMAP4REV1",), [("COPY", "1,2"), ("STORE", "1,2"), ("COPY", "3,4"), ("STORE", "3,4"),
+                          ("COPY", "5"), ("STORE", "5"), ("EXPUNGE",)]),
+    ])
+    def test_clean_up_in_batches(self, watcher, monkeypatch, capabilities, expected):
+        """Verify that the dispatched emails are moved in batches, with a single expunge without MOVE/UIDPLUS."""
+        monkeypatch.setattr(mailbox, "CLEAN_UP_BATCH_SIZE", 2)
+        watcher.fake.capabilities = capabilities
+        watcher._connect()
+        watcher._processed.extend([1, 2, 3, 4, 5])
+
+        watcher._clean_up()
+
+        commands = [command[:2] for command in watcher.fake.commands if command[0] != "CREATE"]
+        assert commands == expected, f"Unexpected clean-up commands = {commands}"
+        assert not watcher._processed, "Processed UIDs kept after the clean-up"
+
+
+    def test_idle_sees_exists_buffered_with_another_response(self, watcher):
+        """Verify that an EXISTS read in the same packet as other responses ends IDLE without waiting for select."""
+        client, server = socket.socketpair()
+        server.sendall(b"+ idling\r\n* 3 EXPUNGE\r\n* 5 EXISTS\r\nA001 OK IDLE terminated\r\n")
+        watcher._mail = IdleConnection(client)
+        watcher.idle_renew_interval = 5
+        start = time.monotonic()
+        try:
+            watcher._idle()
+        finally:
+            client.close()
+            server.close()
+
+        assert time.monotonic() - start < 1, "EXISTS left in the buffer until the IDLE renewal"
+        assert watcher._mail.sent == [b"A001 IDLE\r\n", b"DONE\r\n"], f"Unexpected commands = {watcher._mail.sent}"
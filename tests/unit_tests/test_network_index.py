@@ -0,0 +1,66 @@
+from tests.unit_tests.performance_log import PAGE_URL, entry, finished_request
+from utils.network_budgets import MB, NetworkBudget, check_network_budgets
+from utils.network_index import NetworkIndex, url_matches
+
+
+class TestNetworkIndex:
+
+    def test_page_size_is_counted_per_load(self):
+        """Verify that reloading a page does not add up the bytes of both loads."""
+        index = NetworkIndex()
+        for load in ("L1", "L2"):
+            index.add_entries(
+                finished_request(f"{load}.doc", PAGE_URL, load, int(1.5 * MB))
+                + finished_request(f"{load}.js", "https://sut.example/app.js", load, 100)
+            )
+
+        assert index.page_load_sizes(PAGE_URL) == [int(1.5 * MB) + 100] * 2, (
+            f"Unexpected page load sizes = {index.page_load_sizes(PAGE_URL)}"
+        )
+        violations = NetworkBudget(max_page_bytes=2 * MB).check(PAGE_URL, index)
+        assert not violations, f"Two loads under the budget reported as a violation = {violations}"
+        assert NetworkBudget(max_page_bytes=MB).check(PAGE_URL, index), "Load over the budget not reported"
+
+    def test_redirect_hops_are_separate_records(self):
+        """Verify that each hop of a redirect chain is recorded with its own status and duration."""
+        index = NetworkIndex()
+        index.add_entries([
+            entry("Network.requestWillBeSent", requestId="1", loaderId="L1", documentURL=PAGE_URL, timestamp=1.0,
+                  type="Document", request={"url": PAGE_URL, "method": "POST"}),
+            entry("Network.requestWillBeSent", requestId="1", loaderId="L1", timestamp=1.2, type="Document",
+                  documentURL="https://sut.example/dashboard",
+                  request={"url": "https://sut.example/dashboard", "method": "GET"},
+                  redirectResponse={"status": 302, "encodedDataLength": 300}),
+            entry("Network.responseReceived", requestId="1", response={"status": 200}),
+            entry("Network.loadingFinished", requestId="1", timestamp=1.5, encodedDataLength=5000),
+        ])
+
+        hops = [(record["method"], record["status"], round(record["duration_ms"])) for record in index.records]
+        assert hops == [("POST", 302, 200), ("GET", 200, 300)], f"Unexpected redirect hops = {hops}"
+        assert len(index.find(url=PAGE_URL, method="post", status=302)) == 1, "Redirected POST not found"
+
+    def test_url_matching(self):
+        """Verify that the query string is ignored and that a trailing '/' matches as a prefix."""
+        assert url_matches("https://sut.example/login/?next=%2F", "https://sut.example/login"), "Query not ignored"
+        assert url_matches("https://sut.example/api/users/1", "https://sut.example/api/"), "Prefix not matched"
+        assert not url_matches("https://sut.example/login-help", "https://sut.example/login"), "Exact URL as prefix"
+
+    def test_budget_violations(self):
+        """Verify that SUT server errors, request counts and request durations are reported against the budgets."""
+        index = NetworkIndex()
+        for number in range(3):
+            index.add_entries(finished_request(f"{number}", PAGE_URL, "L1", 100, method="POST", start=number,
+                                               end=number + (0.9 if number == 2 else 0.1)))
+        index.add_entries(finished_request("api", "https://sut.example/api", "L1", 100, status=503))
+        index.add_entries(finished_request("cdn", "https://sut.example.cdn.com/app.js", "L1", 100, status=500))
+
+        violations = check_network_budgets(
+            index, {PAGE_URL: NetworkBudget(method="POST", max_requests=2, max_duration_ms=800)},
+            base_url="https://sut.example",
+        )
+
+        assert violations == [
+            "GET 'https://sut.example/api' returned 503",
+            f"3 POST requests on '{PAGE_URL}' (budget = 2)",
+            f"POST '{PAGE_URL}' took 900 ms (budget = 800 ms)",
+        ], f"Unexpected violations = {violations}"
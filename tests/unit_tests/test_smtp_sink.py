@@ -0,0 +1,61 @@
+import smtplib
+import pytest
+from utils.mailbox import SmtpSink
+
+SENDER = "noreply@sut.example"
+RECIPIENT = "user@example.com"
+RESET_EMAIL = (
+    f"From: {SENDER}\r\n"
+    f"To: {RECIPIENT}\r\n"
+    "Subject: Reset your password\r\n"
+    "\r\n"
+    "Open the link below.\r\n"
+    ".hidden line\r\n"
+)
+
+
+@pytest.fixture
+def sink():
+    sink = SmtpSink(host="127.0.0.1", port=0)
+    yield sink
+    sink.close()
+
+
+def _send(sink, message=RESET_EMAIL, recipients=(RECIPIENT,)):
+    with smtplib.SMTP(sink.host, sink.port, timeout=5) as client:
+        client.sendmail(SENDER, list(recipients), message)
+
+
+class TestSmtpSink:
+
+    def test_session_hands_the_email_to_its_waiter(self, sink):
+        """Verify that an email sent over SMTP resolves the waiter of its recipient, dot-stuffed lines included."""
+        other = sink.expect("other@example.com", "Reset")
+        future = sink.expect(RECIPIENT.upper(), "reset", parse=lambda message: message.get_payload())
+
+        _send(sink)
+
+        assert future.result(timeout=5) == "Open the link below.\r\n.hidden line\r\n", (
+            f"Unexpected body = {future.result()!r}"
+        )
+        assert not other.done(), "Waiter of another recipient was resolved"
+
+    def test_email_delivered_before_its_waiter_is_kept(self, sink):
+        """Verify that an email nobody expects yet resolves the waiter registered afterwards."""
+        _send(sink)
+
+        future = sink.expect(RECIPIENT, "Reset")
+
+        assert future.done() and future.result()["To"] == RECIPIENT, "Early email was not handed to the late waiter"
+        assert not sink.expect(RECIPIENT, "Reset").done(), "The same email was handed to two waiters"
+
+    def test_discarded_waiter_is_not_resolved(self, sink):
+        """Verify that a discarded waiter is cancelled and the next email goes to the next waiter."""
+        discarded = sink.expect(RECIPIENT, "Reset")
+        sink.discard(discarded)
+
+        _send(sink)
+        future = sink.expect(RECIPIENT, "Reset")
+
+        assert discarded.cancelled(), "Discarded future was not cancelled"
+        assert future.result(timeout=5)["Subject"] == "Reset your password", "Email lost after a discard"
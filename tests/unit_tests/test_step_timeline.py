@@ -0,0 +1,68 @@
+import pytest
+from utils.step_timeline import StepTimeline, instrument_driver, percentile, render_timeline, timed_step
+
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+
+class FakePage:
+    def __init__(self, driver):
+        self.driver = driver
+
+    @timed_step("action")
+    def submit(self):
+        self.driver.execute("clickElement")
+        self.fill()
+
+    @timed_step("action")
+    def fill(self):
+        self.driver.execute("sendKeysToElement")
+
+    @timed_step("wait")
+    def wait_for_message(self):
+        raise TimeoutError("message not displayed")
+
+
+@pytest.fixture
+def page():
+    StepTimeline.reset()
+    driver = FakeDriver()
+    instrument_driver(driver)
+    instrument_driver(driver)  # Pooled drivers are instrumented once
+    yield FakePage(driver)
+    StepTimeline.reset()
+
+
+class TestStepTimeline:
+
+    def test_outermost_actions_are_recorded(self, page):
+        """Verify that nested actions are folded into the outermost step with all their commands."""
+        page.submit()
+        with pytest.raises(TimeoutError):
+            page.wait_for_message()
+
+        steps = [(step["action"], step["category"], step["commands"], step["failed"]) for step in StepTimeline.steps]
+        assert steps == [("submit", "action", 2, False), ("wait_for_message", "wait", 0, True)], (
+            f"Unexpected steps = {steps}"
+        )
+        assert StepTimeline.steps[0]["page"] == "FakePage", "Page class not recorded"
+
+    def test_percentile_and_timeline(self):
+        """Verify the nearest-rank percentile and the slowest steps listed under the timeline."""
+        assert percentile([5, 1, 4, 2, 3], 50) == 3 and percentile([5, 1, 4, 2, 3], 95) == 5, "Wrong percentile"
+        assert percentile([7], 0) == 7, "Percentile 0 should return the smallest value"
+
+        steps = [
+            {"action": "open", "page": "LoginPage", "category": "navigation", "start": 0.0, "end": 1.0,
+             "commands": 3, "failed": False},
+            {"action": "click", "page": "LoginPage", "category": "action", "start": 1.0, "end": 1.2,
+             "commands": 1, "failed": True},
+        ]
+        timeline = render_timeline(steps)
+
+        assert "2 steps in 1.2s | slowest: open 1.00s/3 cmd, click 0.20s/1 cmd" in timeline, (
+            f"Unexpected timeline summary = {timeline}"
+        )
+        assert "#e03131" in timeline and render_timeline([]) == "", "Failed step not highlighted"
@@ -0,0 +1,46 @@
+import json
+from utils.test_durations import DEFAULT_DURATION, lpt_makespan, load_durations, predict_durations, save_durations
+
+
+class TestTestDurations:
+
+    def test_moving_average(self, tmp_path):
+        """Verify that the measured durations are merged as an exponential moving average."""
+        path = str(tmp_path / "durations.json")
+        save_durations(path, {"a.py::test_1": 10.0}, smoothing=0.25)
+        save_durations(path, {"a.py::test_1": 2.0, "a.py::test_2": 4.0}, smoothing=0.25)
+
+        assert load_durations(path) == {"a.py::test_1": 8.0, "a.py::test_2": 4.0}, (
+            f"Unexpected durations = {load_durations(path)}"
+        )
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        """Verify that a corrupted durations file is read as empty."""
+        path = tmp_path / "durations.json"
+        path.write_text("{not json")
+
+        assert load_durations(str(path)) == {}, "Corrupted durations file not ignored"
+        assert load_durations(str(tmp_path / "missing.json")) == {}, "Missing durations file not ignored"
+
+    def test_longest_tests_first(self):
+        """Verify the predictions of unseen tests and that sorting by them puts the longest tests first."""
+        durations = {"a.py::test_1": 2.0, "a.py::test_2": 6.0, "b.py::test_1": 1.0}
+        nodeids = ["b.py::test_1", "a.py::test_new", "c.py::test_new", "a.py::test_2"]
+
+        predicted = predict_durations(nodeids, durations)
+
+        assert predicted == {"b.py::test_1": 1.0, "a.py::test_new": 4.0, "c.py::test_new": 2.0, "a.py::test_2": 6.0}, (
+            f"Unexpected predictions = {predicted}"
+        )
+        assert sorted(nodeids, key=predicted.get, reverse=True) == [
+            "a.py::test_2", "a.py::test_new", "c.py::test_new", "b.py::test_1"
+        ], "Tests not ordered longest first"
+        assert predict_durations(["a.py::test_1"], {}) == {"a.py::test_1": DEFAULT_DURATION}, (
+            "Default duration not used without any recorded duration"
+        )
+
+    def test_lpt_makespan(self):
+        """Verify the makespan of a longest-processing-time-first dispatch."""
+        assert lpt_makespan([3, 3, 5, 4, 3], 2) == 10, "Unexpected makespan on 2 workers"
+        assert lpt_makespan([3, 1], 0) == 4, "No worker should count as one"
+        assert lpt_makespan([], 4) == 0, "Unexpected makespan without tests"
@@ -0,0 +1,167 @@
+"""
+Pool of test accounts provisioned over HTTP in the background and leased by the account fixtures.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.provisioning import AccountProvisioner, ProvisioningError
+
+logger = logging.getLogger(__name__)
+
+# Account types: what is created for each one
+ACCOUNT_TYPES = {
+    "user": "user",
+    "company": "user + company",
+    "subscribed": "user + company + 'essai' offer",
+}
+
+
+class AccountPool:
+    """
+    Accounts created ahead of the tests by a thread pool, one queue per account type.
+
+    A lease takes the oldest ready account (O(1)). When none is ready but some are still
+    being created, the lease waits for one; when none is left, it is a miss and the
+    fixture provisions its own account. Leased accounts are never given back: tests
+    modify them (company, subscription, password).
+    """
+
+    def __init__(self, targets: dict, workers: int = 4, base_url: str = None, provisioner_timeout: float = 15):
+        """
+        Args:
+            targets: number of accounts to create per account type
+            workers: accounts created in parallel
+            base_url: SUT root URL (Urls.BASE_URL by default)
+            provisioner_timeout: timeout of each HTTP request (seconds)
+        """
+        self.targets = {account_type: count for account_type, count in targets.items() if count > 0}
+        self.workers = workers
+        self._provisioner_kwargs = {"timeout": provisioner_timeout}
+        if base_url:
+            self._provisioner_kwargs["base_url"] = base_url
+        self._ready = {account_type: queue.SimpleQueue() for account_type in ACCOUNT_TYPES}
+        self._pending = {account_type: 0 for account_type in ACCOUNT_TYPES}  # Submitted, not created yet
+        self._lock = threading.Lock()
+        self._executor = None
+        self._closed = False
+        self.stats = {
+            account_type: {"hits": 0, "waits": 0, "misses": 0, "wait_time": 0.0, "created": 0, "failed": 0}
+            for account_type in ACCOUNT_TYPES
+        }
+
+    def start(self):
+        """Submit the creation of every account, the account types interleaved so that each one fills early."""
+        if not self.targets:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="account-pool")
+        remaining = dict(self.targets)
+        while remaining:
+            for account_type in list(remaining):
+                with self._lock:
+                    self._pending[account_type] += 1
+                self._executor.submit(self._create, account_type)
+                remaining[account_type] -= 1
+                if not remaining[account_type]:
+                    del remaining[account_type]
+        logger.info(
+            "Account pool filling: " + ", ".join(f"{count} {account_type}" for account_type, count in self.targets.items())
+        )
+
+    def lease(self, account_type: str, timeout: float = 30) -> tuple:
+        """
+        Take a ready account of the given type.
+        Args:
+            timeout: maximum wait for an account still being created (seconds)
+        Returns:
+            tuple: (account or None, "hit" | "wait" | "miss", seconds waited)
+                   account: {"type", "user_data", "company_data", "provisioner"}
+        """
+        ready = self._ready[account_type]
+        stats = self.stats[account_type]
+        try:
+            account = ready.get_nowait()
+            with self._lock:
+                stats["hits"] += 1
+            return account, "hit", 0.0
+        except queue.Empty:
+            pass
+
+        start = time.perf_counter()
+        deadline = start + timeout
+        account = None
+        # Accounts still being created may fail: check the pending count regularly
+        while account is None and self._pending[account_type] and time.perf_counter() < deadline:
+            try:
+                account = ready.get(timeout=min(0.5, max(deadline - time.perf_counter(), 0)))
+            except queue.Empty:
+                pass
+        if account is None:
+            try:
+                account = ready.get_nowait()  # Created between the last check and the end of the wait
+            except queue.Empty:
+                pass
+        waited = time.perf_counter() - start
+        with self._lock:
+            if account is None:
+                stats["misses"] += 1
+                return None, "miss", waited
+            stats["waits"] += 1
+            stats["wait_time"] += waited
+        return account, "wait", waited
+
+    def close(self):
+        """Cancel the accounts not created yet and close the sessions of the unused ones."""
+        with self._lock:
+            self._closed = True  # Checked under the lock before queueing a created account
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        unused = 0
+        for ready in self._ready.values():
+            while True:
+                try:
+                    ready.get_nowait()["provisioner"].close()
+                    unused += 1
+                except queue.Empty:
+                    break
+        created = sum(stats["created"] for stats in self.stats.values())
+        logger.info(f"Account pool closed: {created} account(s) created, {unused} unused")
+
+    def _create(self, account_type: str):
+        provisioner = AccountProvisioner(**self._provisioner_kwargs)
+        try:
+            if self._closed:
+                provisioner.close()
+                return
+            user_data = provisioner.register_user()
+            company_data = provisioner.register_company() if account_type in ("company", "subscribed") else None
+            if account_type == "subscribed":
+                provisioner.subscribe("essai")
+        except ProvisioningError as e:
+            logger.warning(f"Account pool failed to create a '{account_type}' account | {str(e)}")
+            provisioner.close()
+            with self._lock:
+                self.stats[account_type]["failed"] += 1
+                self._pending[account_type] -= 1
+            return
+        except Exception as e:
+            # Nobody reads the future of this task: the error is only visible here
+            logger.exception(f"Account pool failed to create a '{account_type}' account | {str(e)}")
+            provisioner.close()
+            with self._lock:
+                self.stats[account_type]["failed"] += 1
+                self._pending[account_type] -= 1
+            return
+        with self._lock:
+            self.stats[account_type]["created"] += 1
+            self._pending[account_type] -= 1
+            if not self._closed:
+                self._ready[account_type].put({
+                    "type": account_type,
+                    "user_data": user_data,
+                    "company_data": company_data,
+                    "provisioner": provisioner,
+                })
+                return
+        provisioner.close()  # Created after close(): the queues were already drained
@@ -0,0 +1,60 @@
+"""
+Background writer for the test artifacts (logs, screenshots, network captures).
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactWriter:
+    """
+    Encodes and writes artifacts in a thread pool, so that a failing test
+    only pays for grabbing the raw data from the driver.
+
+    Background tasks never log errors: an ERROR record would be attributed
+    to the test running at that time by the in-memory log handler.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.write_time = 0.0  # Cumulated time spent writing in the background (seconds)
+        self.failures = []
+        self._executor = None
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args):
+        """
+        Schedule func(*args) in the background.
+        Args:
+            func: function writing one artifact (its first argument is the output path)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="artifact-writer")
+        self._futures.append(self._executor.submit(self._run, func, *args))
+
+    def flush(self):
+        """Wait for every scheduled artifact to be written."""
+        futures, self._futures = self._futures, []
+        wait(futures)
+
+    def close(self):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _run(self, func, *args):
+        start_time = time.perf_counter()
+        try:
+            func(*args)
+        except Exception as e:
+            with self._lock:
+                self.failures.append(f"{args[0] if args else func.__name__}: {e}")
+            logger.warning(f"Failed to write artifact {args[0] if args else func.__name__} | {str(e)}")
+        finally:
+            with self._lock:
+                self.write_time += time.perf_counter() - start_time
@@ -0,0 +1,127 @@
+"""
+Snapshots of an authenticated browser state (cookies, localStorage, sessionStorage),
+restored into other browsers to skip the registration and login flows.
+"""
+import json
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+from utils.urls import Urls
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_STORAGE_SCRIPT = """
+const entries = storage => {
+    try { return Object.entries(storage); } catch (e) { return []; }
+};
+return {local: entries(localStorage), session: entries(sessionStorage)};
+"""
+
+# Seeds the storage of the first document of the origin, before the page scripts run
+RESTORE_STORAGE_SCRIPT = """
+(() => {{
+    if (location.origin !== {origin}) return;
+    try {{
+        {local}.forEach(([key, value]) => localStorage.setItem(key, value));
+        {session}.forEach(([key, value]) => sessionStorage.setItem(key, value));
+    }} catch (e) {{}}
+}})();
+"""
+
+EXPIRY_MARGIN = 60  # A snapshot is dropped this many seconds before its first cookie expires
+
+# Cookie fields accepted by Network.setCookies
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+
+class BrowserStateSnapshot:
+    """Browser state of one account, with the fixture data of the account."""
+
+    def __init__(self, cookies: list, local_storage: list, session_storage: list, data, expires_at: float):
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+        self.data = data
+        self.expires_at = expires_at
+
+    def is_expired(self) -> bool:
+        return time.time() >= self.expires_at - EXPIRY_MARGIN
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def capture_browser_state(driver, data, max_age: float) -> BrowserStateSnapshot:
+    """
+    Snapshot the SUT state of the browser (the current page must belong to the SUT).
+    Args:
+        data: fixture data returned on restore
+        max_age: lifetime of the snapshot when no cookie expires earlier (seconds)
+    """
+    host = urlsplit(Urls.BASE_URL).hostname
+    cookies = [
+        {field: cookie[field] for field in COOKIE_FIELDS if field in cookie}
+        for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        if host.endswith(cookie["domain"].lstrip("."))
+    ]
+    for cookie in cookies:
+        if cookie.get("expires", -1) <= 0:
+            cookie.pop("expires", None)  # Session cookie
+    storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+    expires = [cookie["expires"] for cookie in cookies if "expires" in cookie]
+    return BrowserStateSnapshot(
+        cookies,
+        storage["local"],
+        storage["session"],
+        data,
+        min(expires + [time.time() + max_age]),
+    )
+
+
+def restore_browser_state(driver, snapshot: BrowserStateSnapshot, url: str):
+    """
+    Restore the snapshot into a blank browser and open the URL with it.
+    Cookies are set through CDP (no navigation needed); the storage is seeded
+    by a script that only runs for the documents of this navigation.
+    """
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": snapshot.cookies})
+    script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": RESTORE_STORAGE_SCRIPT.format(
+            origin=json.dumps(_origin(url)),
+            local=json.dumps(snapshot.local_storage),
+            session=json.dumps(snapshot.session_storage),
+        )
+    })
+    try:
+        driver.get(url)
+    finally:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+
+class BrowserStateStore:
+    """Latest valid snapshot per account type, shared by the tests of the worker process."""
+
+    def __init__(self):
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def get(self, account_type: str):
+        """Valid snapshot of the account type, or None (expired snapshots are dropped)."""
+        with self._lock:
+            snapshot = self._snapshots.get(account_type)
+            if snapshot is not None and snapshot.is_expired():
+                logger.info(f"Browser state snapshot expired = '{account_type}'")
+                del self._snapshots[account_type]
+                return None
+            return snapshot
+
+    def put(self, account_type: str, snapshot: BrowserStateSnapshot):
+        with self._lock:
+            self._snapshots[account_type] = snapshot
+
+    def invalidate(self, account_type: str):
+        with self._lock:
+            self._snapshots.pop(account_type, None)
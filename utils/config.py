@@ -6,16 +6,106 @@ import os
 # Selenium Configuration
 BROWSER = "chrome"
 HEADLESS = False
-IMPLICIT_WAIT = 10
+# BasePage relies on explicit waits. A non-zero implicit wait is switched off during every
+# explicit wait so that both are never stacked, but it makes each wait cost two extra commands.
+IMPLICIT_WAIT = 0
 EXPLICIT_WAIT= 10
 PAGE_LOAD_TIMEOUT = 30
+NAVIGATION_EVENT_SLICE_MS = 1000  # Max time a navigation wait listens for page events before checking the URL again
+# Level of the per-action page object logs: DEBUG, INFO, WARNING, ERROR
+# or QUIET (per-action logs dropped entirely, warnings and errors kept for the report)
+PAGE_LOG_LEVEL = os.getenv("PAGE_LOG_LEVEL", "INFO")
+# BasePage.fill_form sends real keystrokes to each field (as a user would).
+# STRICT_KEYSTROKES=0 opts in to setting the values by script: faster, but the keyboard
+# events and the maxlength/filtering done while typing are skipped.
+STRICT_KEYSTROKES = os.getenv("STRICT_KEYSTROKES", "1") == "1"
+
+# Driver Pool Configuration
+# When enabled, each worker reuses warm browser sessions between tests.
+# Tests marked with @pytest.mark.fresh_browser always get a dedicated browser.
+DRIVER_POOL_ENABLED = True
+DRIVER_POOL_SIZE = 1  # Idle browser sessions kept warm per worker
+DRIVER_POOL_MAX_TESTS = 25  # A pooled browser is recycled after serving this many tests
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Chromedriver Resolution
+# CHROMEDRIVER_PATH pins a local binary and skips webdriver-manager entirely (air-gapped runners).
+# In offline mode, a stale cached binary is reused instead of resolving a new one.
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
+DRIVER_OFFLINE = os.getenv("DRIVER_OFFLINE", "0") == "1"
+DRIVER_CACHE_FILE = os.path.join(PROJECT_ROOT, ".driver_cache", "chromedriver.json")
+DRIVER_CACHE_TTL_HOURS = 24
+
+# Account Provisioning
+# "http": fixtures create users/companies with direct form posts and hand the cookies to the browser
+# (falling back to the UI when it fails), "ui": fixtures drive the registration pages.
+PROVISIONING_MODE = os.getenv("PROVISIONING_MODE", "http")
+# Accounts needed by the collected tests are provisioned over HTTP in the background
+# before and during the run, and leased by the account fixtures ("http" mode only)
+ACCOUNT_POOL_ENABLED = os.getenv("ACCOUNT_POOL", "1") == "1"
+ACCOUNT_POOL_WORKERS = 4  # Accounts created in parallel
+ACCOUNT_POOL_LEASE_TIMEOUT = 30  # Maximum wait for an account still being created (seconds)
+# Browser state snapshots (cookies, localStorage, sessionStorage) restored by the shared session fixtures
+BROWSER_STATE_MAX_AGE = 30 * 60  # Lifetime of a snapshot when no cookie expires earlier (seconds)
+
+# Network Budgets
+# The traffic of every browser test is checked against utils/network_budgets.py once the test body passes.
+# NETWORK_BUDGETS: "report" (violations logged and listed in the report), "enforce" (a violation fails
+# the test, for a dedicated performance environment) or "0" (traffic indexed, budgets not checked)
+NETWORK_BUDGETS_MODE = os.getenv("NETWORK_BUDGETS", "report")
+NETWORK_BUDGETS_ENABLED = NETWORK_BUDGETS_MODE != "0"
+NETWORK_BUDGETS_ENFORCED = NETWORK_BUDGETS_MODE == "enforce"
+
+# Log records kept in memory per test (the oldest ones are dropped), written to the test steps log on failure
+MEMORY_LOG_CAPACITY = 2000
+
+# Artifacts of failed tests are encoded and written by a background thread pool
+ARTIFACT_WRITER_THREADS = 4
+
+# Core Web Vitals (LCP, CLS, INP/FID, long tasks, TBT) of the pages visited by each browser test
+WEB_VITALS_ENABLED = True
+
+# Page-Load Benchmark (pytest --page-load-benchmark tests/benchmark_tests)
+PAGE_LOAD_WARMUP = int(os.getenv("PAGE_LOAD_WARMUP", "2"))  # Loads discarded before measuring
+PAGE_LOAD_ITERATIONS = int(os.getenv("PAGE_LOAD_ITERATIONS", "10"))  # Measured loads per page and cache variant
+# Version whose stored results are the baseline (no comparison when unset)
+PAGE_LOAD_BASELINE_VERSION = os.getenv("PAGE_LOAD_BASELINE_VERSION")
+PAGE_LOAD_SIGNIFICANCE = 0.01  # p-value below which a slowdown is significant
+PAGE_LOAD_MIN_REGRESSION = 0.10  # Ignore significant slowdowns of the median below 10%
+
+# Test Durations
+# Recorded after each run and used to dispatch the longest tests first with pytest-xdist
+TEST_DURATIONS_FILE = os.path.join(PROJECT_ROOT, ".test_durations.json")
+TEST_DURATIONS_SMOOTHING = 0.5  # Weight of the latest run in the recorded duration
+
+# Failure Handling
+FAILED_FIRST = True  # Run the tests that failed in the last run first (pytest cache)
+# Once this many tests fail during setup in the same fixture with the same normalized
+# failure message, the remaining tests using that fixture are skipped (0 disables it)
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))
+
+# Mailbox
+# Backend receiving the password reset emails, shared by the session:
+# "imap": the real test mailbox (ResetPasswordData.IMAP_*), "smtp": in-process SMTP sink the SUT delivers to
+MAIL_BACKEND = os.getenv("MAIL_BACKEND", "imap")
+SMTP_SINK_HOST = os.getenv("SMTP_SINK_HOST", "127.0.0.1")
+# The SUT relays its emails to a single address: the sink cannot be used with pytest-xdist (-n)
+SMTP_SINK_PORT = int(os.getenv("SMTP_SINK_PORT", "2525"))
+MAIL_BENCHMARK_ITERATIONS = int(os.getenv("MAIL_BENCHMARK_ITERATIONS", "5"))  # Reset emails per backend benchmark
+MAIL_POLL_INTERVAL = 5  # Seconds between two searches when the IMAP server does not support IDLE
+MAIL_IDLE_RENEW_INTERVAL = 25  # IDLE is restarted after this many seconds to keep the connection alive
+# The reset emails handed to the tests are moved to this folder at the end of the session
+# (deleted when unset), so that the searches of the next sessions stay fast
+MAIL_PROCESSED_FOLDER = os.getenv("MAIL_PROCESSED_FOLDER")
+MAIL_CLEANUP = os.getenv("MAIL_CLEANUP", "1") == "1"
+
 # Directory Configuration
 SCREENSHOT_DIR = os.path.join(PROJECT_ROOT, "reports", "screenshots")
 LOGS_DIR = os.path.join(PROJECT_ROOT, "reports", "test_steps_logs")
 NETWORK_LOGS_DIR = os.path.join(PROJECT_ROOT, "reports", "network_logs")
 REPORT_DIR = os.path.join(PROJECT_ROOT, "reports")
+WEB_VITALS_DIR = os.path.join(PROJECT_ROOT, "reports", "web_vitals")  # Web Vitals file of each run
+BENCHMARK_RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")  # Page-load results per SUT version
 
 # System Under Test (SUT) Configuration
 SUT = "RapidoCRM"
@@ -0,0 +1,130 @@
+"""
+Pool of warm browser sessions reused across tests.
+"""
+import logging
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from utils.urls import Urls
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """
+    Keeps warm WebDriver sessions for the current worker process.
+
+    A session is reset between tests (cookies, storage, cache, extra windows)
+    instead of being quit, and is recycled after `max_tests` tests or as soon
+    as it stops responding.
+    """
+
+    def __init__(self, factory, size: int = 1, max_tests: int = 25):
+        """
+        Args:
+            factory: callable returning a new WebDriver instance
+            size: maximum number of idle sessions kept warm
+            max_tests: number of tests a session may serve before being recycled
+        """
+        self.factory = factory
+        self.size = max(size, 1)
+        self.max_tests = max_tests
+        self._idle = []
+        self._uses = {}
+        self.created = 0
+        self.recycled = 0
+
+    def acquire(self):
+        """
+        Lease a live browser session, creating one if no idle session is available.
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            if self._is_alive(driver):
+                return driver
+            logger.warning("Pooled browser stopped responding, it will be replaced")
+            self._discard(driver)
+
+        driver = self.factory()
+        self.created += 1
+        self._uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver):
+        """
+        Give a session back to the pool after a test.
+        The session is reset, or quit if it is worn out, crashed or not needed anymore.
+        """
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if uses >= self.max_tests:
+            logger.info(f"Recycling pooled browser after {uses} tests")
+            self._discard(driver)
+            return
+
+        if len(self._idle) >= self.size:
+            self._quit(driver)
+            return
+
+        try:
+            self.reset(driver)
+        except Exception as e:  # A dead chromedriver raises urllib3/connection errors, not WebDriverException
+            logger.warning(f"Failed to reset pooled browser, it will be replaced | {str(e)}")
+            self._discard(driver)
+            return
+
+        self._idle.append(driver)
+
+    def close(self):
+        """Quit every idle session (called at the end of the session)."""
+        while self._idle:
+            self._quit(self._idle.pop())
+        logger.info(
+            f"Driver pool closed: {self.created} browser(s) started, "
+            f"{self.recycled} recycled"
+        )
+
+    @staticmethod
+    def reset(driver):
+        """
+        Bring a browser session back to a blank state:
+        close extra windows, clear cookies, storage and cache, drain performance logs.
+        """
+        handles = driver.window_handles
+        if not handles:
+            raise WebDriverException("No window left (the test closed it)")
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        parts = urlsplit(Urls.BASE_URL)
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "storageTypes": "all",
+        })
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.get("about:blank")
+
+        # Performance logs are buffered by chromedriver, reading them empties the buffer
+        # so that the next test only sees its own network traffic.
+        driver.get_log("performance")
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            return bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        self.recycled += 1
+        self._quit(driver)
+
+    def _quit(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.info(f"The browser was already closed or an error occurred | {str(e)}")
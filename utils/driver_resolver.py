@@ -0,0 +1,112 @@
+"""
+Resolves the chromedriver binary once and shares the result between processes.
+"""
+import json
+import logging
+import os
+import time
+from filelock import FileLock
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+from utils.config import (
+    CHROMEDRIVER_PATH,
+    DRIVER_OFFLINE,
+    DRIVER_CACHE_FILE,
+    DRIVER_CACHE_TTL_HOURS
+)
+
+logger = logging.getLogger(__name__)
+
+# Resolved path and resolution time (seconds) for the current process
+_resolved_path = None
+resolution_time = None
+
+
+def resolve_chromedriver() -> str:
+    """
+    Return the path of the chromedriver binary to use.
+
+    Resolution order:
+    1. Pinned local binary (CHROMEDRIVER_PATH), no network access at all.
+    2. Shared cache file, keyed by the installed Chrome major version and
+       valid for DRIVER_CACHE_TTL_HOURS (ignored in offline mode).
+    3. webdriver-manager download, the result is written to the shared cache.
+
+    The cache is protected by a file lock so that pytest-xdist workers
+    starting at the same time resolve the driver only once.
+
+    Raises:
+        FileNotFoundError: If the pinned binary does not exist,
+                           or no cached binary is available in offline mode.
+    """
+    global _resolved_path, resolution_time
+    if _resolved_path:
+        return _resolved_path
+
+    start_time = time.perf_counter()
+
+    if CHROMEDRIVER_PATH:
+        if not os.path.isfile(CHROMEDRIVER_PATH):
+            raise FileNotFoundError(f"Pinned chromedriver not found at = '{CHROMEDRIVER_PATH}'")
+        path, source = CHROMEDRIVER_PATH, "pinned binary"
+    else:
+        chrome_major = _chrome_major_version()
+        os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+        with FileLock(f"{DRIVER_CACHE_FILE}.lock"):
+            path = _read_cache(chrome_major)
+            source = "shared cache"
+            if not path:
+                if DRIVER_OFFLINE:
+                    raise FileNotFoundError(
+                        "Offline mode is enabled but no cached chromedriver is available. "
+                        "Set CHROMEDRIVER_PATH to a local binary."
+                    )
+                path = ChromeDriverManager().install()
+                source = "webdriver-manager"
+                _write_cache(chrome_major, path)
+
+    resolution_time = time.perf_counter() - start_time
+    _resolved_path = path
+    logger.info(f"Chromedriver resolved from {source} in {resolution_time:.3f}s = '{path}'")
+    return path
+
+
+def _chrome_major_version() -> str:
+    """Return the major version of the installed Chrome, "unknown" if it cannot be detected."""
+    version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    return version.split(".")[0] if version else "unknown"
+
+
+def _load_cache() -> dict:
+    """Return the cache entries by Chrome major version (entries of an older cache format are dropped)."""
+    try:
+        with open(DRIVER_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {major: entry for major, entry in cache.items() if isinstance(entry, dict)}
+
+
+def _read_cache(chrome_major):
+    """Return the driver path cached for this Chrome major version if it is still usable, None otherwise."""
+    entry = _load_cache().get(chrome_major)
+    if not entry:
+        return None
+
+    path = entry.get("path")
+    if not path or not os.path.isfile(path):
+        return None
+
+    age_hours = (time.time() - entry.get("resolved_at", 0)) / 3600
+    if age_hours > DRIVER_CACHE_TTL_HOURS and not DRIVER_OFFLINE:
+        return None
+    return path
+
+
+def _write_cache(chrome_major, path):
+    cache = _load_cache()
+    cache[chrome_major] = {"path": path, "resolved_at": time.time()}
+    with open(DRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
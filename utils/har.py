@@ -0,0 +1,232 @@
+"""
+HAR 1.2 export and waterfall view of the traffic recorded in a NetworkIndex.
+"""
+import html
+import json
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qsl
+from utils.config import SUT, SUT_VERSION
+
+HAR_VERSION = "1.2"
+
+# HAR timing phases, in waterfall order, with their waterfall colors
+TIMING_PHASES = (
+    ("blocked", "#c8c8c8"),
+    ("dns", "#1f9e89"),
+    ("connect", "#f29e39"),
+    ("ssl", "#c75dcd"),
+    ("send", "#3d6ee3"),
+    ("wait", "#37b24d"),
+    ("receive", "#1c7ed6"),
+)
+
+
+def build_har(network_index) -> dict:
+    """
+    Convert the indexed requests to a HAR 1.2 log.
+    Timings are derived from the CDP ResourceTiming of each response
+    and the end of loading, in milliseconds (-1 when not applicable).
+    """
+    pages = []
+    entries = []
+    page_by_document = {}
+
+    for record in network_index.records:
+        if record["resource_type"] == "Document" and record["method"] == "GET":
+            page_id = f"page_{len(pages) + 1}"
+            pages.append({
+                "startedDateTime": _iso_time(record["wall_time"]),
+                "id": page_id,
+                "title": record["url"],
+                "pageTimings": _page_timings(network_index, record["start"]),
+                "_start": record["start"],
+            })
+            page_by_document[record["url"]] = page_id
+        entries.append(_build_entry(record, page_by_document.get(record["document_url"])))
+
+    for page in pages:
+        del page["_start"]
+
+    return {
+        "log": {
+            "version": HAR_VERSION,
+            "creator": {"name": f"{SUT} test automation", "version": SUT_VERSION},
+            "pages": pages,
+            "entries": entries,
+        }
+    }
+
+
+def write_har(har: dict, output_path):
+    """Write a HAR log built by build_har."""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(har, f, indent=2, ensure_ascii=False)
+
+
+def write_waterfall(har: dict, output_path, title: str = "Network waterfall"):
+    """
+    Write a static HTML waterfall of a HAR log (no script, opens from the report).
+    """
+    entries = har["log"]["entries"]
+    starts = [entry["_start"] for entry in entries if entry.get("_start") is not None]
+    origin = min(starts) if starts else 0
+    span = max(
+        [(entry["_start"] - origin) * 1000 + max(entry["time"], 0) for entry in entries if entry.get("_start") is not None]
+        or [1]
+    ) or 1
+
+    rows = []
+    for entry in entries:
+        offset = ((entry["_start"] - origin) * 1000) if entry.get("_start") is not None else 0
+        bars = "".join(
+            f'<span class="phase" title="{name}: {entry["timings"][name]:.1f} ms" '
+            f'style="width:{entry["timings"][name] / span * 100:.3f}%;background:{color}"></span>'
+            for name, color in TIMING_PHASES
+            if name != "ssl" and entry["timings"].get(name, -1) > 0  # ssl is included in connect
+        )
+        status = entry["response"]["status"] or "failed"
+        rows.append(
+            f'<tr><td class="url" title="{html.escape(entry["request"]["url"])}">'
+            f'{html.escape(entry["request"]["method"])} {html.escape(entry["request"]["url"])}</td>'
+            f'<td>{status}</td><td>{_format_size(entry["response"]["_transferSize"])}</td>'
+            f'<td>{entry["time"]:.0f} ms</td>'
+            f'<td class="bar"><span class="offset" style="width:{offset / span * 100:.3f}%"></span>{bars}</td></tr>'
+        )
+
+    legend = "".join(
+        f'<span class="legend"><span class="phase" style="background:{color}"></span>{name}</span>'
+        for name, color in TIMING_PHASES
+    )
+    content = "\n".join([
+        "<!DOCTYPE html>",
+        f"<html><head><meta charset='utf-8'><title>{html.escape(title)}</title><style>",
+        "body { font-family: sans-serif; font-size: 12px; }",
+        "table { border-collapse: collapse; width: 100%; table-layout: fixed; }",
+        "td, th { border-bottom: 1px solid #eee; padding: 2px 4px; white-space: nowrap; }",
+        "td.url { overflow: hidden; text-overflow: ellipsis; width: 35%; }",
+        "td.bar { width: 45%; }",
+        ".offset, .phase { display: inline-block; height: 10px; }",
+        ".legend { margin-right: 12px; } .legend .phase { width: 10px; margin-right: 4px; }",
+        "</style></head><body>",
+        f"<h3>{html.escape(title)}</h3>",
+        f"<p>{len(entries)} requests, {span:.0f} ms | {legend}</p>",
+        "<table><tr><th>Request</th><th>Status</th><th>Transferred</th><th>Time</th><th>Waterfall</th></tr>",
+        *rows,
+        "</table></body></html>",
+    ])
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _build_entry(record, pageref):
+    timings = _timings(record)
+    total = sum(value for name, value in timings.items() if name != "ssl" and value > 0)
+    if record["duration_ms"] is not None and not record["timing"]:
+        # No ResourceTiming (cache, data URL, failure): the whole duration is the download
+        total = record["duration_ms"]
+        timings["receive"] = total
+    headers_size = record["headers_size"]
+    body_transfer = record["transfer_size"] - headers_size if headers_size >= 0 else record["transfer_size"]
+
+    entry = {
+        "startedDateTime": _iso_time(record["wall_time"]),
+        "time": total,
+        "request": {
+            "method": record["method"],
+            "url": record["url"],
+            "httpVersion": record["protocol"] or "",
+            "cookies": [],
+            "headers": _headers(record["request_headers"]),
+            "queryString": [{"name": name, "value": value}
+                            for name, value in parse_qsl(urlsplit(record["url"] or "").query)],
+            "headersSize": -1,
+            "bodySize": len(record["post_data"] or ""),
+        },
+        "response": {
+            "status": record["status"] or 0,
+            "statusText": record["status_text"],
+            "httpVersion": record["protocol"] or "",
+            "cookies": [],
+            "headers": _headers(record["response_headers"]),
+            "content": {"size": record["body_size"], "mimeType": record["mime_type"] or ""},
+            "redirectURL": _header(record["response_headers"], "Location"),
+            "headersSize": headers_size,
+            "bodySize": max(body_transfer, 0),
+            "_transferSize": record["transfer_size"],
+        },
+        "cache": {},
+        "timings": timings,
+        "_start": record["start"],
+    }
+    if record["post_data"]:
+        entry["request"]["postData"] = {
+            "mimeType": _header(record["request_headers"], "Content-Type"),
+            "text": record["post_data"],
+        }
+    if pageref:
+        entry["pageref"] = pageref
+    if record["remote_ip"]:
+        entry["serverIPAddress"] = record["remote_ip"].strip("[]")
+    return entry
+
+
+def _timings(record) -> dict:
+    """Map a CDP ResourceTiming (ms offsets from requestTime) to HAR timings."""
+    timings = {"blocked": -1, "dns": -1, "connect": -1, "ssl": -1, "send": 0, "wait": 0, "receive": 0}
+    timing = record["timing"]
+    if not timing:
+        return timings
+
+    def phase(start, end):
+        return timing[end] - timing[start] if timing.get(start, -1) >= 0 else -1
+
+    first_phase = next(
+        (timing[name] for name in ("dnsStart", "connectStart", "sendStart") if timing.get(name, -1) >= 0), 0
+    )
+    timings["blocked"] = max(first_phase, 0)
+    timings["dns"] = phase("dnsStart", "dnsEnd")
+    timings["connect"] = phase("connectStart", "connectEnd")
+    timings["ssl"] = phase("sslStart", "sslEnd")
+    timings["send"] = max(phase("sendStart", "sendEnd"), 0)
+    timings["wait"] = max(timing.get("receiveHeadersEnd", 0) - timing.get("sendEnd", 0), 0)
+    if record["end"] is not None:
+        elapsed = (record["end"] - timing["requestTime"]) * 1000
+        timings["receive"] = max(elapsed - timing.get("receiveHeadersEnd", 0), 0)
+    return timings
+
+
+def _page_timings(network_index, page_start):
+    """DOMContentLoaded and load of the page, relative to its document request."""
+    timings = {"onContentLoad": -1, "onLoad": -1}
+    keys = {"Page.domContentEventFired": "onContentLoad", "Page.loadEventFired": "onLoad"}
+    for event, timestamp in network_index.page_events:
+        if page_start is None or timestamp is None or timestamp < page_start:
+            continue
+        key = keys[event]
+        if timings[key] == -1:
+            timings[key] = (timestamp - page_start) * 1000
+    return timings
+
+
+def _headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def _header(headers, name):
+    """Value of a header, whatever its case (HTTP/1.1 'Location', HTTP/2 'location'), or ''."""
+    name = name.lower()
+    return next((str(value) for key, value in (headers or {}).items() if key.lower() == name), "")
+
+
+def _iso_time(wall_time):
+    if wall_time is None:
+        return ""
+    return datetime.fromtimestamp(wall_time, tz=timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _format_size(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} kB"
+    return f"{size} B"
@@ -0,0 +1,48 @@
+"""
+Helpers to keep logging out of the WebDriver hot paths.
+"""
+import logging
+
+# Page objects log one INFO record per action. QUIET drops them entirely
+# while warnings and errors (used by the report) are still emitted.
+QUIET = "QUIET"
+
+
+class LazyValue:
+    """
+    Log argument whose value is only computed when the record is formatted.
+    Used for values that cost a WebDriver round trip (current URL, page title).
+    """
+    __slots__ = ("_func", "_value", "_resolved")
+
+    def __init__(self, func):
+        self._func = func
+        self._value = None
+        self._resolved = False
+
+    def __str__(self):
+        if not self._resolved:
+            try:
+                self._value = self._func()
+            except Exception as e:
+                self._value = f"<unavailable: {e.__class__.__name__}>"
+            self._resolved = True
+        return str(self._value)
+
+
+def get_log_level(level_name: str) -> int:
+    """
+    Convert a level name from the configuration to a logging level.
+    Args:
+        level_name: standard level name (DEBUG, INFO, ...) or QUIET
+    Returns:
+        int: the logging level, INFO (with a warning) for an unknown name
+    """
+    level_name = level_name.upper()
+    if level_name == QUIET:
+        return logging.WARNING
+    level = logging.getLevelName(level_name)  # "Level <name>" for an unknown name
+    if not isinstance(level, int):
+        logging.getLogger(__name__).warning(f"Unknown log level = '{level_name}', using INFO")
+        return logging.INFO
+    return level
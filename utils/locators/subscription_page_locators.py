@@ -10,12 +10,8 @@ class SubscriptionPageLocators:
     DROPDOWN_ITEM_HISTORY= (By.XPATH, f"//*[@href='{Urls.COMPANY_HISTORY}']")
     DROPDOWN_ITEM_LOGOUT = (By.XPATH, f"//*[@href='{Urls.LOGOUT}']")
 
-    offer = {}
-    offer_name = {}
-    offer_button = {}
-
-    for i in range(1, 5):
-        base_xpath = f"//form[input[@name='abonnement_id' and @value='{i}']]"
-        offer[i] = (By.XPATH, base_xpath)
-        offer_name[i] = (By.XPATH, base_xpath + "//h4")
-        offer_button[i] = (By.XPATH, base_xpath + "//button")
\ No newline at end of file
+    # One form per subscription offer, whatever the number of offers
+    OFFER_FORMS = (By.XPATH, "//form[input[@name='abonnement_id']]")
+    OFFER_ID_INPUT = "input[name='abonnement_id']"  # CSS, relative to an offer form
+    OFFER_NAME = "h4"  # CSS, relative to an offer form
+    OFFER_BUTTON = "button"  # CSS, relative to an offer form
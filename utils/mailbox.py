@@ -0,0 +1,562 @@
+"""
+Session-wide mail backends, used to receive the password reset emails.
+
+Both backends resolve the futures returned by `expect` with the email sent to the recipient:
+    - "imap": watches the real test mailbox (ResetPasswordData.IMAP_*)
+    - "smtp": in-process SMTP sink the SUT (or a local stand-in) delivers to
+"""
+import datetime
+import email
+import imaplib
+import itertools
+import logging
+import re
+import select
+import socketserver
+import ssl
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from email.header import decode_header, make_header
+from email.utils import getaddresses, parseaddr
+from utils.config import (MAIL_BACKEND, MAIL_POLL_INTERVAL, MAIL_IDLE_RENEW_INTERVAL, MAIL_PROCESSED_FOLDER,
+                          MAIL_CLEANUP, SMTP_SINK_HOST, SMTP_SINK_PORT)
+from utils.users import ResetPasswordData
+
+logger = logging.getLogger(__name__)
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")  # IMAP dates
+CLEAN_UP_BATCH_SIZE = 500  # UIDs per command of the mailbox clean-up
+_IMAP_TOKEN = re.compile(rb'\(|\)|"(?:[^"\\]|\\.)*"|[^\s()"]+')
+
+
+def _envelope(message) -> tuple:
+    """Recipients (To addresses, lowercase) and decoded subject of an email."""
+    recipients = {address.lower() for _, address in getaddresses(message.get_all("To", []))}
+    return recipients, str(make_header(decode_header(message.get("Subject", ""))))
+
+
+def _quote(folder: str) -> str:
+    return '"' + folder.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _buffered(mail) -> bool:
+    """Whether imaplib's file object holds received data that select cannot see (never blocks)."""
+    timeout = mail.sock.gettimeout()
+    mail.sock.settimeout(0)
+    try:
+        return bool(mail.file.peek(1))  # Only reads the socket when the buffer is empty
+    except (BlockingIOError, ssl.SSLWantReadError):
+        return False
+    finally:
+        mail.sock.settimeout(timeout)
+
+
+def _parse_imap_list(data: bytes):
+    """Parse a parenthesized IMAP list (e.g. a BODYSTRUCTURE) into nested lists of strings (NIL is None)."""
+    stack = [[]]
+    for token in _IMAP_TOKEN.findall(data):
+        if token == b"(":
+            stack.append([])
+        elif token == b")":
+            inner = stack.pop()
+            stack[-1].append(inner)
+        elif token.startswith(b'"'):
+            stack[-1].append(re.sub(rb'\\(.)', rb"\1", token[1:-1]).decode(errors="replace"))
+        else:
+            stack[-1].append(None if token.upper() == b"NIL" else token.decode(errors="replace"))
+    return stack[0][0] if stack[0] else None
+
+
+def _find_text_part(structure, section: str = ""):
+    """
+    Text part of a BODYSTRUCTURE, text/plain preferred over text/html.
+    Returns:
+        (section, content type, charset, transfer encoding), or None if the email has no text part
+    """
+    if not isinstance(structure, list) or not structure:
+        return None
+    if isinstance(structure[0], list):  # Multipart: the parts come first, then the subtype
+        parts = itertools.takewhile(lambda part: isinstance(part, list), structure)
+        found = [
+            text_part for text_part in (
+                _find_text_part(part, f"{section}.{number}" if section else str(number))
+                for number, part in enumerate(parts, 1)
+            ) if text_part
+        ]
+        return next((text_part for text_part in found if text_part[1] == "text/plain"), found[0] if found else None)
+    content_type = f"{structure[0]}/{structure[1]}".lower()
+    if content_type not in ("text/plain", "text/html") or len(structure) < 6:
+        return None
+    params = structure[2] or []
+    charset = dict(zip((name.lower() for name in params[::2]), params[1::2])).get("charset") or "utf-8"
+    return section or "1", content_type, charset, structure[5] or "7bit"
+
+
+class MailBackend:
+    """
+    Waiters registered with `expect`, resolved by the backend as the emails arrive.
+    A waiter is (recipient, subject keyword, parse, future).
+    """
+    name = None
+
+    def __init__(self):
+        self._waiters = []  # Oldest first
+        self._error = None  # Fatal error (e.g. rejected login): every waiter fails with it
+        self._lock = threading.Lock()
+
+    def expect(self, recipient: str, subject_keyword: str = "", parse=None) -> Future:
+        """
+        Register a waiter for the next unseen email sent to the recipient.
+        Args:
+            recipient: address the email is sent to
+            subject_keyword: text the subject must contain
+            parse: function applied to the email.message.Message (on the backend thread),
+                   its result or exception resolves the future
+        Returns:
+            Future: resolved with the parsed message
+        """
+        future = Future()
+        with self._lock:
+            if self._error is not None:
+                future.set_exception(self._error)
+                return future
+            self._waiters.append((recipient.lower(), subject_keyword, parse, future))
+        self._waiter_added()
+        return future
+
+    def discard(self, future: Future):
+        """Stop waiting for a message (e.g. after a timeout)."""
+        with self._lock:
+            self._waiters = [waiter for waiter in self._waiters if waiter[3] is not future]
+        future.cancel()
+
+    def close(self):
+        self._fail_waiters(ConnectionError(f"Mail backend '{self.name}' closed"))
+
+    def _waiter_added(self):
+        """Hook called once a waiter is registered (outside the lock)."""
+
+    def _matching_waiter(self, recipients: set, subject: str):
+        """Oldest waiter expecting this email (the lock is held by the caller)."""
+        return next(
+            (waiter for waiter in self._waiters
+             if waiter[0] in recipients and waiter[1].lower() in subject.lower()),
+            None
+        )
+
+    @staticmethod
+    def _resolve(future, message, parse):
+        try:
+            try:
+                result = parse(message) if parse else message
+            except Exception as e:
+                future.set_exception(e)
+                return
+            future.set_result(result)
+        except InvalidStateError:
+            pass  # Discarded by the caller meanwhile
+
+    def _fail(self, error):
+        """Fail every current and future waiter."""
+        with self._lock:
+            self._error = error
+        self._fail_waiters(error)
+
+    def _fail_waiters(self, error):
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for _, _, _, future in waiters:
+            if not future.done():
+                future.set_exception(error)
+
+
+class MailboxWatcher(MailBackend):
+    """
+    Keeps a single IMAP connection open and resolves the waiters registered with `expect`.
+
+    New messages are detected with IDLE when the server supports it, by polling otherwise.
+    Each scan only reads the headers of the emails above the last UID scanned,
+    and only the text part of the dispatched emails is fetched.
+    All the IMAP traffic happens on the watcher thread: callers only get futures.
+    """
+    name = "imap"
+
+    def __init__(self, server: str, user: str, password: str, folder: str = "INBOX",
+                 poll_interval: float = MAIL_POLL_INTERVAL, idle_renew_interval: float = MAIL_IDLE_RENEW_INTERVAL,
+                 processed_folder: str = MAIL_PROCESSED_FOLDER, clean_up: bool = MAIL_CLEANUP):
+        """
+        Args:
+            server: IMAP server (SSL)
+            user, password: mailbox credentials
+            folder: folder where the emails are delivered
+            poll_interval: delay between two searches when the server does not support IDLE (seconds)
+            idle_renew_interval: IDLE is restarted (and the mailbox searched again) after this delay (seconds)
+            processed_folder: folder the dispatched emails are moved to on close (None: they are deleted)
+            clean_up: move or delete the dispatched emails on close
+        """
+        super().__init__()
+        self.server = server
+        self.user = user
+        self.password = password
+        self.folder = folder
+        self.poll_interval = poll_interval
+        self.idle_renew_interval = idle_renew_interval
+        self.uses_idle = None
+        self._mail = None
+        self.processed_folder = processed_folder
+        self.clean_up = clean_up
+        # Emails received before the watcher (minus a day for the server time zone) are ignored
+        since = datetime.date.today() - datetime.timedelta(days=1)
+        self._since = f"{since.day}-{MONTHS[since.month - 1]}-{since.year}"
+        self._uid_validity = None
+        self._last_uid = 0  # Highest UID scanned
+        self._unclaimed = {}  # UID of the scanned emails not dispatched yet -> (recipients, subject, header)
+        self._processed = []  # UIDs dispatched to a waiter, cleaned up when the watcher closes
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _waiter_added(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mailbox-watcher", daemon=True)
+                self._thread.start()
+        self._wakeup.set()  # Search right away, the email may already be there
+
+    def close(self):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.idle_renew_interval + 5)
+        super().close()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._connect()
+                while not self._stop.is_set():
+                    # Cleared before the scan: a waiter added during the scan still ends the next wait
+                    self._wakeup.clear()
+                    self._deliver_new_messages()
+                    self._wait_for_messages()
+                self._clean_up()
+            except (imaplib.IMAP4.abort, OSError) as e:
+                logger.warning(f"Mailbox connection lost, reconnecting | {str(e)}")
+                self._stop.wait(self.poll_interval)
+            except imaplib.IMAP4.error as e:
+                error_msg = f"IMAP server error: {str(e)}"
+                logger.error(error_msg)
+                self._fail(ConnectionError(error_msg))
+                return
+            finally:
+                self._disconnect()
+
+    def _connect(self):
+        self._mail = imaplib.IMAP4_SSL(self.server)
+        self._mail.login(self.user, self.password)
+        status, _ = self._mail.select(self.folder)
+        if status != "OK":
+            raise imaplib.IMAP4.error(f"Failed to select {self.folder}")
+        uid_validity = self._mail.response("UIDVALIDITY")[1][0]
+        if uid_validity != self._uid_validity:
+            # UIDs of the previous connection are meaningless: scan the folder again
+            self._uid_validity = uid_validity
+            self._last_uid = 0
+            self._unclaimed.clear()
+            self._processed.clear()
+        self.uses_idle = "IDLE" in self._mail.capabilities
+        logger.info(f"Connected to IMAP server, watching = '{self.folder}' ({'IDLE' if self.uses_idle else 'polling'})")
+
+    def _disconnect(self):
+        if self._mail is None:
+            return
+        try:
+            self._mail.logout()
+        except Exception:
+            pass
+        self._mail = None
+
+    def _deliver_new_messages(self):
+        """Dispatch the unclaimed emails to the waiters matching their recipient (latest email first)."""
+        with self._lock:
+            if not self._waiters:
+                return
+        self._scan_new_messages()
+        for uid in sorted(self._unclaimed, reverse=True):
+            recipients, subject, header = self._unclaimed[uid]
+            with self._lock:
+                waiter = self._matching_waiter(recipients, subject)
+                if waiter is None:
+                    continue
+                self._waiters.remove(waiter)
+            message = self._fetch_message(uid, header)
+            if message is None:
+                with self._lock:
+                    self._waiters.insert(0, waiter)
+                continue
+            del self._unclaimed[uid]
+            self._processed.append(uid)
+            self._resolve(waiter[3], message, waiter[2])
+
+    def _scan_new_messages(self):
+        """
+        Read the To and Subject headers of the unseen emails received since the last scan
+        (UIDs above the last one scanned), without marking them as seen.
+        """
+        status, data = self._mail.uid("SEARCH", None, f"UID {self._last_uid + 1}:* UNSEEN SINCE {self._since}")
+        if status != "OK":
+            return
+        # "n:*" always matches the latest email, even when its UID is below n
+        uids = [int(uid) for uid in data[0].split() if int(uid) > self._last_uid]
+        if not uids:
+            return
+        status, data = self._mail.uid("FETCH", ",".join(map(str, uids)), "(BODY.PEEK[HEADER.FIELDS (TO SUBJECT)])")
+        if status != "OK":
+            return
+        for item in data:
+            match = re.search(rb"UID (\d+)", item[0]) if isinstance(item, tuple) else None
+            if match:
+                header = email.message_from_bytes(item[1])
+                self._unclaimed[int(match.group(1))] = (*_envelope(header), item[1])
+        self._last_uid = max(uids)
+
+    def _fetch_message(self, uid: int, header: bytes):
+        """
+        Fetch the text part of an email (text/plain, else text/html) and mark it as seen.
+        Returns:
+            Single-part message with the scanned headers, or None if the fetch failed
+        """
+        part = None
+        status, data = self._mail.uid("FETCH", str(uid), "(BODYSTRUCTURE)")
+        # A literal in the structure comes as a tuple: fall back to the whole email
+        if status == "OK" and data and isinstance(data[0], bytes):
+            match = re.search(rb"BODYSTRUCTURE (\(.*\))\)\s*$", data[0])
+            part = _find_text_part(_parse_imap_list(match.group(1))) if match else None
+        if part is None:
+            status, data = self._mail.uid("FETCH", str(uid), "(RFC822)")
+            if status != "OK" or not data or not isinstance(data[0], tuple):
+                return None
+            return email.message_from_bytes(data[0][1])
+
+        section, content_type, charset, encoding = part
+        status, data = self._mail.uid("FETCH", str(uid), f"(BODY[{section}])")  # Marks the email as seen
+        if status != "OK" or not data or not isinstance(data[0], tuple):
+            return None
+        return email.message_from_bytes(
+            header.rstrip(b"\r\n") + b"\r\n"
+            + f'Content-Type: {content_type}; charset="{charset}"\r\n'.encode()
+            + f"Content-Transfer-Encoding: {encoding}\r\n\r\n".encode()
+            + data[0][1]
+        )
+
+    def _clean_up(self):
+        """Move the dispatched emails to processed_folder (or delete them) in bulk, so that the folder stays small."""
+        if not self.clean_up or not self._processed:
+            return
+        try:
+            if self.processed_folder:
+                self._mail.create(_quote(self.processed_folder))  # Fails harmlessly when it exists
+            flagged = False
+            for start in range(0, len(self._processed), CLEAN_UP_BATCH_SIZE):
+                uids = ",".join(map(str, self._processed[start:start + CLEAN_UP_BATCH_SIZE]))
+                if self.processed_folder and "MOVE" in self._mail.capabilities:
+                    self._mail.uid("MOVE", uids, _quote(self.processed_folder))
+                    continue
+                if self.processed_folder:
+                    self._mail.uid("COPY", uids, _quote(self.processed_folder))
+                self._mail.uid("STORE", uids, "+FLAGS.SILENT", "(\\Deleted)")
+                flagged = True
+                if "UIDPLUS" in self._mail.capabilities:
+                    self._mail.uid("EXPUNGE", uids)  # Only these emails
+            if flagged and "UIDPLUS" not in self._mail.capabilities:
+                self._mail.expunge()
+            logger.info(
+                f"Mailbox clean-up: {len(self._processed)} reset emails "
+                f"{'moved to = ' + repr(self.processed_folder) if self.processed_folder else 'deleted'}"
+            )
+            self._processed.clear()
+        except (imaplib.IMAP4.error, OSError) as e:
+            logger.warning(f"Mailbox clean-up failed | {str(e)}")
+
+    def _wait_for_messages(self):
+        """Block until the mailbox may have changed, a waiter was added, or the watcher stops."""
+        if self.uses_idle:
+            self._idle()
+        else:
+            self._wakeup.wait(self.poll_interval)
+            self._mail.noop()
+
+    def _idle(self):
+        """
+        IDLE (RFC 2177) until the server announces a new message.
+        imaplib has no IDLE command: the raw protocol is used on the connection.
+        """
+        mail = self._mail
+        tag = mail._new_tag()
+        mail.send(tag + b" IDLE\r\n")
+        if not mail.readline().startswith(b"+"):
+            self.uses_idle = False
+            self._read_until_tagged(tag)
+            return
+        deadline = time.monotonic() + self.idle_renew_interval
+        try:
+            while not self._wakeup.is_set() and time.monotonic() < deadline:
+                # Lines already read from the socket into imaplib's file object, or already decrypted
+                # by the SSL layer, are not reported by select: they are drained first
+                readable = (
+                    _buffered(mail) or getattr(mail.sock, "pending", lambda: 0)()
+                    or select.select([mail.sock], [], [], 1.0)[0]
+                )
+                if not readable:
+                    continue
+                line = mail.readline()
+                if not line:
+                    raise imaplib.IMAP4.abort("Connection closed during IDLE")
+                if line.rstrip().endswith((b"EXISTS", b"RECENT")):
+                    break
+        finally:
+            mail.send(b"DONE\r\n")
+            self._read_until_tagged(tag)
+
+    def _read_until_tagged(self, tag):
+        while True:
+            line = self._mail.readline()
+            if not line:
+                raise imaplib.IMAP4.abort("Connection closed during IDLE")
+            if line.startswith(tag):
+                return
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP session (RFC 5321 subset): every message is accepted and handed to the sink."""
+
+    def handle(self):
+        sink = self.server.sink
+        self._reply(f"220 {sink.host} test SMTP sink")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command[:4].upper()
+            if verb in ("HELO", "EHLO"):
+                self._reply(f"250 {sink.host}")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(parseaddr(command.split(":", 1)[-1])[1].lower())
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                sink.deliver(recipients, self._read_data())
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RSET":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "NOOP":
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _read_data(self) -> bytes:
+        lines = []
+        for line in self.rfile:
+            if line in (b".\r\n", b".\n"):
+                break
+            lines.append(line[1:] if line.startswith(b"..") else line)  # Dot-stuffing
+        return b"".join(lines)
+
+    def _reply(self, text):
+        self.wfile.write(f"{text}\r\n".encode())
+
+
+class SmtpSink(MailBackend):
+    """
+    In-process SMTP server: the emails delivered to it are handed to the waiters as soon as
+    the DATA command ends, without any mailbox round trip.
+    Emails no waiter expects yet are kept for the waiters registered later.
+    """
+    name = "smtp"
+
+    def __init__(self, host: str = SMTP_SINK_HOST, port: int = SMTP_SINK_PORT):
+        """
+        Args:
+            host, port: address the server listens on (port 0 picks a free port)
+        """
+        super().__init__()
+        self._inbox = []  # (recipients, subject, message) not dispatched yet, oldest first
+        self._server = socketserver.ThreadingTCPServer((host, port), _SmtpHandler)
+        self._server.daemon_threads = True
+        self._server.sink = self
+        self.host, self.port = self._server.server_address[:2]
+        threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True).start()
+        logger.info(f"SMTP sink listening on = '{self.host}:{self.port}'")
+
+    def deliver(self, recipients: list, data: bytes):
+        """Dispatch an email to the oldest waiter expecting it (called by the SMTP sessions)."""
+        message = email.message_from_bytes(data)
+        header_recipients, subject = _envelope(message)
+        recipients = set(recipients) | header_recipients
+        with self._lock:
+            waiter = self._matching_waiter(recipients, subject)
+            if waiter is None:
+                self._inbox.append((recipients, subject, message))
+                return
+            self._waiters.remove(waiter)
+        self._resolve(waiter[3], message, waiter[2])
+
+    def _waiter_added(self):
+        # The email may have been delivered before the waiter was registered (latest email first)
+        for recipients, subject, message in reversed(list(self._inbox)):
+            with self._lock:
+                waiter = self._matching_waiter(recipients, subject)
+                if waiter is None:
+                    continue
+                self._waiters.remove(waiter)
+                self._inbox.remove((recipients, subject, message))
+            self._resolve(waiter[3], message, waiter[2])
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        super().close()
+
+
+MAIL_BACKENDS = {
+    "imap": lambda: MailboxWatcher(
+        ResetPasswordData.IMAP_SERVER,
+        ResetPasswordData.IMAP_EMAIL,
+        ResetPasswordData.IMAP_PASSWORD,
+        ResetPasswordData.IMAP_FOLDER or "INBOX",
+    ),
+    "smtp": SmtpSink,
+}
+
+_shared_backend = None
+_shared_backend_lock = threading.Lock()
+
+
+def shared_mail_backend() -> MailBackend:
+    """Mail backend selected by MAIL_BACKEND, started on first use and shared by the session."""
+    global _shared_backend
+    with _shared_backend_lock:
+        if _shared_backend is None:
+            if MAIL_BACKEND not in MAIL_BACKENDS:
+                raise ValueError(f"Unknown MAIL_BACKEND = '{MAIL_BACKEND}' (expected one of {sorted(MAIL_BACKENDS)})")
+            _shared_backend = MAIL_BACKENDS[MAIL_BACKEND]()
+        return _shared_backend
+
+
+def close_shared_mail_backend():
+    global _shared_backend
+    with _shared_backend_lock:
+        if _shared_backend is not None:
+            _shared_backend.close()
+            _shared_backend = None
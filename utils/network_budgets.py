@@ -0,0 +1,92 @@
+"""
+Network performance budgets, declared per application URL.
+"""
+from utils.network_index import NetworkIndex, url_matches
+from utils.urls import Urls
+
+MB = 1024 * 1024
+
+
+class NetworkBudget:
+    """
+    Limits applied to the requests sent to one URL during a test.
+    Every limit is optional.
+    """
+
+    def __init__(self, max_requests: int = None, max_duration_ms: float = None, method: str = None,
+                 max_page_bytes: int = None):
+        """
+        Args:
+            max_requests: maximum number of requests to the URL
+            max_duration_ms: maximum duration of each request to the URL
+            method: restrict max_requests and max_duration_ms to this HTTP method
+            max_page_bytes: maximum bytes transferred by a single load of the page (subresources included)
+        """
+        self.max_requests = max_requests
+        self.max_duration_ms = max_duration_ms
+        self.method = method
+        self.max_page_bytes = max_page_bytes
+
+    def check(self, url: str, index: NetworkIndex) -> list:
+        """Return the violations of this budget for the URL."""
+        violations = []
+        requests = index.find(url=url, method=self.method)
+        method = f"{self.method} " if self.method else ""
+
+        if self.max_requests is not None and len(requests) > self.max_requests:
+            violations.append(
+                f"{len(requests)} {method}requests on '{url}' (budget = {self.max_requests})"
+            )
+
+        if self.max_duration_ms is not None:
+            for record in requests:
+                if record["duration_ms"] is not None and record["duration_ms"] > self.max_duration_ms:
+                    violations.append(
+                        f"{record['method']} '{record['url']}' took {record['duration_ms']:.0f} ms "
+                        f"(budget = {self.max_duration_ms} ms)"
+                    )
+
+        if self.max_page_bytes is not None:
+            # Each load is checked on its own: reloading or revisiting a page is not a violation
+            loads = index.page_load_sizes(url)
+            transferred = max(loads, default=0)
+            if transferred > self.max_page_bytes:
+                violations.append(
+                    f"Page '{url}' transferred {transferred / MB:.2f} MB in one load "
+                    f"(budget = {self.max_page_bytes / MB:.2f} MB, {len(loads)} load(s))"
+                )
+        return violations
+
+
+# Applied to every test, to the requests sent to the SUT only (third-party services are ignored)
+ALLOW_SERVER_ERRORS = False
+
+NETWORK_BUDGETS = {
+    Urls.LOGIN: NetworkBudget(method="POST", max_duration_ms=800, max_page_bytes=2 * MB),
+    Urls.CREATE_ACCOUNT: NetworkBudget(method="POST", max_requests=3, max_duration_ms=1500),
+    Urls.REGISTER_COMPANY: NetworkBudget(method="POST", max_requests=3, max_duration_ms=1500),
+    Urls.FORGOT_PASSWORD: NetworkBudget(max_page_bytes=2 * MB),
+    Urls.SUBSCRIPTION: NetworkBudget(max_page_bytes=2 * MB),
+    Urls.DASHBOARD: NetworkBudget(max_page_bytes=2 * MB),
+}
+
+
+def check_network_budgets(index: NetworkIndex, budgets: dict = None, base_url: str = Urls.BASE_URL) -> list:
+    """
+    Check the indexed traffic of a test against the budgets.
+    Args:
+        base_url: root URL of the SUT, only its 5xx responses are violations
+    Returns:
+        list: human-readable violations (empty if every budget is met)
+    """
+    budgets = NETWORK_BUDGETS if budgets is None else budgets
+    violations = []
+    if not ALLOW_SERVER_ERRORS:
+        violations.extend(
+            f"{record['method']} '{record['url']}' returned {record['status']}"
+            for record in index.server_errors()
+            if url_matches(record["url"], base_url.rstrip("/") + "/")
+        )
+    for url, budget in budgets.items():
+        violations.extend(budget.check(url, index))
+    return violations
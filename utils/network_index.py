@@ -0,0 +1,153 @@
+"""
+Per-test index of the network traffic recorded in the chromedriver performance log.
+"""
+import json
+
+
+class NetworkIndex:
+    """
+    Indexes Network.* events from the performance log into one record per request.
+
+    Each record is a dict with: url, method, document_url, loader_id, resource_type, status,
+    status_text, protocol, remote_ip, mime_type, request_headers, response_headers,
+    post_data, start, end (CDP monotonic seconds), wall_time (epoch seconds),
+    duration_ms, timing (CDP ResourceTiming), headers_size, body_size (decoded),
+    transfer_size (bytes) and failed.
+    A redirected request produces one record per hop.
+    """
+
+    def __init__(self):
+        self.log_entries = []  # Raw performance log entries, kept for the artifacts
+        self.records = []
+        self.page_events = []  # (event name, CDP monotonic seconds) of DOMContentLoaded / load
+        self._pending = {}  # requestId -> record waiting for its response/end
+
+    def collect(self, driver):
+        """
+        Read the new performance log entries of the driver and index them.
+        Reading the log empties chromedriver's buffer, so the index keeps every entry.
+        """
+        self.add_entries(driver.get_log("performance"))
+        return self
+
+    def add_entries(self, entries):
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"]).get("message", {})
+            except (KeyError, ValueError):
+                continue
+            self.log_entries.append(entry)
+            self._index_event(message.get("method", ""), message.get("params", {}))
+
+    def find(self, url: str = None, method: str = None, status: int = None, url_contains: str = None) -> list:
+        """
+        Query the recorded requests.
+        Args:
+            url: exact URL (query string ignored), a URL ending with '/' matches as a prefix
+            method: HTTP method
+            status: HTTP status code
+            url_contains: substring of the URL
+        """
+        return [
+            record for record in self.records
+            if (url is None or url_matches(record["url"], url))
+            and (method is None or record["method"] == method.upper())
+            and (status is None or record["status"] == status)
+            and (url_contains is None or url_contains in record["url"])
+        ]
+
+    def server_errors(self) -> list:
+        return [record for record in self.records if (record["status"] or 0) >= 500]
+
+    def page_load_sizes(self, page_url: str) -> list:
+        """
+        Bytes transferred by each load of page_url (document and subresources),
+        in load order: a reload or a new visit of the page is a separate load.
+        """
+        loads = {}
+        for record in self.records:
+            if record["document_url"] and url_matches(record["document_url"], page_url):
+                key = record["loader_id"] or record["document_url"]
+                loads[key] = loads.get(key, 0) + record["transfer_size"]
+        return list(loads.values())
+
+    def page_transfer_size(self, page_url: str) -> int:
+        """Bytes transferred by the largest single load of page_url (0 if never loaded)."""
+        return max(self.page_load_sizes(page_url), default=0)
+
+    def _index_event(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            redirect = params.get("redirectResponse")
+            if redirect and request_id in self._pending:
+                # Same requestId for every hop of a redirect chain: close the previous hop
+                previous = self._pending.pop(request_id)
+                self._set_response(previous, redirect)
+                self._finish(previous, params.get("timestamp"), redirect.get("encodedDataLength", 0))
+            request = params.get("request", {})
+            record = {
+                "url": request.get("url"),
+                "method": request.get("method"),
+                "document_url": params.get("documentURL"),
+                "loader_id": params.get("loaderId"),  # Same for a document and its subresources
+                "resource_type": params.get("type"),
+                "status": None,
+                "status_text": "",
+                "protocol": None,
+                "remote_ip": None,
+                "mime_type": None,
+                "request_headers": request.get("headers"),
+                "response_headers": None,
+                "post_data": request.get("postData", ""),
+                "start": params.get("timestamp"),
+                "wall_time": params.get("wallTime"),
+                "end": None,
+                "duration_ms": None,
+                "transfer_size": 0,
+                "headers_size": -1,
+                "body_size": 0,
+                "timing": None,
+                "failed": False,
+            }
+            self.records.append(record)
+            self._pending[request_id] = record
+        elif method == "Network.responseReceived" and request_id in self._pending:
+            self._set_response(self._pending[request_id], params.get("response", {}))
+        elif method == "Network.dataReceived" and request_id in self._pending:
+            self._pending[request_id]["body_size"] += params.get("dataLength", 0)
+        elif method == "Network.loadingFinished" and request_id in self._pending:
+            record = self._pending.pop(request_id)
+            self._finish(record, params.get("timestamp"), params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and request_id in self._pending:
+            record = self._pending.pop(request_id)
+            record["failed"] = True
+            self._finish(record, params.get("timestamp"), 0)
+        elif method in ("Page.domContentEventFired", "Page.loadEventFired"):
+            self.page_events.append((method, params.get("timestamp")))
+
+    @staticmethod
+    def _set_response(record, response):
+        record["status"] = response.get("status")
+        record["status_text"] = response.get("statusText", "")
+        record["protocol"] = response.get("protocol")
+        record["remote_ip"] = response.get("remoteIPAddress")
+        # Bytes received when the headers are complete
+        record["headers_size"] = int(response.get("encodedDataLength", -1))
+        record["mime_type"] = response.get("mimeType")
+        record["response_headers"] = response.get("headers")
+        record["timing"] = response.get("timing")
+
+    @staticmethod
+    def _finish(record, timestamp, transfer_size):
+        record["end"] = timestamp
+        record["transfer_size"] = int(transfer_size or 0)
+        if timestamp is not None and record["start"] is not None:
+            record["duration_ms"] = (timestamp - record["start"]) * 1000
+
+
+def url_matches(request_url: str, expected_url: str) -> bool:
+    """Compare URLs without query string; an expected URL ending with '/' is a prefix."""
+    request_url = (request_url or "").split("?", 1)[0].split("#", 1)[0]
+    if expected_url.endswith("/"):
+        return request_url.startswith(expected_url)
+    return request_url.rstrip("/") == expected_url.rstrip("/")
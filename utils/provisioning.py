@@ -0,0 +1,197 @@
+"""
+Creates test accounts with direct HTTP form posts instead of driving the UI.
+"""
+import logging
+import re
+import requests
+from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from utils.urls import Urls
+from utils.users import ValidUserData, ValidCompanyData
+
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by every provisioning session (each session keeps its own cookies)
+_SHARED_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+
+CSRF_INPUT_PATTERN = re.compile(r'<input[^>]*name=["\']_token["\'][^>]*value=["\']([^"\']+)["\']', re.IGNORECASE)
+CSRF_META_PATTERN = re.compile(r'<meta[^>]*name=["\']csrf-token["\'][^>]*content=["\']([^"\']+)["\']', re.IGNORECASE)
+FORM_PATTERN = re.compile(r'<form\b([^>]*)>(.*?)</form>', re.IGNORECASE | re.DOTALL)
+INPUT_PATTERN = re.compile(r'<input\b[^>]*>', re.IGNORECASE)
+OFFER_NAME_PATTERN = re.compile(r'<h4[^>]*>(.*?)</h4>', re.IGNORECASE | re.DOTALL)
+
+
+def _attribute(tag: str, name: str):
+    match = re.search(rf'\b{name}=["\']([^"\']*)["\']', tag, re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+class ProvisioningError(Exception):
+    """Raised when an account cannot be created over HTTP."""
+
+
+class AccountProvisioner:
+    """
+    Registers users and companies through the SUT forms over HTTP.
+
+    Each provisioner holds the cookie jar of one account: after `register_user`
+    the session is authenticated, and `to_browser` hands it over to a WebDriver.
+    """
+
+    def __init__(self, base_url: str = Urls.BASE_URL, timeout: float = 15):
+        """
+        Args:
+            base_url: SUT root URL, endpoints keep the paths defined in Urls
+            timeout: timeout of each HTTP request (seconds)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount("http://", _SHARED_ADAPTER)
+        self.session.mount("https://", _SHARED_ADAPTER)
+
+    def endpoint(self, url: str) -> str:
+        """Map a Urls entry onto the provisioner base URL."""
+        return self.base_url + url[len(Urls.BASE_URL):]
+
+    def register_user(self, user_data: dict = None) -> dict:
+        """
+        Register a user (the session stays logged in as this user).
+        Args:
+            user_data: lastname, firstname, email, password, password_confirmation
+                       (generated valid data by default)
+        Returns:
+            dict: the user data used
+        Raises:
+            ProvisioningError: If the SUT does not redirect to the company registration page
+        """
+        if user_data is None:
+            password = ValidUserData.VALID_PASSWORD
+            user_data = {
+                "lastname": ValidUserData.VALID_LASTNAME,
+                "firstname": ValidUserData.VALID_FIRSTNAME,
+                "email": ValidUserData.generate_valid_email(),
+                "password": password,
+                "password_confirmation": password
+            }
+        self._submit_form(Urls.CREATE_ACCOUNT, {
+            "nom": user_data["lastname"],
+            "prenom": user_data["firstname"],
+            "email": user_data["email"],
+            "password": user_data["password"],
+            "password_confirmation": user_data["password_confirmation"],
+        }, expected_url=Urls.REGISTER_COMPANY)
+        logger.info(f"User provisioned over HTTP = '{user_data['email']}'")
+        return user_data
+
+    def register_company(self, company_data: dict = None) -> dict:
+        """
+        Register a company for the logged-in user.
+        Args:
+            company_data: name, email, siret (generated valid data by default)
+        Returns:
+            dict: the company data used
+        Raises:
+            ProvisioningError: If the SUT does not redirect to the subscription page
+        """
+        if company_data is None:
+            company_data = {
+                "name": ValidCompanyData.VALID_NAME,
+                "email": ValidCompanyData.generate_valid_email(),
+                "siret": ValidCompanyData.VALID_SIRET
+            }
+        self._submit_form(Urls.REGISTER_COMPANY, {
+            "nom": company_data["name"],
+            "email": company_data["email"],
+            "siret": company_data["siret"],
+        }, expected_url=Urls.SUBSCRIPTION)
+        logger.info(f"Company provisioned over HTTP = '{company_data['email']}'")
+        return company_data
+
+    def subscribe(self, offer_name: str = "essai"):
+        """
+        Subscribe the company of the logged-in user to an offer of the subscription page.
+        Only free offers can be provisioned: the paid ones redirect to Stripe.
+        Raises:
+            ProvisioningError: If the offer is not on the page or the SUT does not redirect to the dashboard
+        """
+        url = self.endpoint(Urls.SUBSCRIPTION)
+        try:
+            page = self.session.get(url, timeout=self.timeout)
+            page.raise_for_status()
+        except requests.RequestException as e:
+            raise ProvisioningError(f"HTTP request to '{url}' failed | {str(e)}") from e
+
+        # Same forms as SubscriptionPageLocators.OFFER_FORMS: one per offer, named by its <h4>
+        for form_tag, content in FORM_PATTERN.findall(page.text):
+            name = OFFER_NAME_PATTERN.search(content)
+            fields = {
+                _attribute(tag, "name"): _attribute(tag, "value") or ""
+                for tag in INPUT_PATTERN.findall(content) if _attribute(tag, "name")
+            }
+            if "abonnement_id" in fields and name and re.sub(r"<[^>]+>", "", name.group(1)).strip().lower() == offer_name:
+                break
+        else:
+            raise ProvisioningError(f"Offer '{offer_name}' not found on the subscription page")
+
+        if "_token" not in fields:
+            fields["_token"] = self._extract_csrf_token(page.text)
+        action = urljoin(page.url, _attribute(form_tag, "action") or page.url)
+        self._post(action, fields, expected_url=Urls.DASHBOARD)
+        logger.info(f"Offer subscribed over HTTP = '{offer_name}'")
+
+    def to_browser(self, driver) -> int:
+        """
+        Copy the session cookies into the browser (no navigation needed).
+        Returns:
+            int: number of cookies transferred
+        """
+        for cookie in self.session.cookies:
+            driver.execute_cdp_cmd("Network.setCookie", {
+                "name": cookie.name,
+                "value": cookie.value,
+                "url": self.base_url,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+                # Attribute names keep the case of the Set-Cookie header ("HttpOnly", "httponly", ...)
+                "httpOnly": any(name.lower() == "httponly" for name in cookie._rest),
+            })
+        return len(self.session.cookies)
+
+    def close(self):
+        """
+        Forget the account session. The connections are left open: they belong to the adapter
+        shared by every provisioner (Session.close would close it under the other threads).
+        """
+        self.session.cookies.clear()
+
+    def _submit_form(self, form_url: str, fields: dict, expected_url: str):
+        """GET the form for its CSRF token, POST it and check where the SUT redirects."""
+        url = self.endpoint(form_url)
+        try:
+            page = self.session.get(url, timeout=self.timeout)
+            page.raise_for_status()
+        except requests.RequestException as e:
+            raise ProvisioningError(f"HTTP request to '{url}' failed | {str(e)}") from e
+        self._post(url, {"_token": self._extract_csrf_token(page.text), **fields}, expected_url)
+
+    def _post(self, url: str, fields: dict, expected_url: str):
+        """POST a form and check where the SUT redirects."""
+        try:
+            response = self.session.post(url, data=fields, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ProvisioningError(f"HTTP request to '{url}' failed | {str(e)}") from e
+
+        if response.url.rstrip("/") != self.endpoint(expected_url).rstrip("/"):
+            raise ProvisioningError(
+                f"Form '{url}' was rejected: expected redirection to '{self.endpoint(expected_url)}', "
+                f"got '{response.url}'"
+            )
+
+    @staticmethod
+    def _extract_csrf_token(html: str) -> str:
+        match = CSRF_INPUT_PATTERN.search(html) or CSRF_META_PATTERN.search(html)
+        if not match:
+            raise ProvisioningError("No CSRF token found in the form page")
+        return match.group(1)
@@ -0,0 +1,118 @@
+"""
+Timeline of the page object actions of a test: one timed step per BasePage action.
+"""
+import functools
+import html
+import math
+import time
+
+# Step categories and their timeline colors
+STEP_CATEGORIES = {
+    "navigation": "#3d6ee3",
+    "wait": "#f29e39",
+    "locate": "#1f9e89",
+    "action": "#37b24d",
+}
+
+
+class StepTimeline:
+    """
+    Steps recorded during the current test (reset before each test).
+    Each step is a dict: action, page, category, start and end (seconds since
+    the test started), commands (WebDriver commands sent) and failed.
+    Only the outermost action is recorded when actions call each other.
+    """
+    steps = []
+    origin = time.perf_counter()
+    _depth = 0
+
+    @classmethod
+    def reset(cls):
+        cls.steps = []
+        cls.origin = time.perf_counter()
+        cls._depth = 0
+
+
+def instrument_driver(driver):
+    """
+    Count the commands sent by the driver (elements send theirs through driver.execute).
+    A driver is only instrumented once, pooled drivers keep their counter.
+    """
+    if getattr(driver, "command_count", None) is not None:
+        return
+    execute = driver.execute
+    driver.command_count = 0
+
+    def counting_execute(driver_command, params=None):
+        driver.command_count += 1
+        return execute(driver_command, params)
+
+    driver.execute = counting_execute
+
+
+def timed_step(category: str):
+    """
+    Decorator recording a page object method as a step of the timeline.
+    Args:
+        category: navigation, wait, locate or action
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if StepTimeline._depth:
+                return method(self, *args, **kwargs)
+            StepTimeline._depth += 1
+            commands = getattr(self.driver, "command_count", 0)
+            start_time = time.perf_counter()
+            failed = True
+            try:
+                result = method(self, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                StepTimeline._depth -= 1
+                StepTimeline.steps.append({
+                    "action": method.__name__,
+                    "page": self.__class__.__name__,
+                    "category": category,
+                    "start": start_time - StepTimeline.origin,
+                    "end": time.perf_counter() - StepTimeline.origin,
+                    "commands": getattr(self.driver, "command_count", 0) - commands,
+                    "failed": failed,
+                })
+        return wrapper
+    return decorator
+
+
+def percentile(values, percent: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def slowest_steps(steps, limit: int = 3):
+    return sorted(steps, key=lambda step: step["end"] - step["start"], reverse=True)[:limit]
+
+
+def render_timeline(steps) -> str:
+    """Compact HTML timeline of the steps of one test."""
+    if not steps:
+        return ""
+    span = max(step["end"] for step in steps) or 1
+    bars = "".join(
+        f'<span title="{html.escape(step["page"])}.{step["action"]}: '
+        f'{(step["end"] - step["start"]) * 1000:.0f} ms, {step["commands"]} commands" '
+        f'style="position:absolute;top:0;height:8px;left:{step["start"] / span * 100:.2f}%;'
+        f'width:{max((step["end"] - step["start"]) / span * 100, 0.3):.2f}%;'
+        f'background:{"#e03131" if step["failed"] else STEP_CATEGORIES[step["category"]]}"></span>'
+        for step in steps
+    )
+    slowest = ", ".join(
+        f'{step["action"]} {(step["end"] - step["start"]):.2f}s/{step["commands"]} cmd'
+        for step in slowest_steps(steps)
+    )
+    return (
+        f'<div style="position:relative;height:8px;background:#f1f3f5;margin-top:4px">{bars}</div>'
+        f'<small>{len(steps)} steps in {span:.1f}s | slowest: {slowest}</small>'
+    )
@@ -0,0 +1,62 @@
+"""
+Test durations recorded across runs, used to dispatch the longest tests first with xdist.
+"""
+import json
+import os
+import statistics
+from filelock import FileLock
+
+DEFAULT_DURATION = 10.0  # Seconds predicted for a test when nothing is known about its module
+
+
+def load_durations(path: str) -> dict:
+    """Recorded durations: {nodeid: seconds}."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+
+
+def save_durations(path: str, measured: dict, smoothing: float):
+    """
+    Merge the durations measured by this run into the file
+    (exponential moving average, smoothing = weight of the new measure).
+    """
+    with FileLock(f"{path}.lock"):
+        durations = load_durations(path)
+        for nodeid, seconds in measured.items():
+            previous = durations.get(nodeid)
+            durations[nodeid] = seconds if previous is None else smoothing * seconds + (1 - smoothing) * previous
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+
+
+def predict_durations(nodeids, durations: dict) -> dict:
+    """
+    Predicted duration of each test. Unseen tests get the mean duration of the known
+    tests of their module, else the median of every known test, else DEFAULT_DURATION.
+    """
+    by_module = {}
+    for nodeid, seconds in durations.items():
+        by_module.setdefault(nodeid.split("::", 1)[0], []).append(seconds)
+    fallback = statistics.median(durations.values()) if durations else DEFAULT_DURATION
+
+    predicted = {}
+    for nodeid in nodeids:
+        if nodeid in durations:
+            predicted[nodeid] = durations[nodeid]
+        else:
+            module_durations = by_module.get(nodeid.split("::", 1)[0])
+            predicted[nodeid] = statistics.mean(module_durations) if module_durations else fallback
+    return predicted
+
+
+def lpt_makespan(durations, workers: int) -> float:
+    """Makespan of a longest-processing-time-first dispatch on the workers."""
+    loads = [0.0] * max(workers, 1)
+    for seconds in sorted(durations, reverse=True):
+        loads[loads.index(min(loads))] += seconds
+    return max(loads)
@@ -0,0 +1,122 @@
+"""
+Core Web Vitals (LCP, CLS, INP, FID, long tasks, TBT) of the pages visited by a test.
+
+A PerformanceObserver script is registered once per browser and runs at the start
+of every document. When a page is left, its metrics are saved to sessionStorage,
+so a single command at the end of the test collects every page of the test.
+"""
+from utils.step_timeline import percentile
+
+WEB_VITALS_SCRIPT = """
+(() => {
+    if (window.__webVitals || !location.protocol.startsWith('http')) return;
+    const vitals = window.__webVitals = {
+        url: location.href, time_origin: performance.timeOrigin,
+        lcp: null, cls: 0, fid: null, inp: null, long_tasks: 0, tbt: 0
+    };
+    const observe = (type, callback, options) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe(Object.assign({type: type, buffered: true}, options));
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', entry => { vitals.lcp = entry.startTime; });
+    // CLS: largest session window (shifts less than 1s apart, window capped at 5s)
+    let session = 0, sessionStart = 0, sessionLast = 0;
+    observe('layout-shift', entry => {
+        if (entry.hadRecentInput) return;
+        if (session && entry.startTime - sessionLast < 1000 && entry.startTime - sessionStart < 5000) {
+            session += entry.value;
+        } else {
+            session = entry.value;
+            sessionStart = entry.startTime;
+        }
+        sessionLast = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, session);
+    });
+    observe('first-input', entry => { vitals.fid = entry.processingStart - entry.startTime; });
+    // INP: slowest interaction (tests have too few interactions for the 98th percentile to differ)
+    observe('event', entry => {
+        if (entry.interactionId) vitals.inp = Math.max(vitals.inp || 0, entry.duration);
+    }, {durationThreshold: 16});
+    // TBT: blocking part (over 50 ms) of every long task of the page
+    observe('longtask', entry => {
+        vitals.long_tasks += 1;
+        vitals.tbt += Math.max(entry.duration - 50, 0);
+    });
+    addEventListener('pagehide', () => {
+        if (vitals.collected) return;
+        try {
+            const saved = JSON.parse(sessionStorage.getItem('__webVitals') || '[]');
+            saved.push(vitals);
+            sessionStorage.setItem('__webVitals', JSON.stringify(saved));
+        } catch (e) {}
+    });
+})();
+"""
+
+COLLECT_WEB_VITALS_SCRIPT = """
+let pages = [];
+try {
+    pages = JSON.parse(sessionStorage.getItem('__webVitals') || '[]');
+    sessionStorage.removeItem('__webVitals');
+} catch (e) {}
+if (window.__webVitals && !window.__webVitals.collected) {
+    pages.push(Object.assign({}, window.__webVitals));
+    window.__webVitals.collected = true;
+}
+return pages;
+"""
+
+METRICS = ("lcp", "cls", "inp", "fid", "long_tasks", "tbt")
+
+
+def install_web_vitals(driver):
+    """Run the observer script at the start of every document of the browser (Chrome only)."""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": WEB_VITALS_SCRIPT})
+
+
+def collect_web_vitals(driver, since: float = None) -> list:
+    """
+    Return the metrics of the pages visited since the last collection.
+    Args:
+        since: epoch seconds, pages loaded before are ignored (left over by a previous test)
+    """
+    pages = driver.execute_script(COLLECT_WEB_VITALS_SCRIPT) or []
+    if since is not None:
+        pages = [page for page in pages if page.get("time_origin", 0) / 1000 >= since]
+    return [
+        {"url": page["url"], **{metric: page.get(metric) for metric in METRICS}}
+        for page in pages
+    ]
+
+
+def worst_values(pages: list) -> dict:
+    """Worst value of each metric over the pages of a test (None if never measured)."""
+    worst = {}
+    for metric in METRICS:
+        values = [page[metric] for page in pages if page[metric] is not None]
+        worst[metric] = max(values) if values else None
+    return worst
+
+
+def p75(values: list):
+    """75th percentile (nearest rank), the Core Web Vitals reference percentile."""
+    values = [value for value in values if value is not None]
+    return percentile(values, 75) if values else None
+
+
+def format_vitals(vitals: dict) -> str:
+    """Compact text of the metrics: LCP 1.20s | CLS 0.010 | INP 80 ms | TBT 120 ms."""
+    parts = []
+    if vitals.get("lcp") is not None:
+        parts.append(f"LCP {vitals['lcp'] / 1000:.2f}s")
+    if vitals.get("cls") is not None:
+        parts.append(f"CLS {vitals['cls']:.3f}")
+    if vitals.get("inp") is not None:
+        parts.append(f"INP {vitals['inp']:.0f} ms")
+    elif vitals.get("fid") is not None:
+        parts.append(f"FID {vitals['fid']:.0f} ms")
+    if vitals.get("tbt") is not None:
+        parts.append(f"TBT {vitals['tbt']:.0f} ms")
+    return " | ".join(parts)